@@ -0,0 +1,66 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""Ethereum corpus deduplication benchmark
+
+Build a corpus of clones of the samples in examples/ (same code,
+other swarm hash and constructor arguments, as deployed token clones)
+then compare the time to build the CFG of every contract with
+analyze_corpus (one CFG per group of identical contracts).
+
+usage: PYTHONPATH=. python3 benchmarks/bench_corpus.py [CLONES_PER_SAMPLE [ANALYSIS]]
+"""
+
+import logging
+import os
+import sys
+import time
+
+from octopus.arch.evm.cfg import EvmCFG
+from octopus.core.utils import load_bytecode
+from octopus.platforms.ETH.corpus import analyze_corpus
+
+EXAMPLES_PATH = os.path.dirname(os.path.realpath(__file__)) + '/../examples/ETH/evm_bytecode/'
+
+SAMPLES = ['greeter.bytecode',
+           'reentrancy.bytecode',
+           'EtherLotto_a11e4ed59dc94e69612f3111942626ed513cb172.bytecode',
+           'Zeppelin_Hello_ethernaut0.bytecode',
+           'cryptokitties_genescience_f97e0a5b616dffc913e72455fde9ea8bbe946a2b.bytecode']
+
+SWARM_HASH = bytes.fromhex('a165627a7a72305820')
+
+
+def build_corpus(clones):
+    corpus = list()
+    for file_name in SAMPLES:
+        bytecode = bytes(load_bytecode(EXAMPLES_PATH + file_name))
+        position = bytecode.rfind(SWARM_HASH) + len(SWARM_HASH)
+        for number in range(clones):
+            clone = bytecode[:position] + os.urandom(32) + \
+                bytecode[position + 32:] + number.to_bytes(32, 'big')
+            corpus.append(('%s_%d' % (file_name[:10], number), clone))
+    return corpus
+
+
+def main():
+    logging.disable(logging.WARNING)
+    clones = int(sys.argv[1]) if len(sys.argv) > 1 else 20
+    analysis = sys.argv[2] if len(sys.argv) > 2 else 'dynamic'
+    corpus = build_corpus(clones)
+
+    start = time.perf_counter()
+    for _, bytecode in corpus:
+        EvmCFG(bytecode, analysis=analysis)
+    naive = time.perf_counter() - start
+
+    start = time.perf_counter()
+    groups = list(analyze_corpus(corpus, analysis=analysis))
+    dedup = time.perf_counter() - start
+
+    print('%d contracts, %d groups (%s analysis)' % (len(corpus), len(groups), analysis))
+    print('every contract: %.2fs' % naive)
+    print('analyze_corpus: %.2fs' % dedup)
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,80 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""Disassembler throughput benchmark
+
+Disassemble multi-megabyte EVM/NEO/BTC blobs built by repeating
+the samples in examples/ and print the number of instructions/second.
+EVM instructions are also classified (push/halt/branch/group) to
+measure the cost of the classification properties.
+
+usage: PYTHONPATH=. python3 benchmarks/bench_disassembler.py [SIZE_IN_MB ...]
+"""
+
+import os
+import sys
+import time
+
+from octopus.arch.evm.disassembler import EvmDisassembler
+from octopus.platforms.BTC.disassembler import BitcoinDisassembler
+from octopus.platforms.NEO.disassembler import NeoDisassembler
+
+EXAMPLES_PATH = os.path.dirname(os.path.realpath(__file__)) + '/../examples/'
+
+SAMPLES = [('EVM', EvmDisassembler,
+            'ETH/evm_bytecode/ab7c74abc0c4d48d1bdad5dcb26153fc8780f83e.bytecode'),
+           ('NEO', NeoDisassembler,
+            'NEO/samples/Parameter_Test_6580a9a2f55b32c054e9e7258614c30f55958c59.bytecode'),
+           ('BTC', BitcoinDisassembler,
+            'BTC/witness_script.hex')]
+
+
+def read_sample(file_name):
+    with open(EXAMPLES_PATH + file_name) as f:
+        return bytes.fromhex(''.join(l.strip() for l in f))
+
+
+def build_blob(sample, size):
+    """Repeat sample until the blob is at least size bytes"""
+    return sample * (size // len(sample) + 1)
+
+
+def bench(disasm_class, bytecode):
+    disasm = disasm_class()
+    start = time.perf_counter()
+    if disasm_class is EvmDisassembler:
+        # skip runtime/swarm hash detection, only measure the decoding loop
+        instructions = disasm.disassemble(bytecode, analysis=False)
+    else:
+        instructions = disasm.disassemble(bytecode)
+    elapsed = time.perf_counter() - start
+    return len(instructions), elapsed
+
+
+def bench_classify(instructions):
+    start = time.perf_counter()
+    for i in instructions:
+        i.is_push, i.is_halt, i.is_branch, i.is_terminator, i.group
+    return time.perf_counter() - start
+
+
+def main():
+    sizes = [float(s) for s in sys.argv[1:]] or [1, 4]
+
+    print('%-4s %8s %12s %10s %14s' % ('arch', 'size MB', 'instrs', 'time (s)', 'instrs/sec'))
+    for arch, disasm_class, file_name in SAMPLES:
+        sample = read_sample(file_name)
+        for size in sizes:
+            bytecode = build_blob(sample, int(size * 1024 * 1024))
+            count, elapsed = bench(disasm_class, bytecode)
+            print('%-4s %8.1f %12d %10.2f %14d' % (arch, len(bytecode) / (1024 * 1024),
+                                                  count, elapsed, count / elapsed))
+            if arch == 'EVM':
+                disasm = EvmDisassembler()
+                instructions = disasm.disassemble(bytecode, analysis=False)
+                elapsed = bench_classify(instructions)
+                print('%-4s %8s %12d %10.2f %14d' % ('', 'classify', count,
+                                                    elapsed, count / elapsed))
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,116 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""EVM function enumeration benchmark
+
+Build contracts with many functions, with a linear dispatcher
+(PUSH4/EQ/PUSH/JUMPI) and with a binary search dispatcher
+(PUSH4/GT/PUSH/JUMPI splits, emitted by newer solc),
+then compare enum_func_static with the previous implementation
+(instructions.index() and a linear search of the function entry).
+
+usage: PYTHONPATH=. python3 benchmarks/bench_enum_func.py [NUMBER_OF_FUNCTIONS ...]
+"""
+
+import logging
+import sys
+import time
+
+from octopus.arch.evm.cfg import enum_func_static
+from octopus.arch.evm.disassembler import EvmDisassembler
+from octopus.core.function import Function
+
+# function body: JUMPDEST PUSH1 0 DUP1 SSTORE STOP
+BODY = bytes.fromhex('5b6000805500')
+# selector extraction: PUSH1 0 CALLDATALOAD PUSH1 0xe0 SHR
+PROLOGUE = bytes.fromhex('60003560e01c')
+
+
+def push(value, size):
+    return bytes([0x5f + size]) + value.to_bytes(size, 'big')
+
+
+def selector(number):
+    return (number * 0x9e3779b1) & 0xffffffff
+
+
+def linear_dispatcher(selectors, targets):
+    code = b''
+    for sign, target in zip(selectors, targets):
+        # DUP1 PUSH4 sign EQ PUSH3 target JUMPI
+        code += b'\x80' + push(sign, 4) + b'\x14' + push(target, 3) + b'\x57'
+    return code
+
+
+def build_contract(number, binary_search=False):
+    """Return the bytecode of a contract with number functions"""
+    selectors = sorted(selector(i) for i in range(number))
+    # size of the dispatcher isn't known before the targets,
+    # all PUSH have a fixed size so compute it with dummy targets
+    split = 4 if binary_search else 1
+    chunks = [selectors[i::split] for i in range(split)]
+    chunks = [sorted(c) for c in chunks]
+    dummy = b''.join(linear_dispatcher(c, [0] * len(c)) for c in chunks)
+    # split: DUP1 PUSH4 pivot GT PUSH3 chunk JUMPI (+ JUMPDEST per chunk)
+    head_size = len(PROLOGUE) + (split - 1) * 12
+    start = head_size + len(dummy) + split + 1
+    body_offsets = [start + i * len(BODY) for i in range(number)]
+    targets = dict(zip(selectors, body_offsets))
+
+    chunks_code = [b'\x5b' + linear_dispatcher(c, [targets[s] for s in c])
+                   for c in chunks]
+    head = PROLOGUE
+    offset = head_size
+    for index, chunk in enumerate(chunks_code[1:]):
+        offset += len(chunks_code[index])
+        head += b'\x80' + push(chunks[index + 1][0], 4) + b'\x11' + \
+            push(offset, 3) + b'\x57'
+    code = head + b''.join(chunks_code) + b'\x00' + BODY * number
+    return code.hex()
+
+
+def legacy_enum_func_static(instructions):
+    functions = [Function(start_offset=0, start_instr=instructions[0],
+                          name='Dispatcher', prefered_name='Dispatcher')]
+    for inst in instructions:
+        try:
+            if inst.name == 'PUSH4':
+                index = instructions.index(inst)
+                push4, eq, push, jumpi = instructions[index:index + 4]
+                if eq.name == 'EQ' and push.name in ['PUSH1', 'PUSH2', 'PUSH3'] \
+                        and jumpi.name == 'JUMPI':
+                    xref = int.from_bytes(push.operand, byteorder='big')
+                    sign = int.from_bytes(push4.operand, byteorder='big')
+                    begin_function = next(filter(lambda i: i.offset == xref,
+                                                 instructions))
+                    functions.append(Function(xref, start_instr=begin_function,
+                                              name='func_%x' % sign))
+        except:
+            pass
+    return functions
+
+
+def bench(func, instructions):
+    start = time.perf_counter()
+    functions = func(instructions)
+    return len(functions) - 1, time.perf_counter() - start
+
+
+def main():
+    logging.disable(logging.WARNING)
+    numbers = [int(n) for n in sys.argv[1:]] or [100, 1000, 4000]
+
+    print('%-13s %8s %8s %10s %10s %10s' % ('dispatcher', 'funcs', 'instrs',
+                                           'legacy(s)', 'new(s)', 'found'))
+    for binary_search in (False, True):
+        for number in numbers:
+            bytecode = build_contract(number, binary_search)
+            instructions = EvmDisassembler().disassemble(bytecode, analysis=False)
+            _, legacy = bench(legacy_enum_func_static, instructions)
+            found, new = bench(enum_func_static, instructions)
+            print('%-13s %8d %8d %10.3f %10.4f %10d' % (
+                'binary search' if binary_search else 'linear',
+                number, len(instructions), legacy, new, found))
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,86 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""Memory footprint benchmark
+
+Recover the CFG of the EVM/NEO samples in examples/ and print
+the memory retained by the resulting instructions, basicblocks,
+functions and edges (measured with tracemalloc), along with the
+per-instance size of each core type.
+
+usage: PYTHONPATH=. python3 benchmarks/bench_memory.py
+"""
+
+import logging
+import os
+import sys
+import time
+import tracemalloc
+
+from octopus.arch.evm.cfg import EvmCFG
+from octopus.platforms.NEO.cfg import NeoCFG
+
+from octopus.core.basicblock import BasicBlock
+from octopus.core.edge import Edge
+from octopus.core.function import Function
+from octopus.core.instruction import Instruction
+
+EXAMPLES_PATH = os.path.dirname(os.path.realpath(__file__)) + '/../examples/'
+
+SAMPLES = [('EVM', EvmCFG,
+            'ETH/evm_bytecode/61EDCDf5bb737ADffE5043706e7C5bb1f1a56eEA.bytecode'),
+           ('EVM', EvmCFG,
+            'ETH/evm_bytecode/EtherLotto_a11e4ed59dc94e69612f3111942626ed513cb172.bytecode'),
+           ('NEO', NeoCFG,
+            'NEO/samples/Parameter_Test_6580a9a2f55b32c054e9e7258614c30f55958c59.bytecode'),
+           ('NEO', NeoCFG,
+            'NEO/samples/Lock.bytecode')]
+
+
+def read_sample(file_name):
+    with open(EXAMPLES_PATH + file_name) as f:
+        return ''.join(l.strip() for l in f)
+
+
+def instance_size(obj):
+    """Size of obj including its instance __dict__, if any"""
+    size = sys.getsizeof(obj)
+    if hasattr(obj, '__dict__'):
+        size += sys.getsizeof(obj.__dict__)
+    return size
+
+
+def bench(cfg_class, bytecode):
+    tracemalloc.start()
+    start = time.perf_counter()
+    cfg = cfg_class(bytecode)
+    elapsed = time.perf_counter() - start
+    current, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    return cfg, current, peak, elapsed
+
+
+def main():
+    # emulator warnings (loops, unresolved jumps) are not relevant here
+    logging.disable(logging.WARNING)
+
+    print('%-4s %-44s %8s %8s %6s %12s %12s %8s' % ('arch', 'sample', 'instrs', 'blocks',
+                                                   'edges', 'retained KB', 'peak KB',
+                                                   'time (s)'))
+    for arch, cfg_class, file_name in SAMPLES:
+        cfg, current, peak, elapsed = bench(cfg_class, read_sample(file_name))
+        print('%-4s %-44s %8d %8d %6d %12d %12d %8.2f' % (arch, os.path.basename(file_name)[:44],
+                                                       len(cfg.instructions),
+                                                       len(cfg.basicblocks),
+                                                       len(cfg.edges),
+                                                       current // 1024, peak // 1024,
+                                                       elapsed))
+
+    print()
+    print('per-instance size (bytes)')
+    for obj in (Instruction(0, 'STOP', 0, 0, 0, 0, ''),
+                BasicBlock(), Function(0), Edge('a', 'b')):
+        print('%-12s %6d' % (type(obj).__name__, instance_size(obj)))
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,71 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""Wasm CFG construction benchmark
+
+Build a module with many functions (each one made of nested
+block/loop) and compare the time to build its CFG in this process
+and with a pool of processes (WasmCFG workers).
+
+usage: PYTHONPATH=. python3 benchmarks/bench_wasm_cfg.py [NUMBER_OF_FUNCTIONS [WORKERS]]
+"""
+
+import logging
+import sys
+import time
+
+from octopus.arch.wasm.cfg import WasmCFG
+
+# block loop get_local 0 i32.eqz br_if 1 get_local 0 i32.const 1
+# i32.sub set_local 0 br 0 end end
+LOOP = bytes.fromhex('024003402000450d01200041016b21000c000b0b')
+
+
+def leb128(value):
+    out = bytearray()
+    while True:
+        byte = value & 0x7f
+        value >>= 7
+        if value:
+            out.append(byte | 0x80)
+        else:
+            out.append(byte)
+            return bytes(out)
+
+
+def section(section_id, payload):
+    return bytes([section_id]) + leb128(len(payload)) + payload
+
+
+def build_module(number, loops=20):
+    # one local i32, loops, end
+    body = b'\x01\x01\x7f' + LOOP * loops + b'\x0b'
+    types = section(1, b'\x01\x60\x00\x00')
+    functions = section(3, leb128(number) + b'\x00' * number)
+    codes = section(10, leb128(number) + (leb128(len(body)) + body) * number)
+    return b'\x00asm\x01\x00\x00\x00' + types + functions + codes
+
+
+def bench(module, workers):
+    start = time.perf_counter()
+    cfg = WasmCFG(module, workers=workers)
+    return cfg, time.perf_counter() - start
+
+
+def main():
+    logging.disable(logging.WARNING)
+    number = int(sys.argv[1]) if len(sys.argv) > 1 else 2000
+    workers = int(sys.argv[2]) if len(sys.argv) > 2 else 0
+
+    module = build_module(number)
+    cfg, elapsed = bench(module, None)
+    print('%d functions, %d basicblocks, %d edges' % (len(cfg.functions),
+                                                       len(cfg.basicblocks),
+                                                       len(cfg.edges)))
+    print('sequential %8.2fs' % elapsed)
+    cfg_pool, elapsed = bench(module, workers)
+    print('workers=%-3d %7.2fs' % (workers, elapsed))
+    assert [str(e) for e in cfg.edges] == [str(e) for e in cfg_pool.edges]
+
+
+if __name__ == '__main__':
+    main()
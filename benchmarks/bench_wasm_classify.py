@@ -0,0 +1,94 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""Wasm instruction classification benchmark
+
+Disassemble the functions of examples/wasm/samples and run the
+classification chain of WasmSSAEmulatorEngine.emulate_one_instruction
+(is_control, is_parametric, ... is_conversion) and the block
+classification used by the CFG, with the precomputed opcode
+descriptors and with the previous linear scan of _groups.
+
+usage: PYTHONPATH=. python3 benchmarks/bench_wasm_classify.py [ROUNDS]
+"""
+
+import glob
+import os
+import sys
+import time
+
+from octopus.arch.wasm.disassembler import WasmDisassembler
+from octopus.arch.wasm.wasm import _groups
+
+SAMPLES_PATH = os.path.dirname(os.path.realpath(__file__)) + '/../examples/wasm/samples/'
+
+# emulate_one_instruction dispatch order
+DISPATCH = ['Control', 'Parametric', 'Variable', 'Memory', 'Constant',
+            'Logical_i32', 'Logical_i64', 'Logical_f32', 'Logical_f64',
+            'Arithmetic_i32', 'Bitwise_i32', 'Arithmetic_i64', 'Bitwise_i64',
+            'Arithmetic_f32', 'Arithmetic_f64', 'Conversion']
+PROPERTIES = ['is_control', 'is_parametric', 'is_variable', 'is_memory',
+              'is_constant', 'is_logical_i32', 'is_logical_i64',
+              'is_logical_f32', 'is_logical_f64', 'is_arithmetic_i32',
+              'is_bitwise_i32', 'is_arithmetic_i64', 'is_bitwise_i64',
+              'is_arithmetic_f32', 'is_arithmetic_f64', 'is_conversion']
+
+
+def legacy_group(instr):
+    last_class = _groups.get(0)
+    for k, v in _groups.items():
+        if instr.opcode >= k:
+            last_class = v
+        else:
+            return last_class
+    return last_class
+
+
+def legacy_dispatch(instr):
+    # each is_* property computed the group again
+    for name in DISPATCH:
+        if legacy_group(instr) == name:
+            return name
+    return None
+
+
+def legacy_terminator(instr):
+    branch = instr.name in ['br_if', 'br_table', 'if'] or instr.name in ['br']
+    return branch or instr.name in ['unreachable', 'return']
+
+
+def dispatch(instr):
+    for name in PROPERTIES:
+        if getattr(instr, name):
+            return name
+    return None
+
+
+def bench(instructions, rounds, dispatch_func, terminator_func):
+    start = time.perf_counter()
+    for _ in range(rounds):
+        for instr in instructions:
+            dispatch_func(instr)
+            terminator_func(instr)
+    return time.perf_counter() - start
+
+
+def main():
+    rounds = int(sys.argv[1]) if len(sys.argv) > 1 else 20
+
+    instructions = list()
+    for file_name in sorted(glob.glob(SAMPLES_PATH + '*.wasm')):
+        with open(file_name, 'rb') as f:
+            for func in WasmDisassembler().extract_functions_code(f.read()):
+                instructions += func.instructions
+
+    count = len(instructions) * rounds
+    legacy = bench(instructions, rounds, legacy_dispatch, legacy_terminator)
+    new = bench(instructions, rounds, dispatch, lambda i: i.is_terminator)
+    print('%d instructions x %d rounds' % (len(instructions), rounds))
+    print('%-12s %10s %14s' % ('', 'time (s)', 'instrs/sec'))
+    print('%-12s %10.3f %14d' % ('linear scan', legacy, count / legacy))
+    print('%-12s %10.3f %14d' % ('descriptor', new, count / new))
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,61 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""Wasm module streaming benchmark
+
+Write a module with many functions to a file, then count the
+instructions of every function with extract_functions_code (all the
+functions in memory) and with iter_functions over a mmap of the file
+(one function at a time). Print the time and the peak of memory
+allocated by python (tracemalloc).
+
+usage: PYTHONPATH=. python3 benchmarks/bench_wasm_stream.py [NUMBER_OF_FUNCTIONS]
+"""
+
+import mmap
+import sys
+import tempfile
+import time
+import tracemalloc
+
+from bench_wasm_cfg import build_module
+
+from octopus.arch.wasm.disassembler import WasmDisassembler
+
+
+def count_list(module):
+    functions = WasmDisassembler().extract_functions_code(module)
+    return sum(len(f.instructions) for f in functions)
+
+
+def count_stream(module):
+    return sum(len(f.instructions) for _, f in
+               WasmDisassembler().iter_functions(module))
+
+
+def bench(func, module):
+    tracemalloc.start()
+    start = time.perf_counter()
+    count = func(module)
+    elapsed = time.perf_counter() - start
+    _, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    return count, elapsed, peak
+
+
+def main():
+    number = int(sys.argv[1]) if len(sys.argv) > 1 else 2000
+
+    with tempfile.TemporaryFile() as f:
+        f.write(build_module(number))
+        f.flush()
+        f.seek(0)
+        print('%-8s %10s %10s %12s' % ('mode', 'instrs', 'time (s)', 'peak (MB)'))
+        count, elapsed, peak = bench(count_list, f.read())
+        print('%-8s %10d %10.2f %12.1f' % ('list', count, elapsed, peak / 2**20))
+        module = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+        count, elapsed, peak = bench(count_stream, module)
+        print('%-8s %10d %10.2f %12.1f' % ('stream', count, elapsed, peak / 2**20))
+
+
+if __name__ == '__main__':
+    main()
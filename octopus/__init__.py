@@ -1 +1,3 @@
-name = "octopus"
\ No newline at end of file
+name = "octopus"
+# keep in sync with setup.py
+__version__ = "0.3.5"
@@ -0,0 +1,202 @@
+import copyreg
+import hashlib
+import inspect
+import io
+import mmap
+import os
+import pickle
+import tempfile
+import zlib
+
+from octopus import __version__
+from octopus.core.utils import bytecode_to_bytes
+
+from logging import getLogger
+logging = getLogger(__name__)
+
+
+# change it when the CFG classes change, old entries are then ignored
+# (entries of other octopus versions are ignored too)
+CACHE_VERSION = 1
+
+CACHE_PATH = os.path.join(os.environ.get('XDG_CACHE_HOME') or
+                          os.path.expanduser('~/.cache'), 'octopus')
+CACHE_MAX_SIZE = 256 * 1024 * 1024
+
+_CACHE_SUFFIX = '.cfg'
+
+# parameters changing how a CFG is computed, not the result
+_RUNTIME_PARAMETERS = frozenset(['analyzer', 'workers'])
+
+# memory-mapped bytecode (see load_bytecode) is stored as bytes
+_dispatch_table = copyreg.dispatch_table.copy()
+_dispatch_table[mmap.mmap] = lambda m: (bytes, (m[:],))
+
+
+class CFGCache(object):
+    """Content-addressed on-disk cache of CFG objects
+
+    Entries are keyed by a hash of the normalized bytecode (hex string,
+    "0x" prefixed or binary give the same key), the CFG class and the
+    analysis parameters (e.g. analysis='static'|'dynamic', max_steps).
+    They are stored pickled and compressed, one file per entry.
+    When the total size goes over max_size, the least recently used
+    entries (file modification time, updated on hit) are removed.
+
+    :Example:
+
+    >>> cache = CFGCache()
+    >>> cfg = cache.cfg(EvmCFG, bytecode, analysis='static')
+    """
+
+    def __init__(self, path=CACHE_PATH, max_size=CACHE_MAX_SIZE):
+        self.path = path
+        self.max_size = max_size
+        # total size of the entries, computed on the first put
+        self._size = None
+        os.makedirs(self.path, exist_ok=True)
+
+    def key(self, cfg_class, bytecode, **parameters):
+        """Return the key of the CFG of bytecode built by cfg_class(**parameters)
+
+        Default values of the parameters are part of the key, so
+        cfg_class(bytecode) and cfg_class(bytecode, analysis='dynamic')
+        share their entry.
+        """
+        params = _bind_parameters(cfg_class, bytecode, parameters)
+        params = sorted((k, v) for k, v in params.items()
+                        if k not in _RUNTIME_PARAMETERS)
+        bytecode = bytecode_to_bytes(bytecode)
+        if isinstance(bytecode, str):
+            bytecode = bytecode.encode('utf-8')
+        h = hashlib.sha256(bytecode)
+        h.update(repr((CACHE_VERSION, __version__, cfg_class.__module__,
+                       cfg_class.__qualname__, params)).encode('utf-8'))
+        return h.hexdigest()
+
+    def _entry_path(self, key):
+        return os.path.join(self.path, key + _CACHE_SUFFIX)
+
+    def _entries(self):
+        """Return the list of (mtime, size, path) of the entries"""
+        entries = list()
+        with os.scandir(self.path) as it:
+            for entry in it:
+                if entry.name.endswith(_CACHE_SUFFIX):
+                    try:
+                        stat = entry.stat()
+                    except OSError:
+                        continue
+                    entries.append((stat.st_mtime, stat.st_size, entry.path))
+        return entries
+
+    def get(self, key):
+        """Return the CFG stored with key, None if not cached"""
+        path = self._entry_path(key)
+        try:
+            with open(path, 'rb') as f:
+                data = f.read()
+        except OSError:
+            return None
+
+        try:
+            cfg = pickle.loads(zlib.decompress(data))
+        except Exception as e:
+            logging.warning('cache entry %s not loaded: %s', path, e)
+            self._remove(path)
+            return None
+        # least recently used entries are evicted first
+        try:
+            os.utime(path)
+        except OSError:
+            pass
+        return cfg
+
+    def put(self, key, cfg):
+        """Store cfg with key, evict old entries if needed
+
+        :return: True if cfg is stored
+        """
+        buffer = io.BytesIO()
+        pickler = pickle.Pickler(buffer, pickle.HIGHEST_PROTOCOL)
+        pickler.dispatch_table = _dispatch_table
+        try:
+            pickler.dump(cfg)
+        except (pickle.PicklingError, TypeError, AttributeError, RecursionError) as e:
+            logging.warning('%s not cached: %s', type(cfg).__name__, e)
+            return False
+        data = zlib.compress(buffer.getbuffer(), 1)
+
+        # write the entry atomically, other processes can share the cache
+        fd, tmp_path = tempfile.mkstemp(dir=self.path, suffix='.tmp')
+        try:
+            with os.fdopen(fd, 'wb') as f:
+                f.write(data)
+            os.replace(tmp_path, self._entry_path(key))
+        except OSError as e:
+            logging.warning('cache entry %s not written: %s', key, e)
+            self._remove(tmp_path)
+            return False
+
+        if self._size is None:
+            self._size = sum(size for _, size, _ in self._entries())
+        else:
+            self._size += len(data)
+        if self._size > self.max_size:
+            self.evict()
+        return True
+
+    def cfg(self, cfg_class, bytecode, **parameters):
+        """Return cfg_class(bytecode, **parameters), from the cache if possible"""
+        key = self.key(cfg_class, bytecode, **parameters)
+        cfg = self.get(key)
+        if cfg is None:
+            cfg = cfg_class(bytecode, **parameters)
+            self.put(key, cfg)
+        return cfg
+
+    def evict(self, max_size=None):
+        """Remove the least recently used entries until the size
+        of the cache is lower than max_size (default self.max_size)"""
+        max_size = self.max_size if max_size is None else max_size
+        entries = sorted(self._entries())
+        size = sum(size for _, size, _ in entries)
+        for _, entry_size, path in entries:
+            if size <= max_size:
+                break
+            if self._remove(path):
+                size -= entry_size
+        self._size = size
+
+    def clear(self):
+        """Remove all the entries"""
+        self.evict(0)
+
+    def __len__(self):
+        return len(self._entries())
+
+    def _remove(self, path):
+        try:
+            os.remove(path)
+        except OSError:
+            return False
+        return True
+
+
+def _bind_parameters(cfg_class, bytecode, parameters):
+    """Return the parameters of cfg_class(bytecode, **parameters)
+    with their default values, bytecode excluded"""
+    try:
+        signature = inspect.signature(cfg_class)
+    except (TypeError, ValueError):
+        # no signature (e.g. builtin), only the given parameters are known
+        return dict(parameters)
+    bound = signature.bind(bytecode, **parameters)
+    bound.apply_defaults()
+    params = dict()
+    for name, value in list(bound.arguments.items())[1:]:
+        if signature.parameters[name].kind is inspect.Parameter.VAR_KEYWORD:
+            params.update(value)
+        else:
+            params[name] = value
+    return params
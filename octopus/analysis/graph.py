@@ -1,14 +1,17 @@
+from collections import Counter
+
 from graphviz import Digraph
 
 from octopus.core.edge \
-    import (EDGE_UNCONDITIONAL,
+    import (EdgeSet, EDGE_UNCONDITIONAL,
             EDGE_CONDITIONAL_TRUE, EDGE_CONDITIONAL_FALSE,
             EDGE_FALLTHROUGH, EDGE_CALL)
 
 
 def insert_edges_to_graph(graph, edges, call=False):
     # remove duplicate edges
-    edges = list(set(edges))
+    if not isinstance(edges, EdgeSet):
+        edges = EdgeSet(edges)
 
     # create link between block
     for edge in edges:
@@ -95,9 +98,12 @@ class CallGraph(object):
 
             # check if multiple same edges
             # in that case, put the number into label
-            edges_counter = dict((x,self.edges.count(x)) for x in set(self.edges))
+            if isinstance(self.edges, EdgeSet):
+                edges_counter = self.edges.counts()
+            else:
+                edges_counter = Counter(self.edges).items()
             # insert edges on the graph
-            for edge, count in edges_counter.items():
+            for edge, count in edges_counter:
                 label = None
                 if count > 1:
                     label = str(count)
@@ -165,7 +171,7 @@ class CFGGraph(Graph):
         # only get corresponding edges
         if only_func_name:
             functions_block = [func.basicblocks for func in functions]
-            block_name = [b.name for block_l in functions_block for b in block_l]
+            block_name = set(b.name for block_l in functions_block for b in block_l)
             edges = [edge for edge in edges if (edge.node_from in block_name or edge.node_to in block_name)]
         # insert edges on the graph
         insert_edges_to_graph(g, edges, call)
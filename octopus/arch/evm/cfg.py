@@ -1,23 +1,60 @@
 from octopus.analysis.cfg import CFG
 from octopus.analysis.graph import CFGGraph
 from octopus.core.function import Function
-from octopus.core.basicblock import BasicBlock
+from octopus.core.basicblock import BasicBlock, BlockSummary
 
 from octopus.arch.evm.disassembler import EvmDisassembler
-
-import json
-import os
+from octopus.arch.evm.signatures import get_signature_database
+from octopus.core.utils import offset_to_index
+from octopus.engine.states import STATES_NONE
 
 from logging import getLogger
 logging = getLogger(__name__)
 
-
+# signatures file, relative to this directory
+# (see octopus.arch.evm.signatures.SIGNATURE_FILE_PATH for the absolute path)
 SIGNATURE_FILE_PATH = '/signatures.json'
 
 
-def enum_func_static(instructions):
+# selector comparisons of the dispatcher
+# EQ: jump to the function if the selector match
+# GT/LT: binary search dispatcher, jump to another part of the dispatcher
+_DISPATCH_EQ = ('EQ',)
+_DISPATCH_SPLIT = ('GT', 'LT')
+_DISPATCH_TARGET = ('PUSH1', 'PUSH2', 'PUSH3', 'PUSH4')
+
+
+def match_dispatch(instructions, index):
+    """Match a selector comparison at instructions[index] (a PUSH4)
+
+    PUSH4 selector, [DUPn,] EQ|GT|LT, PUSHn target, JUMPI
+
+    :return: (comparison name, selector, target offset) or None
+    """
+    window = instructions[index + 1:index + 5]
+    if window and window[0].name.startswith('DUP'):
+        window = window[1:]
+    if len(window) < 3:
+        return None
+    cmp, push, jumpi = window[0], window[1], window[2]
+    if jumpi.name != 'JUMPI' or push.name not in _DISPATCH_TARGET or \
+            cmp.name not in _DISPATCH_EQ + _DISPATCH_SPLIT:
+        return None
+    return (cmp.name,
+            int.from_bytes(instructions[index].operand, byteorder='big'),
+            int.from_bytes(push.operand, byteorder='big'))
+
+
+def enum_func_static(instructions, offset_index=None):
+    """Return the functions found in the dispatcher(s)
+
+    Instructions are scanned once, every PUSH4 is matched
+    against the selector comparison idioms (see match_dispatch)
+    """
 
     functions = list()
+    if offset_index is None:
+        offset_index = offset_to_index(instructions)
 
     # first function is *usually* the function dispatcher
     function = Function(start_offset=0,
@@ -27,42 +64,34 @@ def enum_func_static(instructions):
     functions.append(function)
 
     # parse the instructions and create Function object
-    for inst in instructions:
+    for index, inst in enumerate(instructions):
+        # PUSH4 are used to push the function signature on the stack
+        if inst.name != 'PUSH4':
+            continue
+        match = match_dispatch(instructions, index)
+        # binary search dispatcher split: not a function entry
+        if match is None or match[0] not in _DISPATCH_EQ:
+            continue
+        _, sign, xref = match
+
         try:
-            # PUSH4 are used to push the function signature on the stack
-            if inst.name == 'PUSH4':
-                index = instructions.index(inst)
-                list_inst = instructions[index:index + 4]
-                push4, eq, push, jumpi = list_inst[0], list_inst[1], list_inst[2], list_inst[3]
-
-                # check if this basicblock test function signature
-                if eq.name == 'EQ' and push.name in ['PUSH1', 'PUSH2'] and jumpi.name == 'JUMPI':
-                    xref = int.from_bytes(push.operand, byteorder='big')
-                    sign = int.from_bytes(push4.operand, byteorder='big')
-                    name = 'func_%x' % sign
-                    prefered_name = find_signature(sign)
-
-                    # find instr with offset == xref
-                    begin_function = next(filter(lambda i: i.offset == xref, instructions))
-                    # create new function
-                    function = Function(xref,
-                                        start_instr=begin_function,
-                                        name=name,
-                                        prefered_name=prefered_name)
-
-                    functions.append(function)
-        except:
-            logging.warning('enum_func_static Exception')
-            pass
+            begin_function = instructions[offset_index[xref]]
+        except KeyError:
+            logging.warning('enum_func_static: func_%x target 0x%x '
+                            'is not an instruction', sign, xref)
+            continue
+
+        # create new function
+        function = Function(xref,
+                            start_instr=begin_function,
+                            name='func_%x' % sign,
+                            prefered_name=find_signature(sign))
+        functions.append(function)
     return functions
 
 
 def find_signature(sign):
-    path = os.path.dirname(os.path.realpath(__file__)) + SIGNATURE_FILE_PATH
-    with open(path) as data_file:
-        data = json.load(data_file)
-
-    list_name = [name for name, hexa in data.items() if hexa == str(hex(sign))]
+    list_name = get_signature_database().lookup(sign)
 
     if len(list_name) > 1:
         logging.warning('function signatures collision: %s', list_name)
@@ -82,6 +111,7 @@ def enum_blocks_static(instructions):
 
     basicblocks = list()
     index = 0
+    last_index = len(instructions) - 1
 
     # create the first block
     new_block = False
@@ -113,17 +143,18 @@ def enum_blocks_static(instructions):
             new_block = True
 
         # just falls to the next instruction
-        elif inst != instructions[-1] and \
+        elif index != last_index and \
                 instructions[index + 1].name == 'JUMPDEST':
             new_block = True
 
         # last instruction of the entire bytecode
-        elif inst == instructions[-1]:
+        elif index == last_index:
             end_block = True
 
         if new_block or end_block:
             block.end_offset = inst.offset_end
             block.end_instr = inst
+            block.summary = block_summary(block)
             basicblocks.append(block)
             new_block = True
             end_block = False
@@ -132,6 +163,106 @@ def enum_blocks_static(instructions):
 
     return basicblocks
 
+# SSA effect of the instructions emulated by EvmEmulatorEngine
+# name -> (kind, number of values popped)
+# * assign: new SSA value pushed on the stack
+# * effect: SSA without assignment, nothing pushed
+_SSA_ASSIGN = 'assign'
+_SSA_EFFECT = 'effect'
+_ssa_effects = dict()
+for _names, _effect in (
+        (('ADD', 'SUB', 'MUL', 'DIV', 'MOD', 'SDIV', 'SMOD', 'EXP',
+          'SIGNEXTEND', 'LT', 'GT', 'SLT', 'SGT', 'EQ', 'AND', 'OR', 'XOR',
+          'BYTE', 'SHA3'), (_SSA_ASSIGN, 2)),
+        (('ADDMOD', 'MULMOD', 'CREATE'), (_SSA_ASSIGN, 3)),
+        (('ISZERO', 'NOT', 'BALANCE', 'CALLDATALOAD', 'EXTCODESIZE',
+          'BLOCKHASH', 'MLOAD', 'SLOAD'), (_SSA_ASSIGN, 1)),
+        (('ADDRESS', 'ORIGIN', 'CALLER', 'CALLVALUE', 'CALLDATASIZE',
+          'CODESIZE', 'RETURNDATASIZE', 'GASPRICE', 'COINBASE', 'TIMESTAMP',
+          'NUMBER', 'DIFFICULTY', 'GASLIMIT', 'PC', 'MSIZE', 'GAS'),
+         (_SSA_ASSIGN, 0)),
+        (('EXTCODECOPY',), (_SSA_ASSIGN, 4)),
+        (('DELEGATECALL', 'STATICCALL'), (_SSA_ASSIGN, 6)),
+        (('CALL', 'CALLCODE'), (_SSA_ASSIGN, 7)),
+        (('MSTORE', 'MSTORE8', 'SSTORE'), (_SSA_EFFECT, 2)),
+        (('CALLDATACOPY', 'CODECOPY', 'RETURNDATACOPY'), (_SSA_EFFECT, 3))):
+    for _name in _names:
+        _ssa_effects[_name] = _effect
+for _n in range(5):
+    _ssa_effects['LOG%d' % _n] = (_SSA_EFFECT, _n + 2)
+
+
+def block_summary(block):
+    """Return the BlockSummary of an EVM basicblock
+
+    The summary describes the block without its last instruction
+    (jump, halt, ...) which is emulated normally.
+    ops: (instr, kind, sources) for each instruction, kind being
+    'push', 'dup', 'swap', 'pop', 'jumpdest' or an _ssa_effects kind
+    """
+    # symbolic stack: sources of the values, top at the end
+    stack = list()
+    pops = 0
+    constants = list()
+    ops = list()
+
+    def need(depth):
+        # add entry stack values under the values known
+        nonlocal pops
+        while len(stack) < depth:
+            stack.insert(0, ('stack', pops))
+            pops += 1
+
+    def pop():
+        need(1)
+        return stack.pop()
+
+    for index, inst in enumerate(block.instructions[:-1]):
+        name = inst.name
+        if inst.is_push:
+            ops.append((inst, 'push', ()))
+            stack.append(('instr', index))
+            constants.append(inst.operand_interpretation)
+        elif name.startswith('DUP'):
+            need(inst.pops)
+            source = stack[-inst.pops]
+            ops.append((inst, 'dup', (source,)))
+            stack.append(source)
+        elif name.startswith('SWAP'):
+            position = inst.pops - 1
+            need(position + 1)
+            ops.append((inst, 'swap', (stack[-position - 1],)))
+            stack[-position - 1], stack[-1] = stack[-1], stack[-position - 1]
+        elif name == 'POP':
+            ops.append((inst, 'pop', (pop(),)))
+        elif name == 'JUMPDEST':
+            ops.append((inst, 'jumpdest', ()))
+        elif name in _ssa_effects:
+            kind, count = _ssa_effects[name]
+            ops.append((inst, kind, tuple(pop() for _ in range(count))))
+            if kind == _SSA_ASSIGN:
+                stack.append(('instr', index))
+        else:
+            # emulated instruction by instruction
+            ops = None
+            break
+
+    # source of the jump target (top of the stack)
+    jump_source = None
+    last = block.instructions[-1]
+    if ops is not None and (last.is_branch_unconditional or
+                            last.is_branch_conditional):
+        jump_source = stack[-1] if stack else ('stack', pops)
+        if jump_source[0] == 'instr':
+            instr = block.instructions[jump_source[1]]
+            if instr.is_push:
+                jump_source = ('constant', instr.operand_interpretation)
+
+    if ops is None:
+        return BlockSummary(constants=constants)
+    return BlockSummary(pops, stack, constants, jump_source, tuple(ops))
+
+
 '''
 def enum_calls(instructions):
     for inst in instructions:
@@ -144,13 +275,18 @@ def enum_calls(instructions):
 
 class EvmCFG(CFG):
 
-    def __init__(self, bytecode=None, analysis='dynamic'):
+    def __init__(self, bytecode=None, analysis='dynamic',
+                 states_policy=STATES_NONE, max_steps=None, max_paths=None):
         """ TODO """
 
         self.bytecode = bytecode
         self.disasm = EvmDisassembler(self.bytecode)
         self.instructions = self.disasm.disassemble()
         self.analysis = analysis
+        self.states_policy = states_policy
+        # dynamic analysis budget (see EvmEmulatorEngine)
+        self.max_steps = max_steps
+        self.max_paths = max_paths
 
         self.basicblocks = list()
         self.functions = list()
@@ -169,11 +305,17 @@ class EvmCFG(CFG):
 
         from octopus.platforms.ETH.emulator import EvmSSAEngine
 
-        emul = EvmSSAEngine(self.bytecode)
+        emul = EvmSSAEngine(self.bytecode, states_policy=self.states_policy,
+                            max_steps=self.max_steps,
+                            max_paths=self.max_paths)
         emul.emulate()
+        # exploration can be continued with emulator.resume()
+        # if suspended by max_steps/max_paths
+        self.emulator = emul
         self.functions = emul.functions
         self.basicblocks = emul.basicblocks
         self.edges = emul.edges
+        self.states = emul.states
 
     def visualize(self, simplify=False, ssa=False):
         """Visualize the cfg
@@ -1,11 +1,11 @@
-import io
 import logging
-import re
 
+from octopus.core.utils import bytecode_to_bytes
 from octopus.engine.disassembler import Disassembler
 
 from octopus.arch.evm.instruction import EvmInstruction
 from octopus.arch.evm.evm import EVM
+from octopus.arch.evm.metadata import find_metadata, find_runtime_code
 
 
 class EvmDisassembler(Disassembler):
@@ -14,44 +14,45 @@ class EvmDisassembler(Disassembler):
         Disassembler.__init__(self, asm=EVM(), bytecode=bytecode)
         self.loader_code = None
         self.swarm_hash = None
+        # decoded metadata e.g. {'bzzr0': b'...'}
+        self.metadata = None
         self.constructor_args = None
 
     def runtime_code_detector(self):
         '''Check for presence of runtime code
         '''
-        result = list(re.finditer('60.{2}604052', self.bytecode))
-        if len(result) > 1:
-            position = result[1].start()
+        position = find_runtime_code(self.bytecode)
+        if position != -1:
             logging.info("[+] Runtime code detected")
             self.loader_code = self.bytecode[:position]
             self.bytecode = self.bytecode[position:]
 
     def swarm_hash_detector(self):
-        '''Check for presence of Swarm hash at the end of bytecode
-            https://github.com/ethereum/wiki/wiki/Swarm-Hash
+        '''Check for presence of metadata (Swarm hash/IPFS) at the end of bytecode
+            https://solidity.readthedocs.io/en/latest/metadata.html
         '''
-        #swarm_hash_off = self.bytecode.find('a165627a7a72.*0029')
-        result = list(re.finditer('a165627a7a7230.*0029', self.bytecode))
-        # bzzr == 0x65627a7a72
-
-        if len(result) > 0:
-            swarm_hash_off = result[-1].start()
-            swarm_hash_end = result[-1].end()
-            if swarm_hash_off > 0:
-                logging.info("[+] Swarm hash detected in bytecode")
-                self.swarm_hash = self.bytecode[swarm_hash_off:swarm_hash_end]
-                logging.info("[+] Swarm hash value: 0x%s", self.swarm_hash)
-
-                # there is possibly constructor argument
-                # if there is swarm storage
-                if swarm_hash_end != len(self.bytecode):
-                    self.constructor_args = self.bytecode[swarm_hash_end:]
-                    logging.info("[+] Constructor arguments detected in bytecode")
-                    logging.info("[+] Constructor arguments removed from bytecode")
-                logging.info("[+] Swarm hash removed from bytecode")
-                self.bytecode = self.bytecode[:swarm_hash_off]
+        result = find_metadata(self.bytecode)
+
+        if result:
+            swarm_hash_off, swarm_hash_end, self.metadata = result
+            logging.info("[+] Swarm hash detected in bytecode")
+            self.swarm_hash = self.bytecode[swarm_hash_off:swarm_hash_end]
+            logging.info("[+] Swarm hash value: 0x%s", self.swarm_hash.hex())
+
+            # there is possibly constructor argument
+            # if there is swarm storage
+            if swarm_hash_end != len(self.bytecode):
+                self.constructor_args = self.bytecode[swarm_hash_end:]
+                logging.info("[+] Constructor arguments detected in bytecode")
+                logging.info("[+] Constructor arguments removed from bytecode")
+            logging.info("[+] Swarm hash removed from bytecode")
+            self.bytecode = self.bytecode[:swarm_hash_off]
 
     def analysis(self):
+        # detectors work on the binary bytecode
+        self.bytecode = bytecode_to_bytes(self.bytecode)
+        if isinstance(self.bytecode, memoryview):
+            self.bytecode = self.bytecode.tobytes()
         self.runtime_code_detector()
         self.swarm_hash_detector()
 
@@ -60,29 +61,31 @@ class EvmDisassembler(Disassembler):
         TODO
         """
 
-        wallet = io.BytesIO(bytecode)
-        opcode = int.from_bytes(wallet.read(1), byteorder='big')
+        bytecode_wnd = memoryview(bytecode)
+        descriptor = self.asm.decode_table[bytecode_wnd[0]]
+        opcode, name, operand_size, pops, pushes, gas, description = \
+            descriptor[:7]
 
-        # default value
-        invalid = ('INVALID', 0, 0, 0, 0, 'Unknown opcode')
-        name, operand_size, pops, pushes, gas, description = \
-            self.asm.table.get(opcode, invalid)
         instruction = EvmInstruction(opcode, name, operand_size, pops, pushes,
-                                     gas, description, offset=offset)
-        if instruction.has_operand:
-            instruction.operand = wallet.read(operand_size)
-            if instruction.is_push:
+                                     gas, description, offset=offset,
+                                     descriptor=descriptor)
+        if operand_size:
+            instruction.operand = bytecode_wnd[1:1 + operand_size].tobytes()
+            if descriptor.is_push:
                 # directly calculate the operand int representation
                 instruction.operand_interpretation = \
                     int.from_bytes(instruction.operand, byteorder='big')
 
         return instruction
 
+    def disassemble_opcode_size(self, bytecode, offset=0):
+        return self.asm.decode_table[bytecode[0]].operand_size + 1
+
     def disassemble(self, bytecode=None, offset=0, r_format='list',
                     analysis=True):
         '''
         creation code remove if analysis param is set to True (default)
-        r_format: ('list' | 'text' | 'reverse')
+        r_format: ('list' | 'text' | 'reverse' | 'stream')
         '''
 
         self.bytecode = bytecode if bytecode else self.bytecode
@@ -1,4 +1,4 @@
-from octopus.core.edge import Edge, EDGE_UNCONDITIONAL, EDGE_CONDITIONAL_TRUE, EDGE_CONDITIONAL_FALSE, EDGE_FALLTHROUGH, EDGE_CALL
+from octopus.core.edge import Edge, EdgeSet, EDGE_UNCONDITIONAL, EDGE_CONDITIONAL_TRUE, EDGE_CONDITIONAL_FALSE, EDGE_FALLTHROUGH, EDGE_CALL
 from octopus.engine.emulator import EmulatorEngine
 from octopus.core.ssa import SSA, SSA_TYPE_FUNCTION, SSA_TYPE_CONSTANT
 
@@ -9,6 +9,10 @@ from octopus.arch.evm.cfg import (enum_func_static,
 from octopus.arch.evm.disassembler import EvmDisassembler
 from octopus.arch.evm.ssa import EvmSSASimplifier
 
+from octopus.engine.engine import SharedStack
+from octopus.engine.states import (states_history, NoStatesHistory,
+                                   STATES_NONE, STATES_ALL)
+
 import copy
 
 from logging import getLogger
@@ -17,7 +21,8 @@ logging = getLogger(__name__)
 
 class EvmEmulatorEngine(EmulatorEngine):
 
-    def __init__(self, bytecode, ssa=True, symbolic_exec=False, max_depth=20):
+    def __init__(self, bytecode, ssa=True, symbolic_exec=False, max_depth=None,
+                 states_policy=STATES_ALL, max_steps=None, max_paths=None):
 
         self.ssa = ssa
         self.symbolic_exec = symbolic_exec
@@ -26,12 +31,17 @@ class EvmEmulatorEngine(EmulatorEngine):
         disasm = EvmDisassembler(bytecode)
         self.instructions = disasm.disassemble()
         self.reverse_instructions = {k: v for k, v in enumerate(self.instructions)}
-        self.functions = enum_func_static(self.instructions)
+        # instruction offset -> index, used to resolve jumps
+        self.offset_index = disasm.offset_index
+        self.functions = enum_func_static(self.instructions, self.offset_index)
         self.basicblocks = enum_blocks_static(self.instructions)
 
         self.simplify_ssa = EvmSSASimplifier()
 
         self.functions_start_instr = [f.start_instr for f in self.functions]
+        self.functions_per_offset = dict()
+        for f in self.functions:
+            self.functions_per_offset.setdefault(f.start_offset, f)
         self.current_function = self.functions[0]
         self.basicblock_per_instr = dict()
         self.current_basicblock = None
@@ -46,13 +56,32 @@ class EvmEmulatorEngine(EmulatorEngine):
 
         # connection between basicblocks
         # will be generate dynamically by the Emulator
-        self.edges = list()
+        self.edges = EdgeSet()
 
-        self.states = dict()
+        # states saved before each instruction (see octopus.engine.states)
+        self.states = states_history(states_policy)
         self.states_total = 0
-        self.max_depth = max_depth
         self.ssa_counter = 0
 
+        # paths waiting to be emulated: (state, depth, is_entry)
+        self.worklist = list()
+        # paths created by the last emulated instruction
+        self.new_paths = list()
+        # (pc, abstract stack) of the paths already emulated
+        self.paths_seen = set()
+        # exploration limits (None == no limit)
+        # max_depth: number of branches followed by a path
+        # max_steps/max_paths: instructions/paths emulated by emulate()
+        # or resume() before the exploration is suspended
+        self.max_depth = max_depth
+        self.max_steps = max_steps
+        self.max_paths = max_paths
+
+        # emulate whole basicblocks using their summary when
+        # intermediate states and symbolic values are not needed
+        self.block_step = not symbolic_exec and \
+            isinstance(self.states, NoStatesHistory)
+
         logging.info("=======================================")
         logging.info("#      EVM Emulator Engine")
         logging.info("#      class: %s", self.__class__.__name__)
@@ -60,10 +89,95 @@ class EvmEmulatorEngine(EmulatorEngine):
         for f in self.functions:
             logging.info("[+] Functions detected - %x: %s/%s", f.start_offset, f.prefered_name, f.name)
 
-    def emulate(self, state=EvmVMstate(), depth=0):
+    def emulate(self, state=None, depth=0):
+        """Emulate every path reachable from state
+
+        Paths are emulated one after the other (depth-first) from
+        self.worklist, return False if the exploration has been
+        suspended because max_steps or max_paths has been reached
+        (see resume), True otherwise.
+        """
+
+        # state is modified in place when no history is kept
+        if state is None:
+            state = EvmVMstate()
 
         #  create fake stack for tests
-        state.symbolic_stack = list(range(1000))
+        if not state.symbolic_stack:
+            state.symbolic_stack = SharedStack(range(1000))
+
+        self.worklist.append((state, depth, True))
+        return self.resume()
+
+    def resume(self, max_steps=None, max_paths=None):
+        """Continue a suspended exploration
+
+        max_steps/max_paths overwrite the engine limits for this call
+        """
+        if max_steps is None:
+            max_steps = self.max_steps
+        if max_paths is None:
+            max_paths = self.max_paths
+        steps = paths = 0
+
+        while self.worklist:
+            if (max_paths is not None and paths >= max_paths) or \
+                    (max_steps is not None and steps >= max_steps):
+                logging.info('[X] Exploration suspended - %d paths left',
+                             len(self.worklist))
+                return False
+
+            state, depth, is_entry = self.worklist.pop()
+            if is_entry:
+                # same entry point with an equivalent stack
+                # has already been explored
+                key = (state.pc, self.abstract_stack(state))
+                if key in self.paths_seen:
+                    continue
+                self.paths_seen.add(key)
+                paths += 1
+
+            steps_left = None if max_steps is None else max_steps - steps
+            steps += self.emulate_path(state, depth, is_entry, steps_left)
+
+            # depth-first: the first path created is the next emulated
+            self.worklist += reversed(self.new_paths)
+            self.new_paths = list()
+        return True
+
+    @property
+    def suspended(self):
+        return bool(self.worklist)
+
+    def abstract_stack(self, state):
+        """Stack of state with each value replaced by the offset
+        of the instruction that produced it
+
+        The resolved value (and height) of the expression are added
+        when it can be resolved, so two equal abstract stacks resolve
+        to the same jumps (see EvmSSASimplifier.resolve_instr_ssa)
+        """
+        stack = list()
+        for instr in state.ssa_stack:
+            value, height = self.simplify_ssa.resolve_ssa(instr)
+            if value is None:
+                stack.append(instr.offset)
+            else:
+                stack.append((instr.offset, value, height))
+        return tuple(stack)
+
+    def add_path(self, state, depth):
+        """Schedule the emulation of a new path starting at state"""
+        if self.max_depth is not None and depth > self.max_depth:
+            logging.info('[X] Max depth reached, skipping path 0x%x', state.pc)
+            return
+        self.new_paths.append((state, depth, True))
+
+    def emulate_path(self, state, depth, is_entry=True, max_steps=None):
+        """Emulate a single path until it halts or forks
+
+        return the number of instructions emulated
+        """
 
         # get current instruction
         instr = self.reverse_instructions[state.pc]
@@ -73,12 +187,12 @@ class EvmEmulatorEngine(EmulatorEngine):
         self.current_basicblock = self.basicblock_per_instr[instr.offset]
 
         # beginning of a function
-        if instr in self.functions_start_instr:
+        if is_entry and instr.offset in self.functions_per_offset:
 
             # cleaning duplicate block in previous function
             self.current_function.basicblocks = list(set(self.current_function.basicblocks))
             # retrive matching function
-            self.current_function = next(filter(lambda f: f.start_instr == instr, self.functions))
+            self.current_function = self.functions_per_offset[instr.offset]
             # self.ssa_counter = 0
             logging.info("[+] Entering function - %x: ",
                          self.current_function.start_offset,
@@ -92,16 +206,30 @@ class EvmEmulatorEngine(EmulatorEngine):
 
         # halt variable use to catch ending branch
         halt = False
+        steps = 0
         while not halt:
 
+            if max_steps is not None and steps >= max_steps:
+                # suspend this path, it will continue from here
+                self.worklist.append((state, depth, False))
+                return steps
+            steps += 1
+
             # get current instruction
             instr = self.reverse_instructions[state.pc]
 
+            if self.block_step:
+                steps_left = None if max_steps is None else max_steps - steps + 1
+                count = self.emulate_block(instr, state, steps_left)
+                if count:
+                    steps += count - 1
+                    continue
+
             # handle fall-thrown due to JUMPDEST
             if instr.name == 'JUMPDEST':
                 # doesn't match new block that start with JUMPDEST
                 if self.current_basicblock.start_offset != instr.offset:
-                    self.edges.append(Edge(self.current_basicblock.name, 'block_%x' % instr.offset, EDGE_FALLTHROUGH))
+                    self.edges.add(Edge(self.current_basicblock.name, 'block_%x' % instr.offset, EDGE_FALLTHROUGH))
 
             # get current basicblock
             self.current_basicblock = self.basicblock_per_instr[instr.offset]
@@ -113,8 +241,9 @@ class EvmEmulatorEngine(EmulatorEngine):
 
             # Save instruction and state
             state.instr = instr
-            self.states[self.states_total] = state
-            state = copy.deepcopy(state)
+            block_entry = (instr.offset == self.current_basicblock.start_offset)
+            if self.states.save(self.states_total, state, block_entry):
+                state = state.fork()
             self.states_total += 1
             state.pc += 1
 
@@ -124,9 +253,72 @@ class EvmEmulatorEngine(EmulatorEngine):
             #state.instructions_visited[instr.offset] = instr.offset
 
         logging.info("[X] Returning from basicblock %s", self.current_basicblock.name)
+        return steps
+
+    def emulate_block(self, instr, state, max_steps=None):
+        """Emulate the basicblock starting at instr using its summary
+
+        The last instruction of the block is not emulated.
+        return the number of instructions emulated (0 if the block
+        need to be emulated instruction by instruction)
+        """
+        block = self.basicblock_per_instr[instr.offset]
+        summary = block.summary
+        if instr.offset != block.start_offset or summary is None or \
+                not summary.ops or len(state.ssa_stack) < summary.pops or \
+                (max_steps is not None and max_steps < len(summary.ops)):
+            return 0
+
+        # handle fall-thrown due to JUMPDEST
+        if instr.name == 'JUMPDEST' and \
+                self.current_basicblock.start_offset != instr.offset:
+            self.edges.add(Edge(self.current_basicblock.name, 'block_%x' % instr.offset, EDGE_FALLTHROUGH))
+
+        self.current_basicblock = block
+        self.current_function.basicblocks.append(block)
+
+        stack = state.ssa_stack
+        entry = [stack.pop() for _ in range(summary.pops)]
+        values = [None] * len(summary.ops)
+
+        def value(source):
+            if source[0] == 'stack':
+                return entry[source[1]]
+            return values[source[1]]
+
+        for index, (instr, kind, sources) in enumerate(summary.ops):
+            if kind == 'push':
+                instr.ssa = SSA(self.ssa_counter, instr.name,
+                                instr.operand_interpretation,
+                                instr_type=SSA_TYPE_CONSTANT)
+                values[index] = copy.copy(instr)
+                self.ssa_counter += 1
+            elif kind == 'dup':
+                instr.ssa = SSA(new_assignement=self.ssa_counter, method_name=instr.name, args=[value(sources[0])])
+                self.ssa_counter += 1
+            elif kind == 'swap':
+                instr.ssa = SSA(method_name=instr.name, args=[value(sources[0])])
+            elif kind in ('pop', 'jumpdest'):
+                instr.ssa = SSA(method_name=instr.name)
+            elif kind == 'assign':
+                args = [value(source) for source in sources] or None
+                instr.ssa = SSA(new_assignement=self.ssa_counter, method_name=instr.name, args=args)
+                values[index] = copy.copy(instr)
+                self.ssa_counter += 1
+            else:
+                instr.ssa = SSA(method_name=instr.name, args=[value(source) for source in sources])
+
+            self.current_function.instructions.append(instr)
+            state.instructions_visited.append(instr.offset)
+
+        for source in summary.outputs:
+            stack.append(value(source))
 
-        # automatic remove duplicated edges
-        self.edges = list(set(self.edges))
+        count = len(summary.ops)
+        state.instr = instr
+        state.pc += count
+        self.states_total += count
+        return count
 
     def emulate_one_instruction(self, instr, state, depth):
 
@@ -169,12 +361,14 @@ class EvmEmulatorEngine(EmulatorEngine):
         #
         #  60s & 70s: Push Operations
         #
-        elif instr.name.startswith("PUSH"):
+        elif instr.is_push:
             #value = int.from_bytes(instr.operand, byteorder='big')
             instr.ssa = SSA(self.ssa_counter, instr.name,
                             instr.operand_interpretation,
                             instr_type=SSA_TYPE_CONSTANT)
-            state.ssa_stack.append(instr)
+            # instr.ssa is overwritten each time instr is emulated,
+            # states being shared, push a snapshot of instr
+            state.ssa_stack.append(copy.copy(instr))
             self.ssa_counter += 1
         #
         #  80s: Duplication Operations
@@ -240,7 +434,7 @@ class EvmEmulatorEngine(EmulatorEngine):
         # SSA emulation
         instr.ssa = SSA(self.ssa_counter,
                         instr.name, args=args)
-        state.ssa_stack.append(instr)
+        state.ssa_stack.append(copy.copy(instr))
         self.ssa_counter += 1
 
         # Symbolic Execution emulation
@@ -259,7 +453,7 @@ class EvmEmulatorEngine(EmulatorEngine):
         # SSA emulation
         instr.ssa = SSA(self.ssa_counter,
                         instr.name, args=args)
-        state.ssa_stack.append(instr)
+        state.ssa_stack.append(copy.copy(instr))
         self.ssa_counter += 1
 
         # Symbolic Execution emulation
@@ -273,7 +467,7 @@ class EvmEmulatorEngine(EmulatorEngine):
         # SSA STACK
         s0, s1 = state.ssa_stack.pop(), state.ssa_stack.pop()
         instr.ssa = SSA(self.ssa_counter, instr.name, args=[s0, s1])
-        state.ssa_stack.append(instr)
+        state.ssa_stack.append(copy.copy(instr))
         self.ssa_counter += 1
 
     def ssa_environmental_instruction(self, instr, state):
@@ -281,14 +475,14 @@ class EvmEmulatorEngine(EmulatorEngine):
         if instr.name in ['ADDRESS', 'ORIGIN', 'CALLER', 'CALLVALUE', 'CALLDATASIZE', 'CODESIZE', 'RETURNDATASIZE', 'GASPRICE']:
             # SSA STACK
             instr.ssa = SSA(new_assignement=self.ssa_counter, method_name=instr.name)
-            state.ssa_stack.append(instr)
+            state.ssa_stack.append(copy.copy(instr))
             self.ssa_counter += 1
 
         elif instr.name in ['BALANCE', 'CALLDATALOAD', 'EXTCODESIZE']:
             # SSA STACK
             s0 = state.ssa_stack.pop()
             instr.ssa = SSA(new_assignement=self.ssa_counter, method_name=instr.name, args=[s0])
-            state.ssa_stack.append(instr)
+            state.ssa_stack.append(copy.copy(instr))
             self.ssa_counter += 1
 
         elif instr.name in ['CALLDATACOPY', 'CODECOPY', 'RETURNDATACOPY']:
@@ -301,7 +495,7 @@ class EvmEmulatorEngine(EmulatorEngine):
             start, s2, size = state.ssa_stack.pop(), state.ssa_stack.pop(), state.ssa_stack.pop()
             # SSA STACK
             instr.ssa = SSA(new_assignement=self.ssa_counter, method_name=instr.name, args=[addr, start, s2, size])
-            state.ssa_stack.append(instr)
+            state.ssa_stack.append(copy.copy(instr))
             self.ssa_counter += 1
 
     def ssa_block_instruction(self, instr, state):
@@ -310,12 +504,12 @@ class EvmEmulatorEngine(EmulatorEngine):
             # SSA STACK
             blocknumber = state.ssa_stack.pop()
             instr.ssa = SSA(new_assignement=self.ssa_counter, method_name=instr.name, args=[blocknumber])
-            state.ssa_stack.append(instr)
+            state.ssa_stack.append(copy.copy(instr))
             self.ssa_counter += 1
 
         elif instr.name in ['COINBASE', 'TIMESTAMP', 'NUMBER', 'DIFFICULTY', 'GASLIMIT']:
             instr.ssa = SSA(new_assignement=self.ssa_counter, method_name=instr.name)
-            state.ssa_stack.append(instr)
+            state.ssa_stack.append(copy.copy(instr))
             self.ssa_counter += 1
 
     def ssa_stack_memory_storage_flow_instruction(self, instr, state, depth):
@@ -332,7 +526,7 @@ class EvmEmulatorEngine(EmulatorEngine):
             # SSA STACK
             s0 = state.ssa_stack.pop()
             instr.ssa = SSA(new_assignement=self.ssa_counter, method_name=instr.name, args=[s0])
-            state.ssa_stack.append(instr)
+            state.ssa_stack.append(copy.copy(instr))
             self.ssa_counter += 1
 
         elif op in ['MSTORE', 'MSTORE8', 'SSTORE']:
@@ -345,16 +539,12 @@ class EvmEmulatorEngine(EmulatorEngine):
             push_instr = state.ssa_stack.pop()
             instr.ssa = SSA(method_name=instr.name, args=[push_instr])
 
-            # get instruction with this value as offset
             if push_instr.ssa.is_constant:
                 #jump_addr = int.from_bytes(push_instr.operand, byteorder='big')
                 jump_addr = push_instr.operand_interpretation
-                # get instruction with this value as offset
-                target = next(filter(lambda element: element.offset == jump_addr, self.instructions))
             else:
                 # try to resolve the SSA repr
                 jump_addr = self.simplify_ssa.resolve_instr_ssa(push_instr)
-                target = next(filter(lambda element: element.offset == jump_addr, self.instructions))
                 if not jump_addr:
                     logging.warning('JUMP DYNAMIC')
                     logging.warning('[X] push_instr %x: %s ' % (push_instr.offset, push_instr.name))
@@ -363,6 +553,13 @@ class EvmEmulatorEngine(EmulatorEngine):
                     logging.warning('[X] push_instr.ssa %s' % list_args)
                     return True
 
+            # get instruction with this value as offset
+            target_index = self.offset_index.get(jump_addr)
+            if target_index is None:
+                logging.info('[X] Bad JUMP to 0x%x' % jump_addr)
+                return True
+            target = self.instructions[target_index]
+
             # depth of 1 - prevent looping
             #if (depth < self.max_depth):
             if target.name != "JUMPDEST":
@@ -371,45 +568,38 @@ class EvmEmulatorEngine(EmulatorEngine):
 
             if target.offset not in state.instructions_visited:
                 logging.info('[X] follow JUMP branch offset 0x%x' % target.offset)
-                new_state = copy.deepcopy(state)
-                new_state.pc = self.instructions.index(target)
+                new_state = state.fork()
+                new_state.pc = target_index
                 #state.pc = self.instructions.index(target)
 
                 # follow the JUMP
-                self.edges.append(Edge(self.current_basicblock.name, 'block_%x'%target.offset, EDGE_UNCONDITIONAL))
-                self.emulate(new_state, depth=depth + 1)
+                self.edges.add(Edge(self.current_basicblock.name, 'block_%x'%target.offset, EDGE_UNCONDITIONAL))
+                self.add_path(new_state, depth + 1)
 
                 halt = True
 
             else:
                 #logging.info('[X] Max depth reached, skipping JUMP 0x%x' % jump_addr)
-                self.edges.append(Edge(self.current_basicblock.name, 'block_%x'%target.offset, EDGE_UNCONDITIONAL))
+                self.edges.add(Edge(self.current_basicblock.name, 'block_%x'%target.offset, EDGE_UNCONDITIONAL))
                 logging.info('[X] Loop detected, skipping JUMP 0x%x' % jump_addr)
                 halt = True
 
-            self.current_basicblock = self.basicblock_per_instr[instr.offset]
-
         elif op == 'JUMPI':
             # SSA STACK
             push_instr, condition = state.ssa_stack.pop(), state.ssa_stack.pop()
             instr.ssa = SSA(method_name=instr.name, args=[push_instr, condition])
 
             logging.info('[X] follow JUMPI default branch offset 0x%x' % (instr.offset_end + 1))
-            new_state = copy.deepcopy(state)
-            self.edges.append(Edge(self.current_basicblock.name, 'block_%x'%(instr.offset_end + 1), EDGE_CONDITIONAL_FALSE))
-            self.emulate(new_state, depth=depth + 1)
-            self.current_basicblock = self.basicblock_per_instr[instr.offset]
+            new_state = state.fork()
+            self.edges.add(Edge(self.current_basicblock.name, 'block_%x'%(instr.offset_end + 1), EDGE_CONDITIONAL_FALSE))
+            self.add_path(new_state, depth + 1)
 
-            # get instruction with this value as offset
             if push_instr.ssa.is_constant:
                 #jump_addr = int.from_bytes(push_instr.operand, byteorder='big')
                 jump_addr = push_instr.operand_interpretation
-                # get instruction with this value as offset
-                target = next(filter(lambda element: element.offset == jump_addr, self.instructions))
             else:
                 # try to resolve the SSA repr
                 jump_addr = self.simplify_ssa.resolve_instr_ssa(push_instr)
-                target = next(filter(lambda element: element.offset == jump_addr, self.instructions))
                 if not jump_addr:
                     logging.warning('JUMP DYNAMIC')
                     logging.warning('[X] push_instr %x: %s ' % (push_instr.offset, push_instr.name))
@@ -418,6 +608,13 @@ class EvmEmulatorEngine(EmulatorEngine):
                     logging.warning('[X] push_instr.ssa %s' % list_args)
                     return True
 
+            # get instruction with this value as offset
+            target_index = self.offset_index.get(jump_addr)
+            if target_index is None:
+                logging.info('[X] Bad JUMP to 0x%x' % jump_addr)
+                return True
+            target = self.instructions[target_index]
+
             if target.name != "JUMPDEST":
                 logging.info('[X] Bad JUMP to 0x%x' % jump_addr)
                 return True
@@ -425,15 +622,15 @@ class EvmEmulatorEngine(EmulatorEngine):
             if target.offset not in state.instructions_visited:
                 # condition are True
                 logging.info('[X] follow JUMPI branch offset 0x%x' % (target.offset))
-                new_state = copy.deepcopy(state)
-                new_state.pc = self.instructions.index(target)
+                new_state = state.fork()
+                new_state.pc = target_index
 
                 # follow the JUMPI
-                self.edges.append(Edge(self.current_basicblock.name, 'block_%x'%target.offset, EDGE_CONDITIONAL_TRUE))
-                self.emulate(new_state, depth=depth + 1)
+                self.edges.add(Edge(self.current_basicblock.name, 'block_%x'%target.offset, EDGE_CONDITIONAL_TRUE))
+                self.add_path(new_state, depth + 1)
 
             else:
-                self.edges.append(Edge(self.current_basicblock.name, 'block_%x'%target.offset, EDGE_CONDITIONAL_TRUE))
+                self.edges.add(Edge(self.current_basicblock.name, 'block_%x'%target.offset, EDGE_CONDITIONAL_TRUE))
                 logging.warning('[X] Loop detected, skipping JUMPI 0x%x' % jump_addr)
                 logging.warning('[X] push_instr.ssa %s' % push_instr.ssa.format())
                 halt = True
@@ -442,7 +639,7 @@ class EvmEmulatorEngine(EmulatorEngine):
         elif op in ['PC', 'MSIZE', 'GAS']:
             # SSA STACK
             instr.ssa = SSA(new_assignement=self.ssa_counter, method_name=instr.name)
-            state.ssa_stack.append(instr)
+            state.ssa_stack.append(copy.copy(instr))
             self.ssa_counter += 1
 
         elif op == 'JUMPDEST':
@@ -458,7 +655,7 @@ class EvmEmulatorEngine(EmulatorEngine):
         if instr.name == 'CREATE':
             args = [state.ssa_stack.pop(), state.ssa_stack.pop(), state.ssa_stack.pop()]
             instr.ssa = SSA(new_assignement=self.ssa_counter, method_name=instr.name, args=args)
-            state.ssa_stack.append(instr)
+            state.ssa_stack.append(copy.copy(instr))
             self.ssa_counter += 1
 
         elif instr.name in ('CALL', 'CALLCODE', 'DELEGATECALL', 'STATICCALL'):
@@ -474,7 +671,7 @@ class EvmEmulatorEngine(EmulatorEngine):
                 args = [gas, to, meminstart, meminsz, memoutstart, memoutsz]
 
             instr.ssa = SSA(new_assignement=self.ssa_counter, method_name=instr.name, args=args)
-            state.ssa_stack.append(instr)
+            state.ssa_stack.append(copy.copy(instr))
             self.ssa_counter += 1
 
         elif instr.name in ['RETURN', 'REVERT']:
@@ -492,8 +689,12 @@ class EvmEmulatorEngine(EmulatorEngine):
 
 class EvmSSAEngine(EvmEmulatorEngine):
 
-    def __init__(self, bytecode=None, max_depth=20):
+    def __init__(self, bytecode=None, max_depth=None, states_policy=STATES_NONE,
+                 max_steps=None, max_paths=None):
         EvmEmulatorEngine.__init__(self, bytecode=bytecode,
                                         ssa=True,
                                         symbolic_exec=False,
-                                        max_depth=max_depth)
+                                        max_depth=max_depth,
+                                        states_policy=states_policy,
+                                        max_steps=max_steps,
+                                        max_paths=max_paths)
@@ -1,6 +1,8 @@
 # based on Manticore project: https://github.com/trailofbits/manticore
 # extract from http://gavwood.com/paper.pdf
 
+from collections import namedtuple
+
 _table = {
     # opcode:(mnemonic, immediate_operand_size, pops, pushes, gas, description)
     0x00: ('STOP', 0, 0, 0, 0, 'Halts execution.'),
@@ -142,11 +144,61 @@ _table = {
 }
 
 
+# Instruction classification as per the yellow paper (opcode >> 4)
+_groups = {0: 'Stop and Arithmetic Operations',
+           1: 'Comparison & Bitwise Logic Operations',
+           2: 'SHA3',
+           3: 'Environmental Information',
+           4: 'Block Information',
+           5: 'Stack, Memory, Storage and Flow Operations',
+           6: 'Push Operations',
+           7: 'Push Operations',
+           8: 'Duplication Operations',
+           9: 'Exchange Operations',
+           0xa: 'Logging Operations',
+           0xf: 'System operations'}
+
+_invalid = ('INVALID', 0, 0, 0, 0, 'Unknown opcode')
+
+# immutable opcode descriptor, classification flags are resolved
+# once when the decode table is built
+EvmOpcode = namedtuple('EvmOpcode', ['opcode', 'name', 'operand_size',
+                                     'pops', 'pushes', 'fee', 'description',
+                                     'group', 'is_push', 'is_halt', 'is_call',
+                                     'is_branch_conditional',
+                                     'is_branch_unconditional'])
+
+
+def _build_decode_table():
+    """Build the 256-entry table of EvmOpcode indexed by opcode"""
+    decode_table = list()
+    for opcode in range(256):
+        name, operand_size, pops, pushes, fee, description = \
+            _table.get(opcode, _invalid)
+        group = _groups.get(opcode >> 4, 'Invalid instruction')
+        decode_table.append(EvmOpcode(
+            opcode, name, operand_size, pops, pushes, fee, description,
+            group=group,
+            is_push=(group == 'Push Operations'),
+            is_halt=(name in ('RETURN', 'STOP', 'INVALID',
+                              'SELFDESTRUCT', 'REVERT')),
+            is_call=(name in ('CALL', 'CALLCODE',
+                              'DELEGATECALL', 'STATICCALL')),
+            is_branch_conditional=(name == 'JUMPI'),
+            is_branch_unconditional=(name == 'JUMP')))
+    return tuple(decode_table)
+
+
+# built once per process and shared by every EVM instance
+_decode_table = _build_decode_table()
+
+
 class EVM(object):
     """Bytecode for Ethereum VM."""
 
     def __init__(self):
         self.table = _table
+        self.decode_table = _decode_table
         self.reverse_table = self._get_reverse_table()
 
     def _get_reverse_table(self):
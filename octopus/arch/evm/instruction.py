@@ -1,4 +1,5 @@
 from octopus.core.instruction import Instruction
+from octopus.arch.evm.evm import _decode_table
 
 
 class EvmInstruction(Instruction):
@@ -8,33 +9,26 @@ class EvmInstruction(Instruction):
 
     """
 
+    __slots__ = ('descriptor',)
+
     def __init__(self, opcode, name,
                  operand_size, pops, pushes, fee,
                  description, operand=None,
-                 operand_interpretation=None, offset=0, xref=None):
+                 operand_interpretation=None, offset=0, xref=None,
+                 descriptor=None):
         """ TODO """
         super().__init__(opcode=opcode, name=name,
                          operand_size=operand_size, pops=pops, pushes=pushes,
                          fee=fee, description=description, operand=operand,
                          operand_interpretation=operand_interpretation,
                          offset=offset, xref=xref)
+        # precomputed EvmOpcode (see octopus.arch.evm.evm)
+        self.descriptor = descriptor or _decode_table[opcode]
 
     @property
     def group(self):
         '''Instruction classification as per the yellow paper'''
-        classes = {0: 'Stop and Arithmetic Operations',
-                   1: 'Comparison & Bitwise Logic Operations',
-                   2: 'SHA3',
-                   3: 'Environmental Information',
-                   4: 'Block Information',
-                   5: 'Stack, Memory, Storage and Flow Operations',
-                   6: 'Push Operations',
-                   7: 'Push Operations',
-                   8: 'Duplication Operations',
-                   9: 'Exchange Operations',
-                   0xa: 'Logging Operations',
-                   0xf: 'System operations'}
-        return classes.get(self.opcode >> 4, 'Invalid instruction')
+        return self.descriptor.group
 
     @property
     def is_terminator(self):
@@ -44,12 +38,12 @@ class EvmInstruction(Instruction):
     @property
     def is_branch_conditional(self):
         """ Return list if the instruction is a jump """
-        return self.semantics in ['JUMPI']
+        return self.descriptor.is_branch_conditional
 
     @property
     def is_branch_unconditional(self):
         """ Return list if the instruction is a jump """
-        return self.semantics in ['JUMP']
+        return self.descriptor.is_branch_unconditional
 
     @property
     def is_system(self):
@@ -89,7 +83,7 @@ class EvmInstruction(Instruction):
     @property
     def is_push(self):
         """ True if the instruction is a push Operations """
-        return self.group == 'Push Operations'
+        return self.descriptor.is_push
 
     @property
     def have_xref(self):
@@ -98,16 +92,14 @@ class EvmInstruction(Instruction):
 
     def set_xref(self, v):
         """ TODO """
-        self._xref = int.from_bytes(v, byteorder='big')
+        self.xref = int.from_bytes(v, byteorder='big')
 
     @property
     def is_call(self):
         """ Return list if the instruction is a basic block terminator """
-        return self.semantics in ('CALL', 'CALLCODE',
-                                  'DELEGATECALL', 'STATICCALL')
+        return self.descriptor.is_call
 
     @property
     def is_halt(self):
         """ Return list if the instruction is a basic block terminator """
-        return self.semantics in ('RETURN', 'STOP', 'INVALID',
-                                  'SELFDESTRUCT', 'REVERT')
+        return self.descriptor.is_halt
@@ -0,0 +1,165 @@
+"""Contract metadata appended by the compilers to the runtime code
+
+The metadata is a CBOR map followed by its length (2 bytes, big endian)
+e.g. solc 0.5.9: {'bzzr1': <32 bytes>, 'solc': <version>}
+a2 65 'bzzr1' 58 20 <32 bytes> 64 'solc' 43 <3 bytes> 00 32
+.. seealso:: https://solidity.readthedocs.io/en/latest/metadata.html
+"""
+
+import struct
+
+
+# CBOR encoding of the first key of the metadata map
+_METADATA_MARKERS = (b'\x65bzzr0', b'\x65bzzr1', b'\x64ipfs', b'\x65vyper')
+
+# keys of the metadata map, at least one is required
+_METADATA_KEYS = frozenset(['bzzr0', 'bzzr1', 'ipfs', 'solc', 'experimental', 'vyper'])
+
+# PUSH1 XX PUSH1 0x40 MSTORE - free memory pointer initialization
+_MSTORE_0x40 = b'\x60\x40\x52'
+
+_CBOR_SIMPLE_VALUES = {20: False, 21: True, 22: None}
+
+# maximum nesting of CBOR arrays and maps, the metadata map is flat
+CBOR_MAX_DEPTH = 4
+
+# CBOR major type of the maps
+_CBOR_MAP = 5
+
+
+def decode_cbor(data, offset=0, max_depth=CBOR_MAX_DEPTH):
+    """Decode the CBOR data item at offset
+
+    Only definite length items are supported (as emitted by the compilers),
+    nested at most max_depth times
+
+    :return: (value, offset of the next item)
+    :raise ValueError: malformed or unsupported item
+    """
+    try:
+        initial = data[offset]
+    except IndexError:
+        raise ValueError('truncated CBOR item at offset %d' % offset)
+    offset += 1
+    major, info = initial >> 5, initial & 0x1f
+
+    if info < 24:
+        argument = info
+    elif info < 28:
+        size = 1 << (info - 24)
+        if offset + size > len(data):
+            raise ValueError('truncated CBOR item at offset %d' % offset)
+        argument = int.from_bytes(data[offset:offset + size], 'big')
+        offset += size
+    else:
+        raise ValueError('unsupported CBOR additional info %d' % info)
+
+    # unsigned and negative integers
+    if major == 0:
+        return argument, offset
+    if major == 1:
+        return -1 - argument, offset
+    # byte and text strings
+    if major in (2, 3):
+        end = offset + argument
+        if end > len(data):
+            raise ValueError('truncated CBOR string at offset %d' % offset)
+        value = bytes(data[offset:end])
+        if major == 3:
+            try:
+                value = value.decode('utf-8')
+            except UnicodeDecodeError:
+                raise ValueError('invalid CBOR text at offset %d' % offset)
+        return value, end
+    if major in (4, _CBOR_MAP) and max_depth <= 0:
+        raise ValueError('CBOR item nested too deeply at offset %d' % offset)
+    # array
+    if major == 4:
+        value = list()
+        for _ in range(argument):
+            item, offset = decode_cbor(data, offset, max_depth - 1)
+            value.append(item)
+        return value, offset
+    # map
+    if major == _CBOR_MAP:
+        value = dict()
+        for _ in range(argument):
+            key, offset = decode_cbor(data, offset, max_depth - 1)
+            if isinstance(key, (list, dict)):
+                raise ValueError('unsupported CBOR map key')
+            value[key], offset = decode_cbor(data, offset, max_depth - 1)
+        return value, offset
+    # simple values
+    if major == 7 and argument in _CBOR_SIMPLE_VALUES and info < 24:
+        return _CBOR_SIMPLE_VALUES[argument], offset
+    raise ValueError('unsupported CBOR item 0x%x' % initial)
+
+
+def decode_metadata(code, offset):
+    """Decode the metadata starting at offset
+
+    :return: (metadata dict, end offset of the length) or None
+             if there is no valid metadata at offset
+    """
+    # the metadata is a map
+    if offset >= len(code) or code[offset] >> 5 != _CBOR_MAP:
+        return None
+    try:
+        metadata, end = decode_cbor(code, offset)
+    except ValueError:
+        return None
+    if not isinstance(metadata, dict) or end + 2 > len(code) or \
+            _METADATA_KEYS.isdisjoint(metadata):
+        return None
+    length, = struct.unpack_from('>H', code, end)
+    if length != end - offset:
+        return None
+    return metadata, end + 2
+
+
+def find_metadata(code):
+    """Return (start, end, metadata dict) of the metadata of code, or None
+
+    The metadata is at the end of the runtime code, the length is
+    read first so runtime code is handled in constant time.
+    Otherwise (creation code followed by constructor arguments) the
+    last valid metadata is searched.
+    """
+    if len(code) > 2:
+        length, = struct.unpack_from('>H', code, len(code) - 2)
+        start = len(code) - 2 - length
+        if start > 0:
+            result = decode_metadata(code, start)
+            if result is not None:
+                return start, result[1], result[0]
+
+    found = None
+    for marker in _METADATA_MARKERS:
+        position = code.rfind(marker)
+        while position > 1 and (found is None or position - 1 > found[0]):
+            result = decode_metadata(code, position - 1)
+            if result is not None:
+                found = (position - 1, result[1], result[0])
+                break
+            position = code.rfind(marker, 0, position)
+    return found
+
+
+def find_runtime_code(code):
+    """Return the offset of the runtime code in the creation code, or -1
+
+    The runtime code starts with the second initialization of
+    the free memory pointer (PUSH1 XX PUSH1 0x40 MSTORE),
+    the first one is in the creation code.
+    """
+    first = _find_mstore_0x40(code, 0)
+    if first == -1:
+        return -1
+    return _find_mstore_0x40(code, first + 5)
+
+
+def _find_mstore_0x40(code, start):
+    position = code.find(_MSTORE_0x40, start + 2)
+    while position != -1 and code[position - 2] != 0x60:
+        position = code.find(_MSTORE_0x40, position + 1)
+    return position - 2 if position != -1 else -1
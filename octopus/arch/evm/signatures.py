@@ -0,0 +1,177 @@
+import json
+import mmap
+import os
+import struct
+import threading
+
+from logging import getLogger
+logging = getLogger(__name__)
+
+
+SIGNATURE_FILE_PATH = os.path.dirname(os.path.realpath(__file__)) + '/signatures.json'
+
+# binary format:
+# header: magic, number of entries
+# entries: selector, offset and size of the names in the names area
+#          sorted by selector
+# names: utf-8 names, collisions are separated by '\n'
+_BINARY_MAGIC = b'OSIG'
+_BINARY_HEADER = struct.Struct('>4sI')
+_BINARY_ENTRY = struct.Struct('>III')
+
+
+class SignatureDatabase(object):
+    """Function signatures database (selector -> names)
+
+    Signatures are loaded on the first lookup, once,
+    in a dict indexed by the integer selector.
+    The file is a json file {name: selector in hex}.
+    A missing or invalid file gives an empty database.
+    """
+
+    def __init__(self, path=SIGNATURE_FILE_PATH):
+        self.path = path
+        self._index = None
+        self._lock = threading.Lock()
+
+    def _load(self):
+        index = dict()
+        try:
+            with open(self.path) as data_file:
+                data = json.load(data_file)
+        except (OSError, ValueError) as e:
+            logging.warning('signatures database %s not loaded: %s', self.path, e)
+            return index
+
+        for name, hexa in data.items():
+            index.setdefault(int(hexa, 16), []).append(name)
+        return index
+
+    @property
+    def index(self):
+        if self._index is None:
+            with self._lock:
+                if self._index is None:
+                    self._index = self._load()
+        return self._index
+
+    def lookup(self, sign):
+        """Return the list of names matching selector sign"""
+        return self.index.get(sign, [])
+
+    def __len__(self):
+        return len(self.index)
+
+    def __contains__(self, sign):
+        return sign in self.index
+
+
+class BinarySignatureDatabase(SignatureDatabase):
+    """Function signatures database stored in a sorted binary file
+
+    The file is memory-mapped and selectors are binary searched,
+    so only the pages needed by the lookups are read.
+    Use write_binary_signatures to convert a json database.
+    """
+
+    def __init__(self, path):
+        super().__init__(path)
+        self._count = 0
+
+    def _load(self):
+        try:
+            with open(self.path, 'rb') as f:
+                index = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+        except (OSError, ValueError) as e:
+            logging.warning('signatures database %s not loaded: %s', self.path, e)
+            return dict()
+
+        if len(index) < _BINARY_HEADER.size:
+            magic = None
+        else:
+            magic, self._count = _BINARY_HEADER.unpack_from(index)
+        if magic != _BINARY_MAGIC:
+            logging.warning('signatures database %s: bad magic', self.path)
+            self._count = 0
+        return index
+
+    def _entry(self, position):
+        return _BINARY_ENTRY.unpack_from(self.index, _BINARY_HEADER.size +
+                                         position * _BINARY_ENTRY.size)
+
+    def lookup(self, sign):
+        index = self.index
+        if not self._count:
+            return []
+        low, high = 0, self._count
+        while low < high:
+            middle = (low + high) // 2
+            selector, offset, size = self._entry(middle)
+            if selector < sign:
+                low = middle + 1
+            elif selector > sign:
+                high = middle
+            else:
+                return index[offset:offset + size].decode('utf-8').split('\n')
+        return []
+
+    def __len__(self):
+        # the number of entries is read from the header on load
+        return self._count if self.index is not None else 0
+
+    def __contains__(self, sign):
+        return bool(self.lookup(sign))
+
+
+def write_binary_signatures(signatures, path):
+    """Write signatures to path in the BinarySignatureDatabase format
+
+    :param signatures: dict selector (int) -> list of names
+                       e.g. SignatureDatabase(json_path).index
+    """
+    selectors = sorted(signatures)
+    offset = _BINARY_HEADER.size + len(selectors) * _BINARY_ENTRY.size
+    entries = list()
+    names = list()
+    for selector in selectors:
+        data = '\n'.join(signatures[selector]).encode('utf-8')
+        entries.append(_BINARY_ENTRY.pack(selector, offset, len(data)))
+        names.append(data)
+        offset += len(data)
+
+    with open(path, 'wb') as f:
+        f.write(_BINARY_HEADER.pack(_BINARY_MAGIC, len(selectors)))
+        f.writelines(entries)
+        f.writelines(names)
+
+
+_database = None
+_database_lock = threading.Lock()
+
+
+def get_signature_database():
+    """Return the process-wide signatures database"""
+    global _database
+    if _database is None:
+        with _database_lock:
+            if _database is None:
+                _database = SignatureDatabase()
+    return _database
+
+
+def set_signature_database(database):
+    """Replace the process-wide signatures database
+
+    :param database: a SignatureDatabase, BinarySignatureDatabase
+                     or a path to a json or binary file
+    """
+    global _database
+    if isinstance(database, str):
+        with open(database, 'rb') as f:
+            magic = f.read(len(_BINARY_MAGIC))
+        if magic == _BINARY_MAGIC:
+            database = BinarySignatureDatabase(database)
+        else:
+            database = SignatureDatabase(database)
+    with _database_lock:
+        _database = database
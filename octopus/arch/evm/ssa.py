@@ -1,16 +1,95 @@
-from octopus.engine.helper import helper as hlp
+from octopus.engine.helper import helper as hlp, TT256, TT256M1, TT255
 from z3 import UDiv, ULT, UGT
 
 from logging import getLogger
 logging = getLogger(__name__)
 
+# =======================================
+# #      Concrete 256 bits operations   #
+# =======================================
+
+def _signed(value):
+    return value if value < TT255 else value - TT256
+
+
+def _sdiv(s0, s1):
+    s0, s1 = _signed(s0), _signed(s1)
+    if s1 == 0:
+        return 0
+    sign = -1 if (s0 < 0) != (s1 < 0) else 1
+    return (sign * (abs(s0) // abs(s1))) & TT256M1
+
+
+def _smod(s0, s1):
+    s0, s1 = _signed(s0), _signed(s1)
+    if s1 == 0:
+        return 0
+    sign = -1 if s0 < 0 else 1
+    return (sign * (abs(s0) % abs(s1))) & TT256M1
+
+
+def _byte(index, value):
+    if index >= 32:
+        return 0
+    return (value >> (248 - index * 8)) & 0xff
+
+
+def _signextend(size, value):
+    if size >= 31:
+        return value
+    bits = size * 8 + 7
+    if value & (1 << bits):
+        return value | (TT256 - (1 << bits))
+    return value & ((1 << bits) - 1)
+
+
+# operations on python int (values are in [0, 2**256[)
+_concrete_operations = {
+    # arithmetic
+    'ADD': lambda s0, s1: (s0 + s1) & TT256M1,
+    'SUB': lambda s0, s1: (s0 - s1) & TT256M1,
+    'MUL': lambda s0, s1: (s0 * s1) & TT256M1,
+    'DIV': lambda s0, s1: s0 // s1 if s1 else 0,
+    'MOD': lambda s0, s1: s0 % s1 if s1 else 0,
+    'SDIV': _sdiv,
+    'SMOD': _smod,
+    'ADDMOD': lambda s0, s1, s2: (s0 + s1) % s2 if s2 else 0,
+    'MULMOD': lambda s0, s1, s2: (s0 * s1) % s2 if s2 else 0,
+    'EXP': lambda base, exponent: pow(base, exponent, TT256),
+    'SIGNEXTEND': _signextend,
+    # logic
+    'LT': lambda s0, s1: int(s0 < s1),
+    'GT': lambda s0, s1: int(s0 > s1),
+    'SLT': lambda s0, s1: int(_signed(s0) < _signed(s1)),
+    'SGT': lambda s0, s1: int(_signed(s0) > _signed(s1)),
+    'EQ': lambda s0, s1: int(s0 == s1),
+    'ISZERO': lambda s0: int(s0 == 0),
+    'AND': lambda s0, s1: s0 & s1,
+    'OR': lambda s0, s1: s0 | s1,
+    'XOR': lambda s0, s1: s0 ^ s1,
+    'NOT': lambda s0: s0 ^ TT256M1,
+    'BYTE': _byte,
+}
+
+
 # =======================================
 # #            SSA Simplifier           #
 # =======================================
 
 
+# maximum height of the expressions folded by resolve_instr_ssa,
+# bound the number of unrolled iterations of a loop with
+# a constant counter when paths are memoized on resolved values
+MAX_RESOLVE_DEPTH = 8
+
+# unresolved value
+_UNKNOWN = (None, 1)
+
+
 class EvmSSASimplifier(object):
     def __init__(self):
+        # ssa.new_assignement -> (value or None, expression height)
+        self.memo = dict()
         self._dispatch_function = {
             # arithmetic
             'ADD': self.symbolic_add,
@@ -44,28 +123,69 @@ class EvmSSASimplifier(object):
         return False
 
     def resolve_instr_ssa(self, instr):
-        # SSA_TYPE_CONSTANT
-        if instr.ssa.is_constant and instr.operand_interpretation:
-            return instr.operand_interpretation
-        # SSA_TYPE_FUNCTION
-        elif instr.ssa.is_function:
-            # args are all constants (most commun case)
-            if self.is_all_constant(instr.ssa.args):
-                values = [i.operand_interpretation for i in instr.ssa.args]
-                result = self.symbolic_dispatcher(instr.name, values)
-                # logging.warning('.. %x', result)
-                return result
-            else:
-                # TODO: recursive resolve_instr_ir
-                logging.warning('args not all constant')
-                return None
+        """Return the concrete value of instr SSA expression
 
-        else:
-            raise Exception('SSA_TYPE Unknown')
-        return None
+        The expression tree is folded down to the constants,
+        None is returned if a leaf isn't a constant (CALLDATALOAD, ...)
+        or the expression is higher than MAX_RESOLVE_DEPTH.
+        Values are memoized by SSA assignement so shared
+        subexpressions are evaluated once.
+        """
+        return self.resolve_ssa(instr)[0]
+
+    def resolve_ssa(self, instr):
+        """Return (value or None, height) of instr SSA expression"""
+        # instr doesn't produce a value
+        if instr.ssa.new_assignement is None:
+            return _UNKNOWN
+
+        memo = self.memo
+        todo = [instr]
+        while todo:
+            node = todo[-1]
+            key = node.ssa.new_assignement
+            if key in memo:
+                todo.pop()
+                continue
+
+            args = node.ssa.args if node.ssa.is_function and node.ssa.args else ()
+            missing = [arg for arg in args
+                       if arg.ssa.new_assignement is not None and
+                       arg.ssa.new_assignement not in memo]
+            if missing:
+                todo += missing
+                continue
+            todo.pop()
+            memo[key] = self._fold(node, [memo.get(arg.ssa.new_assignement, _UNKNOWN)
+                                          for arg in args])
+        return memo[instr.ssa.new_assignement]
+
+    def _fold(self, instr, args):
+        if instr.ssa.is_constant:
+            return (instr.operand_interpretation, 1)
+
+        height = 1 + max((h for _, h in args), default=0)
+        if height > MAX_RESOLVE_DEPTH:
+            return (None, height)
+
+        values = [v for v, _ in args]
+        operation = _concrete_operations.get(instr.ssa.method_name)
+        if operation is None or not values:
+            return (None, height)
+        if None in values:
+            # x & 0, x * 0
+            if instr.ssa.method_name in ('AND', 'MUL') and 0 in values:
+                return (0, height)
+            return (None, height)
+        return (operation(*values), height)
 
     def symbolic_dispatcher(self, mnemonic, values):
 
+        # all values are concrete: compute with python int
+        operation = _concrete_operations.get(mnemonic)
+        if operation and all(type(v) == int and 0 <= v < TT256 for v in values):
+            return operation(*values)
+
         fn = self._dispatch_function.get(mnemonic, None)
         return fn(*values)
 
@@ -1,30 +1,79 @@
-from octopus.engine.engine import VMstate
+from octopus.engine.engine import VMstate, SharedStack
 
 
 class EvmVMstate(VMstate):
 
     def __init__(self, gas=1000000):
-        self.storage = {}
-        self.memory = []
+        # storage & memory are shared between forked states
+        # and copied on first access (see fork)
+        self._storage = {}
+        self._memory = []
+        self._shared = set()
 
-        self.stack = []
-        self.ssa_stack = []
-        self.symbolic_stack = []
+        self.stack = SharedStack()
+        self.ssa_stack = SharedStack()
+        self.symbolic_stack = SharedStack()
 
         self.last_returned = []
         self.gas = gas
         self.pc = 0
         self.instr = None
 
-        self.instructions_visited = list()
+        self.instructions_visited = SharedStack()
+
+    @property
+    def storage(self):
+        if '_storage' in self._shared:
+            self._storage = dict(self._storage)
+            self._shared.discard('_storage')
+        return self._storage
+
+    @storage.setter
+    def storage(self, value):
+        self._storage = value
+        self._shared.discard('_storage')
+
+    @property
+    def memory(self):
+        if '_memory' in self._shared:
+            self._memory = list(self._memory)
+            self._shared.discard('_memory')
+        return self._memory
+
+    @memory.setter
+    def memory(self, value):
+        self._memory = value
+        self._shared.discard('_memory')
+
+    def fork(self):
+        """Return a copy of this state in O(1)
+
+        stacks share their cells with the original state,
+        storage & memory are copied only when one of
+        the two states access them.
+        """
+        new = EvmVMstate.__new__(EvmVMstate)
+        new.__dict__.update(self.__dict__)
+
+        self._shared = {'_storage', '_memory'}
+        new._shared = {'_storage', '_memory'}
+
+        new.stack = self.stack.copy()
+        new.ssa_stack = self.ssa_stack.copy()
+        new.symbolic_stack = self.symbolic_stack.copy()
+        new.instructions_visited = self.instructions_visited.copy()
+        new.last_returned = list(self.last_returned)
+        return new
+
+    __copy__ = fork
 
     def details(self):
 
         return {'storage': self.storage,
                 'memory': self.memory,
-                'stack': self.stack,
-                'ssa_stack': self.ssa_stack,
-                'symbolic_stack': self.symbolic_stack,
+                'stack': list(self.stack),
+                'ssa_stack': list(self.ssa_stack),
+                'symbolic_stack': list(self.symbolic_stack),
                 'last_returned': self.last_returned,
                 'gas': self.gas,
                 'pc': self.pc}
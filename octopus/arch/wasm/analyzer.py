@@ -1,15 +1,19 @@
-from wasm.modtypes import (TypeSection,
-                           ImportSection,
-                           FunctionSection,
-                           TableSection,
-                           MemorySection,
-                           GlobalSection,
-                           ExportSection,
-                           StartSection,
-                           ElementSection,
-                           CodeSection,
-                           DataSection,
+from wasm.modtypes import (Section,
                            NameSubSection,
+                           # Section ids.
+                           SEC_UNK,
+                           SEC_TYPE,
+                           SEC_IMPORT,
+                           SEC_FUNCTION,
+                           SEC_TABLE,
+                           SEC_MEMORY,
+                           SEC_GLOBAL,
+                           SEC_EXPORT,
+                           SEC_START,
+                           SEC_ELEMENT,
+                           SEC_CODE,
+                           SEC_DATA,
+                           SEC_NAME,
                            # Name subsection types.
                            NAME_SUBSEC_FUNCTION,
                            NAME_SUBSEC_LOCAL)
@@ -20,7 +24,6 @@ from octopus.arch.wasm.format import (format_kind_function,
                                       format_kind_memory,
                                       format_kind_global)
 
-from wasm.decode import decode_module
 from octopus.core.utils import bytecode_to_bytes
 
 import io
@@ -31,29 +34,74 @@ from logging import getLogger
 logging = getLogger(__name__)
 
 
+# size of the module header (magic + version)
+_HEADER_SIZE = 8
+
+
+def _read_varuint(data, offset):
+    """Return (value, next offset) of the LEB128 varuint at offset"""
+    result = shift = 0
+    while True:
+        byte = data[offset]
+        offset += 1
+        result |= (byte & 0x7f) << shift
+        if not byte & 0x80:
+            return result, offset
+        shift += 7
+
+
+class _section_attribute(object):
+    """WasmModuleAnalyzer attribute decoded on first access
+
+    loader is the name of the method decoding the section
+    and setting the attribute
+    """
+
+    def __init__(self, loader):
+        self.loader = loader
+
+    def __set_name__(self, owner, name):
+        self.name = name
+
+    def __get__(self, obj, owner):
+        if obj is None:
+            return self
+        if self.name not in obj._values:
+            getattr(obj, self.loader)()
+        return obj._values[self.name]
+
+    def __set__(self, obj, value):
+        obj._values[self.name] = value
+
+
 class WasmModuleAnalyzer(object):
-    '''Analyze and extract informations from wasm module'''
+    '''Analyze and extract informations from wasm module
+
+    The module is indexed in one pass (offset and length of each section),
+    each section is decoded on the first access to the corresponding
+    attributes and the result is cached.
+    '''
+
+    types = _section_attribute('_load_types')
+    imports_all = _section_attribute('_load_imports')
+    imports_func = _section_attribute('_load_imports')
+    func_types = _section_attribute('_load_func_types')
+    tables = _section_attribute('_load_tables')
+    memories = _section_attribute('_load_memories')
+    globals = _section_attribute('_load_globals')
+    exports = _section_attribute('_load_exports')
+    start = _section_attribute('_load_start')
+    elements = _section_attribute('_load_elements')
+    codes = _section_attribute('_load_codes')
+    datas = _section_attribute('_load_datas')
+    names = _section_attribute('_load_customs')
+    customs = _section_attribute('_load_customs')
+    func_prototypes = _section_attribute('_load_func_prototypes')
 
     def __init__(self, module_bytecode, analysis=True):
         self.module_bytecode = bytecode_to_bytes(module_bytecode)
 
-        self.magic = None
-        self.version = None
-        self.types = list()
-        self.imports_all = list()
-        self.imports_func = list()
-        self.func_types = list()
-        self.tables = list()
-        self.memories = list()
-        self.globals = list()
-        self.exports = list()
-        self.start = None
-        self.elements = list()
-        self.codes = list()
-        self.datas = list()
-        self.names = list()
-        self.customs = list()
-        self.func_prototypes = list()
+        self.attributes_reset()
         # self.strings = list() - TODO
 
         if analysis:
@@ -62,21 +110,20 @@ class WasmModuleAnalyzer(object):
     def attributes_reset(self):
         self.magic = None
         self.version = None
-        self.types = list()
-        self.imports_all = list()
-        self.imports_func = list()
-        self.func_types = list()
-        self.tables = list()
-        self.memories = list()
-        self.globals = list()
-        self.exports = list()
-        self.start = None
-        self.elements = list()
-        self.codes = list()
-        self.datas = list()
-        self.names = list()
-        self.customs = list()
-        self.func_prototypes = list()
+        # list of (section id, offset, length)
+        self.sections = list()
+        # section id -> list of decoded sections
+        self._sections_data = dict()
+        # decoded attributes
+        self._values = dict()
+
+    def __getstate__(self):
+        # decoded sections reference classes generated by the wasm
+        # package (not picklable), they are decoded again on access
+        state = self.__dict__.copy()
+        state['_sections_data'] = dict()
+        state['_values'] = dict()
+        return state
 
     def __str__(self):
         return str(self.show())
@@ -99,29 +146,67 @@ class WasmModuleAnalyzer(object):
                 'datas': self.datas,
                 'func_prototypes': self.func_prototypes}
 
-    def __get_section(self, section_type):
-        mod_iter = iter(decode_module(self.module_bytecode, True))
-        _, _ = next(mod_iter)
-        sections = list(mod_iter)
-
-        # iterate over all section
-        for cur_sec, cur_sec_data in sections:
-            sec = cur_sec_data.get_decoder_meta()['types']['payload']
-
-            if isinstance(sec, section_type):
-                return cur_sec_data
-        return None
-
-    def __decode_header(self, header, h_data):
-        """Decode wasm header
-        Return tuple (magic, version) of wasm module header
-        .. seealso:: https://github.com/WebAssembly/design/blob/master/BinaryEncoding.md#high-level-structure
+    def index_sections(self):
+        """Return the list of (section id, offset, length) of the module"""
+        data = self.module_bytecode
+        sections = list()
+        offset = _HEADER_SIZE
+        while offset < len(data):
+            start = offset
+            section_id, offset = _read_varuint(data, offset)
+            payload_len, offset = _read_varuint(data, offset)
+            offset += payload_len
+            if offset > len(data):
+                raise ValueError('section %d at offset 0x%x is truncated'
+                                 % (section_id, start))
+            sections.append((section_id, start, offset - start))
+        return sections
+
+    def get_sections(self, section_id):
+        """Return the decoded sections with id section_id"""
+        if section_id not in self._sections_data:
+            module_wnd = memoryview(self.module_bytecode)
+            sections = list()
+            for sec_id, offset, length in self.sections:
+                if sec_id == section_id:
+                    _, sec_data, _ = Section().from_raw(
+                        None, module_wnd[offset:offset + length])
+                    sections.append(sec_data)
+            self._sections_data[section_id] = sections
+        return self._sections_data[section_id]
+
+    def iter_codes(self):
+        """Yield the code of each function body of the code section
+
+        Only the body sizes and local declarations are read, the codes
+        are memoryview of module_bytecode (not copied), so iterating
+        over a memory-mapped module keeps memory usage bounded.
         """
-        magic = \
-            h_data.magic.to_bytes(header.magic.byte_size, 'little')
-        version = \
-            h_data.version.to_bytes(header.version.byte_size, 'little')
-        return (magic, version)
+        data = self.module_bytecode
+        module_wnd = memoryview(data)
+        code_sections = [s for s in self.sections if s[0] == SEC_CODE]
+        if not code_sections:
+            return
+        # like codes, only the last code section is used
+        _, offset, _ = code_sections[-1]
+        _, offset = _read_varuint(data, offset)  # section id
+        _, offset = _read_varuint(data, offset)  # payload length
+        count, offset = _read_varuint(data, offset)
+        for _ in range(count):
+            body_size, offset = _read_varuint(data, offset)
+            end = offset + body_size
+            local_count, offset = _read_varuint(data, offset)
+            for _ in range(local_count):
+                # number of locals and value type (1 byte)
+                _, offset = _read_varuint(data, offset)
+                offset += 1
+            yield module_wnd[offset:end]
+            offset = end
+
+    def __get_section(self, section_id):
+        """Return the last decoded section with id section_id or None"""
+        sections = self.get_sections(section_id)
+        return sections[-1] if sections else None
 
     def __decode_type_section(self, type_section):
         """Decode wasm type section
@@ -352,6 +437,15 @@ class WasmModuleAnalyzer(object):
 
         return names_list
 
+    def __decode_name_subsections(self, name_section):
+        names_list = list()
+        sec_wnd = name_section.payload
+        while sec_wnd:
+            subsec_len, subsec_data, _ = NameSubSection().from_raw(None, sec_wnd)
+            names_list = self.__decode_name_section(subsec_data)
+            sec_wnd = sec_wnd[subsec_len:]
+        return names_list
+
     def __decode_unknown_section(self, unknown_section):
         """
         .. seealso:: https://github.com/WebAssembly/design/blob/master/BinaryEncoding.md#high-level-structure
@@ -394,7 +488,7 @@ class WasmModuleAnalyzer(object):
         return func_prototypes
 
     def analyze(self):
-        """analyse the complete module & extract informations """
+        """index the module, sections are decoded on demand"""
         # src: https://github.com/WebAssembly/design/blob/master/BinaryEncoding.md
         # custom     0   name, .debug_str, ...
         # Type       1   Function signature declarations
@@ -412,52 +506,84 @@ class WasmModuleAnalyzer(object):
         # reset attributes
         self.attributes_reset()
 
-        mod_iter = iter(decode_module(self.module_bytecode, True))
         # decode header version - usefull in the future (multiple versions)
-        header, header_data = next(mod_iter)
-        self.magic, self.version = self.__decode_header(header, header_data)
-
-        #
-        # Wasm sections
-        #
-
-        for cur_sec, cur_sec_data in mod_iter:
-            sec = cur_sec_data.get_decoder_meta()['types']['payload']
-
-            if isinstance(sec, TypeSection):
-                self.types = self.__decode_type_section(cur_sec_data)
-            elif isinstance(sec, ImportSection):
-                self.imports_all, self.imports_func = \
-                    self.__decode_import_section(cur_sec_data)
-            elif isinstance(sec, FunctionSection):
-                self.func_types = self.__decode_function_section(cur_sec_data)
-            elif isinstance(sec, TableSection):
-                self.tables = self.__decode_table_section(cur_sec_data)
-            elif isinstance(sec, MemorySection):
-                self.memories = self.__decode_memory_section(cur_sec_data)
-            elif isinstance(sec, GlobalSection):
-                # TODO not analyzed
-                self.globals = self.__decode_global_section(cur_sec_data)
-            elif isinstance(sec, ExportSection):
-                self.exports = self.__decode_export_section(cur_sec_data)
-            elif isinstance(sec, StartSection):
-                # TODO not analyzed
-                self.start = self.__decode_start_section(cur_sec_data)
-            elif isinstance(sec, ElementSection):
-                self.elements = self.__decode_element_section(cur_sec_data)
-            elif isinstance(sec, CodeSection):
-                self.codes = self.__decode_code_section(cur_sec_data)
-            elif isinstance(sec, DataSection):
-                self.datas = self.__decode_data_section(cur_sec_data)
+        self.magic = bytes(self.module_bytecode[0:4])
+        self.version = bytes(self.module_bytecode[4:_HEADER_SIZE])
+
+        self.sections = self.index_sections()
+        return True
+
+    #
+    # Wasm sections loaders
+    #
+
+    def _load_types(self):
+        sec = self.__get_section(SEC_TYPE)
+        self.types = self.__decode_type_section(sec) if sec else list()
+
+    def _load_imports(self):
+        sec = self.__get_section(SEC_IMPORT)
+        self.imports_all, self.imports_func = \
+            self.__decode_import_section(sec) if sec else (list(), list())
+
+    def _load_func_types(self):
+        sec = self.__get_section(SEC_FUNCTION)
+        self.func_types = self.__decode_function_section(sec) if sec else list()
+
+    def _load_tables(self):
+        sec = self.__get_section(SEC_TABLE)
+        self.tables = self.__decode_table_section(sec) if sec else list()
+
+    def _load_memories(self):
+        sec = self.__get_section(SEC_MEMORY)
+        self.memories = self.__decode_memory_section(sec) if sec else list()
+
+    def _load_globals(self):
+        # TODO not analyzed
+        sec = self.__get_section(SEC_GLOBAL)
+        self.globals = self.__decode_global_section(sec) if sec else list()
+
+    def _load_exports(self):
+        sec = self.__get_section(SEC_EXPORT)
+        self.exports = self.__decode_export_section(sec) if sec else list()
+
+    def _load_start(self):
+        # TODO not analyzed
+        sec = self.__get_section(SEC_START)
+        self.start = self.__decode_start_section(sec) if sec else None
+
+    def _load_elements(self):
+        sec = self.__get_section(SEC_ELEMENT)
+        self.elements = self.__decode_element_section(sec) if sec else list()
+
+    def _load_codes(self):
+        sec = self.__get_section(SEC_CODE)
+        self.codes = self.__decode_code_section(sec) if sec else list()
+
+    def _load_datas(self):
+        sec = self.__get_section(SEC_DATA)
+        self.datas = self.__decode_data_section(sec) if sec else list()
+
+    def _load_customs(self):
+        self.names = list()
+        self.customs = list()
+        for sec in self.get_sections(SEC_UNK):
             # name section
-            elif isinstance(cur_sec, NameSubSection):
-                self.names = self.__decode_name_section(cur_sec_data)
+            if sec.name == SEC_NAME:
+                try:
+                    names = self.__decode_name_subsections(sec)
+                except Exception as e:
+                    # e.g. pre-MVP name section format
+                    logging.warning('name section not decoded: %r', e)
+                    self.customs.append(self.__decode_unknown_section(sec))
+                else:
+                    self.names = names
             else:
-                self.customs.append(self.__decode_unknown_section(cur_sec_data))
+                self.customs.append(self.__decode_unknown_section(sec))
 
+    def _load_func_prototypes(self):
         # create ordered list of functions
         self.func_prototypes = self.get_func_prototypes_ordered()
-        return True
 
     def is_compiled_with_emscripten(self):
         matching_list = self.get_emscripten_calls()
@@ -1,6 +1,10 @@
 # for graph visualisation
 
+from collections import Counter
+from concurrent.futures import ProcessPoolExecutor
 from logging import getLogger
+import gc
+import os
 from graphviz import Digraph
 
 from octopus.analysis.cfg import CFG
@@ -12,13 +16,13 @@ from octopus.arch.wasm.format import (format_bb_name,
                                       format_func_name)
 from octopus.arch.wasm.wasm import _groups
 
-from octopus.core.basicblock import BasicBlock
-from octopus.core.edge import (Edge,
+from octopus.core.basicblock import BasicBlock, BlockSummary
+from octopus.core.edge import (Edge, EdgeSet,
                                EDGE_UNCONDITIONAL,
                                EDGE_CONDITIONAL_TRUE, EDGE_CONDITIONAL_FALSE,
                                EDGE_FALLTHROUGH, EDGE_CALL)
 from octopus.core.function import Function
-from octopus.core.utils import bytecode_to_bytes
+from octopus.core.utils import bytecode_to_bytes, offset_to_index
 
 
 logging = getLogger(__name__)
@@ -33,21 +37,35 @@ DESIGN_EXPORT = {'fillcolor': 'grey',
                  'style': 'filled'}
 
 
-def enum_func(module_bytecode):
-    ''' return a list of Function
-        see:: octopus.core.function
+def enum_func_code(module_bytecode, analyzer=None):
+    ''' return a list of tuple (name, prefered_name, code)
+        for each function body of the module
     '''
-    functions = list()
-    analyzer = WasmModuleAnalyzer(module_bytecode)
+    if analyzer is None:
+        analyzer = WasmModuleAnalyzer(module_bytecode)
 
     protos = analyzer.func_prototypes
     import_len = len(analyzer.imports_func)
 
+    codes = list()
     for idx, code in enumerate(analyzer.codes):
         # get corresponding function prototype
         name, param_str, return_str, _ = protos[import_len + idx]
 
         prefered_name = format_func_name(name, param_str, return_str)
+        codes.append((name, prefered_name, code))
+    return codes
+
+
+def enum_func(module_bytecode, analyzer=None):
+    ''' return a list of Function
+        see:: octopus.core.function
+
+        analyzer: WasmModuleAnalyzer of the module, to not decode it again
+    '''
+    functions = list()
+
+    for name, prefered_name, code in enum_func_code(module_bytecode, analyzer):
         instructions = WasmDisassembler().disassemble(code)
         cur_function = Function(0, instructions[0], name=name,
                                 prefered_name=prefered_name)
@@ -57,6 +75,22 @@ def enum_func(module_bytecode):
     return functions
 
 
+def function_cfg(task):
+    ''' return (Function, edges) of a function body
+        task: (function index, name, prefered_name, code)
+
+        used by the WasmCFG process pool, all the
+        functions are independent
+    '''
+    idx, name, prefered_name, code = task
+    instructions = WasmDisassembler().disassemble(code)
+    function = Function(0, instructions[0], name=name,
+                        prefered_name=prefered_name)
+    function.instructions = instructions
+    function.basicblocks, edges = enum_blocks_edges(idx, instructions)
+    return function, edges
+
+
 def enum_func_name_call_indirect(functions):
     ''' return a list of function name if they used call_indirect
     '''
@@ -105,83 +139,140 @@ def enum_func_call_edges(functions, len_imports):
     return call_edges
 
 
-def enum_blocks_edges(function_id, instructions):
+def block_summary(block):
+    """Return the BlockSummary of a wasm basicblock
 
+    Only the stack effect is described (no ops), constants are
+    the values of the *.const instructions and jump_source the
+    xrefs of the terminating branch instruction
     """
-    Return a list of basicblock after
-    statically parsing given instructions
+    stack = []
+    pops = 0
+    constants = []
+    for index, inst in enumerate(block.instructions):
+        for _ in range(inst.pops):
+            if stack:
+                stack.pop()
+            else:
+                pops += 1
+        if inst.name.endswith('.const'):
+            value = inst.operand_interpretation.split(' ')[-1]
+            constants.append(float(value) if inst.name[0] == 'f' else int(value))
+        stack += [('instr', index)] * inst.pushes
+
+    jump_source = None
+    if block.end_instr.is_branch and block.end_instr.xref:
+        jump_source = ('immediate', tuple(block.end_instr.xref))
+    return BlockSummary(pops, stack, constants, jump_source)
+
+
+class ControlBlock(object):
+    """Structured control block (block, loop, if, else or func)
+
+    end is None until the block terminator is reached.
     """
 
-    basicblocks = list()
-    edges = list()
+    __slots__ = ['depth', 'start', 'end', 'name']
 
-    branches = []
-    xrefs = []
+    def __init__(self, depth, start, end, name):
+        self.depth = depth
+        self.start = start
+        self.end = end
+        self.name = name
 
-    intent = 0
-    blocks_tmp = []
-    blocks_list = []
+    def __repr__(self):
+        return 'ControlBlock(%r, %r, %r, %r)' % (self.depth, self.start,
+                                                 self.end, self.name)
 
-    # we need to do that because jump label are relative to the current block index
-    for index, inst in enumerate(instructions[:-1]):
+
+def enum_control_blocks(instructions):
+    """Resolve the structured control nesting in one pass
+
+    :return: (func, blocks, branches) - func is the ControlBlock of the
+             function body, blocks a dict {start offset: ControlBlock},
+             branches a list of (branch instruction, [ControlBlock targeted
+             by each label]), None for labels outside of the function
+    """
+    func = ControlBlock(0, 0, instructions[-1].offset_end, 'func')
+    blocks = dict()
+    branches = list()
+    # open blocks, the label i of a branch is stack[-1 - i]
+    stack = list()
+
+    for inst in instructions[:-1]:
 
         if inst.is_block_terminator:
-            start, name = blocks_tmp.pop()
+            block = stack.pop()
             if inst.name == 'else':
-                end = inst.offset - 1
+                block.end = inst.offset - 1
             else:
-                end = inst.offset_end
-            blocks_list.append((intent, start, end, name))
-            intent -= 1
-        if inst.is_block_starter:  # in ['block', 'loop']:
-            blocks_tmp.append((inst.offset, inst.name))
-            intent += 1
-        if inst.is_branch:
-            branches.append((intent, inst))
-
-    # add function body end
-    blocks_list.append((0, 0, instructions[-1].offset_end, 'func'))
-    blocks_list = sorted(blocks_list, key=lambda tup: (tup[1], tup[0]))
-
-    for depth, inst in branches:
-        labl = list()
-        if inst.name == 'br_table':
-            labl = [i for i in inst.insn_byte[2:]]
-        else:
-            labl.append(int(inst.operand_interpretation.split(' ')[-1]))
-
-        for d2 in labl:
-            rep = next(((i, s, e, n) for i, s, e, n in blocks_list if (i == (depth - d2) and s < inst.offset and e > inst.offset_end)), None)
-
-            if rep:
-                i, start, end, name = rep
-                # if we branch to a 'loop' label
-                # we go at the entry of the 'loop' block
-                if name == 'loop':
-                    value = start
-                # if we branch to a 'block' label
-                # we go at the end of the "block" block
-                elif name == 'block' or name == 'func':
-                    value = end
-                # we don't know
+                block.end = inst.offset_end
+        if inst.is_block_starter:  # in ['block', 'loop', 'if', 'else']:
+            block = ControlBlock(len(stack) + 1, inst.offset, None, inst.name)
+            blocks[inst.offset] = block
+            stack.append(block)
+        # 'if' immediate is a block type, not a label
+        if inst.is_branch and inst.name != 'if':
+            if inst.name == 'br_table':
+                labels = [i for i in inst.insn_byte[2:]]
+            else:
+                labels = [int(inst.operand_interpretation.split(' ')[-1], 0)]
+            targets = list()
+            for label in labels:
+                depth = len(stack) - label
+                if depth > 0:
+                    targets.append(stack[depth - 1])
+                elif depth == 0:
+                    targets.append(func)
                 else:
-                    value = None
-                inst.xref.append(value)
-                xrefs.append(value)
+                    targets.append(None)
+            branches.append((inst, targets))
+
+    return func, blocks, branches
+
+
+def enum_blocks_edges(function_id, instructions):
+
+    """
+    Return a list of basicblock after
+    statically parsing given instructions
+    """
+
+    basicblocks = list()
+    edges = EdgeSet()
+
+    xrefs = set()
+
+    # we need to do that because jump label are relative to the current block index
+    _, blocks, branches = enum_control_blocks(instructions)
+
+    for inst, targets in branches:
+        for block in targets:
+            # label of a block not closed or not enclosing the branch
+            if block is None or block.end is None or \
+                    not (block.start < inst.offset and block.end > inst.offset_end):
+                continue
+            # if we branch to a 'loop' label
+            # we go at the entry of the 'loop' block
+            if block.name == 'loop':
+                value = block.start
+            # if we branch to a 'block' label
+            # we go at the end of the "block" block
+            elif block.name == 'block' or block.name == 'func':
+                value = block.end
+            # we don't know
+            else:
+                value = None
+            inst.xref.append(value)
+            xrefs.add(value)
 
     # assign xref for "if" branch
     # needed because 'if' don't used label
-    for index, inst in enumerate(instructions[:-1]):
-        if inst.name == 'if':
-            g_block = next(iter([b for b in blocks_list if b[1] == inst.offset]), None)
-            jump_target = g_block[2] + 1
-            inst.xref.append(jump_target)
-            xrefs.append(jump_target)
-        elif inst.name == 'else':
-            g_block = next(iter([b for b in blocks_list if b[1] == inst.offset]), None)
-            jump_target = g_block[2] + 1
+    for inst in instructions[:-1]:
+        if inst.name == 'if' or inst.name == 'else':
+            jump_target = blocks[inst.offset].end + 1
             inst.xref.append(jump_target)
-            xrefs.append(jump_target)
+            xrefs.add(jump_target)
 
     # enumerate blocks
     new_block = True
@@ -219,38 +310,38 @@ def enum_blocks_edges(function_id, instructions):
         if new_block:
             block.end_offset = inst.offset_end
             block.end_instr = inst
+            block.summary = block_summary(block)
             basicblocks.append(block)
             new_block = True
 
     # enumerate edges
+    offset_index = offset_to_index(instructions)
     for index, block in enumerate(basicblocks):
         # get the last instruction
         inst = block.end_instr
         # unconditional jump - br
         if inst.is_branch_unconditional:
             for ref in inst.xref:
-                edges.append(Edge(block.name, format_bb_name(function_id, ref), EDGE_UNCONDITIONAL))
+                edges.add(Edge(block.name, format_bb_name(function_id, ref), EDGE_UNCONDITIONAL))
         # conditionnal jump - br_if, if
         elif inst.is_branch_conditional:
             if inst.name == 'if':
-                edges.append(Edge(block.name,
+                edges.add(Edge(block.name,
                              format_bb_name(function_id, inst.offset_end + 1),
                              EDGE_CONDITIONAL_TRUE))
-                if_b = next(iter([b for b in blocks_list if b[1] == inst.offset]), None)
-                #else_block = blocks_list[blocks_list.index(if_block) + 1]
-                jump_target = if_b[2] + 1
-                edges.append(Edge(block.name,
+                jump_target = blocks[inst.offset].end + 1
+                edges.add(Edge(block.name,
                              format_bb_name(function_id, jump_target),
                              EDGE_CONDITIONAL_FALSE))
             else:
                 for ref in inst.xref:
                     if ref and ref != inst.offset_end + 1:
                         # create conditionnal true edges
-                        edges.append(Edge(block.name,
+                        edges.add(Edge(block.name,
                                           format_bb_name(function_id, ref),
                                           EDGE_CONDITIONAL_TRUE))
                 # create conditionnal false edge
-                edges.append(Edge(block.name,
+                edges.add(Edge(block.name,
                              format_bb_name(function_id, inst.offset_end + 1),
                              EDGE_CONDITIONAL_FALSE))
         # instruction that end the flow
@@ -262,43 +353,80 @@ def enum_blocks_edges(function_id, instructions):
         # handle the case when you have if and else following
         elif inst.offset != instructions[-1].offset and \
                 block.start_instr.name != 'else' and \
-                instructions[instructions.index(inst) + 1].name == 'else':
+                instructions[offset_index[inst.offset] + 1].name == 'else':
 
-            else_ins = instructions[instructions.index(inst) + 1]
-            else_b = next(iter([b for b in blocks_list if b[1] == else_ins.offset]), None)
+            else_ins = instructions[offset_index[inst.offset] + 1]
+            else_b = blocks[else_ins.offset]
 
-            edges.append(Edge(block.name, format_bb_name(function_id, else_b[2] + 1), EDGE_FALLTHROUGH))
+            edges.add(Edge(block.name, format_bb_name(function_id, else_b.end + 1), EDGE_FALLTHROUGH))
         # add the last intruction "end" in the last block
         elif inst.offset != instructions[-1].offset:
             # EDGE_FALLTHROUGH
-            edges.append(Edge(block.name, format_bb_name(function_id, inst.offset_end + 1), EDGE_FALLTHROUGH))
+            edges.add(Edge(block.name, format_bb_name(function_id, inst.offset_end + 1), EDGE_FALLTHROUGH))
 
-    # prevent duplicate edges
-    edges = list(set(edges))
     return basicblocks, edges
 
 
 class WasmCFG(CFG):
     """
     """
-    def __init__(self, module_bytecode):
+    def __init__(self, module_bytecode, analyzer=None, workers=None):
+        """
+        workers: number of processes used to disassemble the functions
+                 and build their CFG (0 = number of cpus),
+                 None (default) to build them in this process
+        """
         self.module_bytecode = bytecode_to_bytes(module_bytecode)
+        self.workers = workers
 
         self.functions = list()
         self.basicblocks = list()
-        self.edges = list()
+        self.edges = EdgeSet()
 
-        self.analyzer = WasmModuleAnalyzer(self.module_bytecode)
+        # the module is decoded once, by the analyzer
+        if analyzer is None:
+            analyzer = WasmModuleAnalyzer(self.module_bytecode)
+        self.analyzer = analyzer
         self.run_static_analysis()
 
     def run_static_analysis(self):
-        self.functions = enum_func(self.module_bytecode)
+        if self.workers is not None:
+            return self.run_static_analysis_parallel()
+
+        self.functions = enum_func(self.module_bytecode, self.analyzer)
 
         for idx, func in enumerate(self.functions):
             func.basicblocks, edges = enum_blocks_edges(idx, func.instructions)
             # all bb name are unique so we can create global bb & edge list
             self.basicblocks += func.basicblocks
-            self.edges += edges
+            self.edges.update(edges)
+
+    def run_static_analysis_parallel(self):
+        """run_static_analysis with the functions spread over
+        a pool of processes, results are merged in the
+        functions order so the CFG is the same"""
+        tasks = [(idx, name, prefered_name, code) for idx, (name, prefered_name, code)
+                 in enumerate(enum_func_code(self.module_bytecode, self.analyzer))]
+
+        workers = self.workers or os.cpu_count() or 1
+        chunksize = max(1, len(tasks) // (workers * 4))
+        # unpickling the results creates lots of objects, the garbage
+        # collector would scan them again and again (3x slower)
+        gc_enabled = gc.isenabled()
+        gc.disable()
+        try:
+            with ProcessPoolExecutor(max_workers=workers,
+                                     initializer=gc.disable) as executor:
+                results = list(executor.map(function_cfg, tasks, chunksize=chunksize))
+        finally:
+            if gc_enabled:
+                gc.enable()
+
+        self.functions = list()
+        for func, edges in results:
+            self.functions.append(func)
+            self.basicblocks += func.basicblocks
+            self.edges.update(edges)
 
     def get_function(self, name=None, prefered_name=None):
         if name:
@@ -316,7 +444,7 @@ class WasmCFG(CFG):
         if not self.analyzer:
             self.analyzer = WasmModuleAnalyzer(self.module_bytecode)
         if not self.functions:
-            self.functions = enum_func(self.module_bytecode)
+            self.functions = enum_func(self.module_bytecode, self.analyzer)
 
         # create nodes
         for name, param_str, return_str, _ in self.analyzer.func_prototypes:
@@ -427,7 +555,7 @@ class WasmCFG(CFG):
 
             # check if multiple same edges
             # in that case, put the number into label
-            edges_counter = dict((x, edges.count(x)) for x in set(edges))
+            edges_counter = Counter(edges)
             # insert edges on the graph
             for edge, count in edges_counter.items():
                 label = None
@@ -459,11 +587,8 @@ class WasmCFG(CFG):
 
         # list()
         for func in self.functions:
-            data = list()
-            group = [i.group for i in func.instructions]
-            for g in all_groups:
-                data.append(group.count(g))
-            datas.append(tuple(data))
+            group = Counter(i.group for i in func.instructions)
+            datas.append(tuple(group[g] for g in all_groups))
 
         for idx in range(len(all_groups)):
             final.append(tuple([x[idx] for x in datas]))
@@ -5,9 +5,8 @@ from octopus.core.utils import bytecode_to_bytes
 from octopus.arch.wasm.instruction import WasmInstruction
 from octopus.arch.wasm.wasm import Wasm
 
-# from octopus.arch.wasm.decode import decode_module
-from wasm.decode import decode_module
-from wasm.modtypes import CodeSection
+from octopus.arch.wasm.analyzer import WasmModuleAnalyzer
+
 from wasm.compat import byte2int
 from wasm.opcodes import OPCODE_MAP
 from wasm.formatter import format_instruction
@@ -58,12 +57,12 @@ class WasmDisassembler(Disassembler):
 
         :param bytecode: bytecode sequence
         :param offset: start offset
-        :param r_format: output format ('list'/'text'/'reverse')
+        :param r_format: output format ('list'/'text'/'reverse'/'stream')
         :type bytecode: bytes, str
         :type offset: int
-        :type r_format: list, str, dict
+        :type r_format: list, str, dict, InstructionStream
         :return: dissassembly result depending of r_format
-        :rtype: list, str, dict
+        :rtype: list, str, dict, InstructionStream
 
         :Example:
 
@@ -87,43 +86,53 @@ class WasmDisassembler(Disassembler):
 
         return super().disassemble(bytecode, offset, r_format)
 
-    def extract_functions_code(self, module_bytecode):
-        functions = list()
-        mod_iter = iter(decode_module(module_bytecode))
-        _, _ = next(mod_iter)
-        sections = list(mod_iter)
-
-        # iterate over all section
-        #code_data = [cur_sec_data for cur_sec, cur_sec_data in sections if isinstance(cur_sec_data.get_decoder_meta()['types']['payload'], CodeSection)][0]
-        for cur_sec, cur_sec_data in sections:
-            sec = cur_sec_data.get_decoder_meta()['types']['payload']
-            if isinstance(sec, CodeSection):
-                code_data = cur_sec_data
-                break
-        if not code_data:
-            raise ValueError('No functions/codes in the module')
-        for idx, func in enumerate(code_data.payload.bodies):
-            instructions = self.disassemble(func.code.tobytes())
+    def iter_functions(self, module_bytecode, analyzer=None):
+        """Yield (function index, Function) for each function body
+
+        Functions are disassembled one at a time when the generator
+        is resumed, the code section is not decoded.
+        Imported functions come first in the function index space,
+        so the first body has index len(analyzer.imports_func).
+
+        :param module_bytecode: module, it can be a mmap of the file
+        :param analyzer: WasmModuleAnalyzer of the module, to not index it again
+        :type module_bytecode: bytes, mmap
+        """
+        if analyzer is None:
+            analyzer = WasmModuleAnalyzer(module_bytecode)
+
+        import_len = len(analyzer.imports_func)
+        for index, code in enumerate(analyzer.iter_codes(), import_len):
+            instructions = self.disassemble(code)
             cur_function = Function(0, instructions[0])
             cur_function.instructions = instructions
+            yield index, cur_function
 
-            functions.append(cur_function)
+    def extract_functions_code(self, module_bytecode, analyzer=None):
+        # only the code section is read
+        functions = [f for _, f in self.iter_functions(module_bytecode, analyzer)]
+        if not functions:
+            raise ValueError('No functions/codes in the module')
         return functions
 
     def disassemble_module(self, module_bytecode=None, offset=0, r_format='list'):
 
         bytecode = bytecode_to_bytes(module_bytecode)
-
-        functions = self.extract_functions_code(bytecode[offset:])
-        self.instructions = [f.instructions for f in functions]
+        if offset:
+            bytecode = bytecode[offset:]
 
         # return instructions
         if r_format == 'list':
+            functions = self.extract_functions_code(bytecode)
+            self.instructions = [f.instructions for f in functions]
             return self.instructions
         elif r_format == 'text':
-            text = ''
-            for index, func in enumerate(functions):
-                text += ('func %d\n' % index)
-                text += ('\n'.join(map(str, func.instructions)))
-                text += ('\n\n')
-            return text
+            text = list()
+            # numbered by code index
+            for index, (_, func) in enumerate(self.iter_functions(bytecode)):
+                text.append('func %d\n' % index)
+                text.append('\n'.join(map(str, func.instructions)))
+                text.append('\n\n')
+            if not text:
+                raise ValueError('No functions/codes in the module')
+            return ''.join(text)
@@ -2,9 +2,11 @@ from octopus.engine.emulator import EmulatorEngine
 from octopus.arch.wasm.cfg import WasmCFG
 from octopus.arch.wasm.vmstate import WasmVMstate
 from octopus.core.ssa import SSA, SSA_TYPE_FUNCTION, SSA_TYPE_CONSTANT
+from octopus.core.utils import offset_to_index
 
 from octopus.arch.wasm.format import (format_func_name,
                                       format_bb_name)
+from octopus.engine.states import states_history, STATES_NONE
 
 import copy
 
@@ -24,15 +26,16 @@ class WasmEmulatorEngine(EmulatorEngine):
 
 class WasmSSAEmulatorEngine(EmulatorEngine):
 
-    def __init__(self, bytecode):
+    def __init__(self, bytecode, states_policy=STATES_NONE, analyzer=None):
 
         # retrive instructions, basicblocks & functions statically
-        self.cfg = WasmCFG(bytecode)
+        self.cfg = WasmCFG(bytecode, analyzer=analyzer)
         self.ana = self.cfg.analyzer
 
         self.current_function = None
         self.current_f_instructions = None
         self.reverse_instructions = dict()
+        self.offset_index = dict()
         self.current_f_basicblocks = None
 
         self.basicblock_per_instr = dict()
@@ -41,7 +44,8 @@ class WasmSSAEmulatorEngine(EmulatorEngine):
         # connection between basicblocks
         # will be generate dynamically by the Emulator
 
-        self.states = dict()
+        # states saved before each instruction (see octopus.engine.states)
+        self.states = states_history(states_policy)
         self.states_total = 0
         self.ssa_counter = 0
 
@@ -65,6 +69,7 @@ class WasmSSAEmulatorEngine(EmulatorEngine):
         self.current_function = self.cfg.get_function(function_name)
         self.current_f_instructions = self.current_function.instructions
         self.reverse_instructions = {k: v for k, v in enumerate(self.current_f_instructions)}
+        self.offset_index = offset_to_index(self.current_f_instructions)
         self.current_f_basicblocks = self.current_function.basicblocks
 
         # create dict with:
@@ -78,7 +83,7 @@ class WasmSSAEmulatorEngine(EmulatorEngine):
         # connection between basicblocks
         # will be generate dynamically by the Emulator
 
-        self.states = dict()
+        self.states.clear()
         self.states_total = 0
         self.ssa_counter = 0
 
@@ -87,8 +92,9 @@ class WasmSSAEmulatorEngine(EmulatorEngine):
                         self.current_function.name,
                         self.current_function.prefered_name)
 
-        # launch emulation
-        self.emulate(state=state, depth=depth)
+        # launch emulation, on a copy: the state is updated in place
+        # (default argument shared between the calls)
+        self.emulate(state=copy.deepcopy(state), depth=depth)
 
     def emulate(self, state=WasmVMstate(), depth=0):
 
@@ -133,8 +139,10 @@ class WasmSSAEmulatorEngine(EmulatorEngine):
 
             # Save instruction and state
             state.instr = instr
-            self.states[self.states_total] = state
-            state = copy.deepcopy(state)
+            block_entry = (instr.offset == self.current_basicblock.start_offset)
+            if self.states.save(self.states_total, state, block_entry):
+                # stack entries must not be shared with the saved state
+                state = copy.deepcopy(state)
             self.states_total += 1
             state.pc += 1
 
@@ -255,13 +263,14 @@ class WasmSSAEmulatorEngine(EmulatorEngine):
 
             jump_addr = instr.xref
             # get instruction with this value as offset
-            target = next(filter(lambda element: element.offset == jump_addr[0], self.current_f_instructions))
+            target_index = self.offset_index[jump_addr[0]]
+            target = self.current_f_instructions[target_index]
 
             if target.offset not in state.instructions_visited:
                 # condition are True
                 logging.warning('[X] follow br_if branch offset 0x%x' % (target.offset))
                 new_state = copy.deepcopy(state)
-                new_state.pc = self.current_f_instructions.index(target)
+                new_state.pc = target_index
 
                 # follow the br_if
                 self.emulate(new_state, depth=depth + 1)
@@ -282,13 +291,14 @@ class WasmSSAEmulatorEngine(EmulatorEngine):
             jump_addr = instr.xref
 
             # get instruction with this value as offset
-            target = next(filter(lambda element: element.offset == jump_addr[0], self.current_f_instructions))
+            target_index = self.offset_index[jump_addr[0]]
+            target = self.current_f_instructions[target_index]
 
             if target.offset not in state.instructions_visited:
                 # condition are True
                 logging.warning('[X] follow br branch offset 0x%x' % (target.offset))
                 new_state = copy.deepcopy(state)
-                new_state.pc = self.current_f_instructions.index(target)
+                new_state.pc = target_index
                 # follow the br
                 self.emulate(new_state, depth=depth + 1)
             else:
@@ -312,13 +322,14 @@ class WasmSSAEmulatorEngine(EmulatorEngine):
 
             jump_addr = instr.xref
             # get instruction with this value as offset
-            target = next(filter(lambda element: element.offset == jump_addr[0], self.current_f_instructions))
+            target_index = self.offset_index[jump_addr[0]]
+            target = self.current_f_instructions[target_index]
 
             if target.offset not in state.instructions_visited:
                 # condition are True
                 logging.warning('[X] follow br_if branch offset 0x%x' % (target.offset))
                 new_state = copy.deepcopy(state)
-                new_state.pc = self.current_f_instructions.index(target)
+                new_state.pc = target_index
 
                 # follow the br_if
                 self.emulate(new_state, depth=depth + 1)
@@ -1,5 +1,15 @@
 from octopus.core.instruction import Instruction
-from octopus.arch.wasm.wasm import _groups
+from octopus.arch.wasm.wasm import _decode_table
+
+
+def _rebuild_instruction(opcode, operand_size, insn_byte,
+                         operand_interpretation, offset):
+    """ Unpickle a WasmInstruction (see WasmInstruction.__reduce__) """
+    d = _decode_table[opcode]
+    return WasmInstruction(opcode, d.name, d.imm_struct, operand_size, insn_byte,
+                           d.pops, d.pushes, d.description,
+                           operand_interpretation=operand_interpretation,
+                           offset=offset, descriptor=d)
 
 
 class WasmInstruction(Instruction):
@@ -7,8 +17,12 @@ class WasmInstruction(Instruction):
     TODO
 
     """
+
+    __slots__ = ('insn_byte', 'imm_struct', 'descriptor')
+
     def __init__(self, opcode, name, imm_struct, operand_size, insn_byte,
-                 pops, pushes, description, operand_interpretation=None, offset=0):
+                 pops, pushes, description, operand_interpretation=None, offset=0,
+                 descriptor=None):
         """ TODO """
         self.opcode = opcode
         self.offset = offset
@@ -27,6 +41,8 @@ class WasmInstruction(Instruction):
         self.imm_struct = imm_struct
         self.xref = list()
         self.ssa = None
+        # precomputed WasmOpcode (see octopus.arch.wasm.wasm)
+        self.descriptor = descriptor or _decode_table[opcode]
 
     def __eq__(self, other):
         """ Instructions are equal if all features match  """
@@ -40,6 +56,14 @@ class WasmInstruction(Instruction):
             self.operand_interpretation == other.operand_interpretation and\
             self.description == other.description
 
+    def __reduce__(self):
+        """ Compact pickle, the fields depending only on the opcode
+        are taken back from the opcodes table when unpickled """
+        return (_rebuild_instruction,
+                (self.opcode, self.operand_size, self.insn_byte,
+                 self.operand_interpretation, self.offset),
+                (None, {'xref': self.xref, 'ssa': self.ssa}))
+
     def __str__(self):
         """ String representation of the instruction """
         if self.operand:
@@ -52,113 +76,107 @@ class WasmInstruction(Instruction):
     @property
     def group(self):
         """ Instruction classification per group """
-        last_class = _groups.get(0)
-        for k, v in _groups.items():
-            if self.opcode >= k:
-                last_class = v
-            else:
-                return last_class
-        return last_class
+        return self.descriptor.group
 
     @property
     def is_control(self):
-        return self.group == 'Control'
+        return self.descriptor.group == 'Control'
 
     @property
     def is_parametric(self):
-        return self.group == 'Parametric'
+        return self.descriptor.group == 'Parametric'
 
     @property
     def is_variable(self):
-        return self.group == 'Variable'
+        return self.descriptor.group == 'Variable'
 
     @property
     def is_memory(self):
-        return self.group == 'Memory'
+        return self.descriptor.group == 'Memory'
 
     @property
     def is_constant(self):
-        return self.group == 'Constant'
+        return self.descriptor.group == 'Constant'
 
     @property
     def is_logical_i32(self):
-        return self.group == 'Logical_i32'
+        return self.descriptor.group == 'Logical_i32'
 
     @property
     def is_logical_i64(self):
-        return self.group == 'Logical_i64'
+        return self.descriptor.group == 'Logical_i64'
 
     @property
     def is_logical_f32(self):
-        return self.group == 'Logical_f32'
+        return self.descriptor.group == 'Logical_f32'
 
     @property
     def is_logical_f64(self):
-        return self.group == 'Logical_f64'
+        return self.descriptor.group == 'Logical_f64'
 
     @property
     def is_arithmetic_i32(self):
-        return self.group == 'Arithmetic_i32'
+        return self.descriptor.group == 'Arithmetic_i32'
 
     @property
     def is_bitwise_i32(self):
-        return self.group == 'Bitwise_i32'
+        return self.descriptor.group == 'Bitwise_i32'
 
     @property
     def is_arithmetic_i64(self):
-        return self.group == 'Arithmetic_i64'
+        return self.descriptor.group == 'Arithmetic_i64'
 
     @property
     def is_bitwise_i64(self):
-        return self.group == 'Bitwise_i64'
+        return self.descriptor.group == 'Bitwise_i64'
 
     @property
     def is_arithmetic_f32(self):
-        return self.group == 'Arithmetic_f32'
+        return self.descriptor.group == 'Arithmetic_f32'
 
     @property
     def is_arithmetic_f64(self):
-        return self.group == 'Arithmetic_f64'
+        return self.descriptor.group == 'Arithmetic_f64'
 
     @property
     def is_conversion(self):
-        return self.group == 'Conversion'
+        return self.descriptor.group == 'Conversion'
 
     @property
     def is_branch_conditional(self):
         """ Return True if the instruction is a conditional jump """
-        return self.name in ['br_if', 'br_table', 'if']
+        return self.descriptor.is_branch_conditional
 
     @property
     def is_branch_unconditional(self):
         """ Return True if the instruction is a unconditional jump """
-        return self.name in ['br']
+        return self.descriptor.is_branch_unconditional
 
     @property
     def is_call(self):
         """ True if the instruction is a call instruction """
-        return self.name in ['call', 'call_indirect']
+        return self.descriptor.is_call
 
     @property
     def is_branch(self):
-        return self.is_branch_conditional or self.is_branch_unconditional
+        return self.descriptor.is_branch
 
     @property
     def is_halt(self):
         """ Return True if the instruction is a branch terminator """
-        return self.name in ['unreachable', 'return']
+        return self.descriptor.is_halt
 
     @property
     def is_terminator(self):
         """ True if the instruction is a basic block terminator """
-        return self.is_branch or self.is_halt
+        return self.descriptor.is_terminator
 
     @property
     def is_block_starter(self):
         """ Return True if the instruction is a basic block starter """
-        return self.name in ['block', 'loop', 'if', 'else']
+        return self.descriptor.is_block_starter
 
     @property
     def is_block_terminator(self):
         """ Return True if the instruction is a basic block terminator """
-        return self.name in ['else', 'end']
+        return self.descriptor.is_block_terminator
@@ -3,6 +3,8 @@
 # * https://webassembly.github.io/spec/core/binary/instructions.html
 # * https://github.com/athre0z/wasm/blob/master/wasm/opcodes.py
 
+from collections import namedtuple
+
 from wasm.immtypes import *
 
 _groups = {0x00: 'Control',
@@ -213,6 +215,56 @@ _table = {
     0xbf: ('f64.reinterpret/i64', None, 1, 1, 'reinterpret the bits of a 64-bit integer as a 64-bit float'),
 }
 
+_invalid = ('INVALID', 0, 0, 0, 'Unknown opcode')
+
+# immutable opcode descriptor, classification flags are resolved
+# once when the decode table is built
+WasmOpcode = namedtuple('WasmOpcode', ['opcode', 'name', 'imm_struct',
+                                       'pops', 'pushes', 'description',
+                                       'group', 'is_branch_conditional',
+                                       'is_branch_unconditional', 'is_branch',
+                                       'is_call', 'is_halt', 'is_terminator',
+                                       'is_block_starter', 'is_block_terminator'])
+
+
+def _opcode_group(opcode):
+    """Return the group of opcode: the last _groups entry <= opcode"""
+    last_class = _groups.get(0)
+    for k, v in _groups.items():
+        if opcode >= k:
+            last_class = v
+        else:
+            return last_class
+    return last_class
+
+
+def _build_decode_table():
+    """Build the 256-entry table of WasmOpcode indexed by opcode"""
+    decode_table = list()
+    for opcode in range(256):
+        name, imm_struct, pops, pushes, description = \
+            _table.get(opcode, _invalid)
+        is_branch_conditional = name in ('br_if', 'br_table', 'if')
+        is_branch_unconditional = name == 'br'
+        is_branch = is_branch_conditional or is_branch_unconditional
+        is_halt = name in ('unreachable', 'return')
+        decode_table.append(WasmOpcode(
+            opcode, name, imm_struct, pops, pushes, description,
+            group=_opcode_group(opcode),
+            is_branch_conditional=is_branch_conditional,
+            is_branch_unconditional=is_branch_unconditional,
+            is_branch=is_branch,
+            is_call=name in ('call', 'call_indirect'),
+            is_halt=is_halt,
+            is_terminator=is_branch or is_halt,
+            is_block_starter=name in ('block', 'loop', 'if', 'else'),
+            is_block_terminator=name in ('else', 'end')))
+    return tuple(decode_table)
+
+
+# built once per process and shared by every instruction
+_decode_table = _build_decode_table()
+
 
 class Wasm(object):
     """Wasm bytecode."""
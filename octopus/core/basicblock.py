@@ -1,6 +1,51 @@
+class BlockSummary(object):
+    """Stack effect of a basicblock
+
+    Values are referenced by their source:
+    ('stack', n) the nth value from the top of the entry stack (0 = top)
+    ('instr', i) the value pushed by the ith instruction of the block
+
+    pops: number of values of the entry stack used by the block
+    pushes: number of values left on the stack (outputs)
+    constants: constant values pushed by the block
+    jump_source: source of the terminating jump operand (or None)
+    outputs: sources of the exit stack values, bottom to top,
+             the bottom `pops` values of the entry stack are replaced
+    ops: architecture specific description of the instructions
+         (used by the emulators), None if some instructions can't
+         be described and need to be emulated one by one
+    """
+
+    __slots__ = ('pops', 'pushes', 'constants', 'jump_source',
+                 'outputs', 'ops')
+
+    def __init__(self, pops=0, outputs=(), constants=(),
+                 jump_source=None, ops=None):
+        self.pops = pops
+        self.pushes = len(outputs)
+        self.outputs = tuple(outputs)
+        self.constants = tuple(constants)
+        self.jump_source = jump_source
+        self.ops = ops
+
+    @property
+    def net(self):
+        """Stack size difference between exit and entry"""
+        return self.pushes - self.pops
+
+    def __str__(self):
+        return 'pops=%d pushes=%d constants=%s jump_source=%s' % \
+            (self.pops, self.pushes, list(self.constants), self.jump_source)
+
+
 class BasicBlock(object):
     """
     """
+
+    __slots__ = ('start_offset', 'start_instr', 'name', 'end_offset',
+                 'end_instr', 'instructions', 'states', 'function_name',
+                 'summary')
+
     def __init__(self, start_offset=0x00, start_instr=None,
                  name='block_default_name'):
         self.start_offset = start_offset
@@ -12,6 +57,8 @@ class BasicBlock(object):
 
         self.states = []
         self.function_name = "unknown"
+        # BlockSummary, computed by the cfg builder
+        self.summary = None
 
     @property
     def size(self):
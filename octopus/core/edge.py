@@ -7,6 +7,8 @@ EDGE_CALL = 'call'
 
 class Edge:
 
+    __slots__ = ('node_from', 'node_to', 'type', 'condition')
+
     def __init__(self, node_from, node_to, edge_type=EDGE_UNCONDITIONAL,
                  condition=None):
 
@@ -33,3 +35,88 @@ class Edge:
     def as_dict(self):
         return {'from': str(self.node_from), 'to': str(self.node_to),
                 'type': self.type, 'condition': self.condition}
+
+
+class EdgeSet(object):
+    """Insertion-ordered set of Edge keyed by (from, to, type)
+
+    Inserting an edge already present is O(1) and does not grow
+    the set; the number of times each edge was inserted is kept
+    (see count) so multiplicity can still be displayed.
+
+    CFG.edges used to be a list: indexing, slicing, + and sort()
+    are supported, but edges are inserted with add() (no append,
+    a duplicated edge is not appended).
+    Indexing uses a list of the edges rebuilt after a change, so
+    a loop over range(len(edges)) stays linear.
+    """
+
+    __slots__ = ('_edges', '_counts', '_list')
+
+    def __init__(self, edges=()):
+        self._edges = dict()
+        self._counts = dict()
+        # edges as a list for indexing, None when out of date
+        self._list = None
+        self.update(edges)
+
+    @staticmethod
+    def key(edge):
+        return (edge.node_from, edge.node_to, edge.type)
+
+    def add(self, edge):
+        key = self.key(edge)
+        if key in self._edges:
+            self._counts[key] += 1
+        else:
+            self._edges[key] = edge
+            self._counts[key] = 1
+            self._list = None
+
+    def update(self, edges):
+        for edge in edges:
+            self.add(edge)
+
+    def count(self, edge):
+        """Number of times edge has been inserted"""
+        return self._counts.get(self.key(edge), 0)
+
+    def counts(self):
+        """Iterate over (edge, count) pairs"""
+        for key, edge in self._edges.items():
+            yield edge, self._counts[key]
+
+    def __contains__(self, edge):
+        return self.key(edge) in self._edges
+
+    def __len__(self):
+        return len(self._edges)
+
+    def __iter__(self):
+        return iter(self._edges.values())
+
+    def __getitem__(self, index):
+        if self._list is None:
+            self._list = list(self._edges.values())
+        return self._list[index]
+
+    def __add__(self, other):
+        return list(self) + list(other)
+
+    def __radd__(self, other):
+        return list(other) + list(self)
+
+    def __iadd__(self, edges):
+        self.update(edges)
+        return self
+
+    def sort(self, key=None, reverse=False):
+        """Sort the edges in place, as list.sort() does
+        (by (from, to, type) without key)"""
+        items = sorted(self._edges.items(), reverse=reverse,
+                       key=lambda item: key(item[1]) if key else item[0])
+        self._edges = dict(items)
+        self._list = None
+
+    def __str__(self):
+        return str([edge.as_dict() for edge in self])
@@ -1,5 +1,9 @@
 class Function(object):
 
+    __slots__ = ('start_offset', 'start_instr', 'name', 'prefered_name',
+                 'size', 'end_offset', 'end_instr', 'basicblocks',
+                 'instructions')
+
     def __init__(self, start_offset, start_instr=None,
                  name='func_default_name', prefered_name=None):
         # parameters
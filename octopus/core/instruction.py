@@ -1,5 +1,24 @@
+_slots_cache = dict()
+
+
+def _slots_of(cls):
+    """ Return the __slots__ of cls and its parents """
+    try:
+        return _slots_cache[cls]
+    except KeyError:
+        names = tuple(name for klass in cls.__mro__
+                      for name in getattr(klass, '__slots__', ()))
+        _slots_cache[cls] = names
+        return names
+
+
 class Instruction(object):
     """Instruction """
+
+    __slots__ = ('opcode', 'offset', 'name', 'description', 'operand_size',
+                 'operand', 'operand_interpretation', 'pops', 'pushes', 'fee',
+                 'xref', 'ssa')
+
     def __init__(self, opcode, name,
                  operand_size, pops, pushes, fee,
                  description, operand=None,
@@ -20,6 +39,17 @@ class Instruction(object):
         self.xref = xref
         self.ssa = None
 
+    def __copy__(self):
+        """ Shallow copy, faster than copy.copy default for __slots__ """
+        cls = self.__class__
+        new = cls.__new__(cls)
+        for name in _slots_of(cls):
+            try:
+                setattr(new, name, getattr(self, name))
+            except AttributeError:
+                pass
+        return new
+
     def __eq__(self, other):
         """ Instructions are equal if all features match  """
         return self.opcode == other.opcode and\
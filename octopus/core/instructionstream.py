@@ -0,0 +1,91 @@
+from array import array
+from bisect import bisect_left
+
+
+class InstructionStream(object):
+    """Compact struct-of-arrays representation of a disassembly
+
+    Only opcodes, offsets and sizes of the instructions are stored,
+    in array buffers that reference the original bytecode.
+    Instruction objects are materialized lazily on the first indexed
+    access and then kept, so accessing the same index twice returns
+    the same object and attributes set on it (ssa, xref, ...) are
+    preserved. Only the instructions accessed are allocated.
+    Iterating (or str) doesn't keep the instructions it creates,
+    a scan of the whole bytecode uses constant memory.
+    """
+
+    def __init__(self, disassembler, bytecode, offset=0):
+        self.disassembler = disassembler
+        self.bytecode = bytecode
+        self.bytecode_wnd = memoryview(bytecode)
+
+        self.opcodes = array('B')
+        self.offsets = array('L')
+        self.sizes = array('L')
+
+        # index -> instruction handed out
+        self._cache = dict()
+
+        bytecode_len = len(self.bytecode_wnd)
+        while offset < bytecode_len:
+            size = disassembler.disassemble_opcode_size(
+                self.bytecode_wnd[offset:], offset)
+            self.opcodes.append(self.bytecode_wnd[offset])
+            self.offsets.append(offset)
+            self.sizes.append(size)
+            offset += size
+
+    def __len__(self):
+        return len(self.offsets)
+
+    def __iter__(self):
+        # instructions already kept are yielded as is, the others are
+        # new objects on each iteration (attributes set on them are lost)
+        for index in range(len(self.offsets)):
+            instr = self._cache.get(index)
+            yield self._decode(index) if instr is None else instr
+
+    def __getitem__(self, key):
+        if isinstance(key, slice):
+            return [self._materialize(i)
+                    for i in range(*key.indices(len(self.offsets)))]
+        if key < 0:
+            key += len(self.offsets)
+        if not 0 <= key < len(self.offsets):
+            raise IndexError('InstructionStream index out of range')
+        return self._materialize(key)
+
+    def __str__(self):
+        return '\n'.join(map(str, self))
+
+    def _decode(self, index):
+        offset = self.offsets[index]
+        return self.disassembler.disassemble_opcode(
+            self.bytecode_wnd[offset:], offset)
+
+    def _materialize(self, index):
+        instr = self._cache.get(index)
+        if instr is None:
+            instr = self._cache[index] = self._decode(index)
+        return instr
+
+    def offset_index(self):
+        """Return a dict: instruction offset -> index, built from the offsets"""
+        return {offset: index for index, offset in enumerate(self.offsets)}
+
+    def index_of_offset(self, offset):
+        """Return the index of the instruction starting at offset"""
+        index = bisect_left(self.offsets, offset)
+        if index < len(self.offsets) and self.offsets[index] == offset:
+            return index
+        raise ValueError('no instruction at offset %x' % offset)
+
+    def index(self, instr):
+        """Return the index of instr, as list.index() does"""
+        return self.index_of_offset(instr.offset)
+
+    def raw(self, index):
+        """Return the encoded bytes of the instruction at index"""
+        offset = self.offsets[index]
+        return self.bytecode_wnd[offset:offset + self.sizes[index]]
@@ -5,6 +5,8 @@ SSA_TYPE_CONSTANT = "constant"
 class SSA(object):
     '''TODO'''
 
+    __slots__ = ('new_assignement', 'method_name', 'args', 'instr_type')
+
     def __init__(self, new_assignement=None, method_name=None, args=None, instr_type=SSA_TYPE_FUNCTION):
         """ TODO """
         self.new_assignement = new_assignement
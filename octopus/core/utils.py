@@ -1,8 +1,25 @@
 from binascii import unhexlify
+from logging import getLogger
+import mmap
+import os
+
+logging = getLogger(__name__)
+
+
+# size of the chunks read when decoding an hex file
+HEX_CHUNK_SIZE = 1 << 20
+
+_HEX_DIGITS = b'0123456789abcdefABCDEF'
+_WHITESPACES = b' \t\r\n\x0b\x0c'
 
 
 def bytecode_to_bytes(bytecode):
-    if str(bytecode).startswith("0x"):
+    # binary bytecode (bytes, bytearray, memoryview, mmap) is used as is,
+    # without building its string representation
+    if not isinstance(bytecode, str):
+        return bytecode
+
+    if bytecode.startswith("0x"):
         bytecode = bytecode[2:]
 
     try:
@@ -24,5 +41,86 @@ def bytecode_to_bytes(bytecode):
     return bytecode
 
 
+def load_bytecode(file, chunk_size=HEX_CHUNK_SIZE):
+    """Return the bytecode contained in file
+
+    Binary files (e.g. wasm modules) are memory-mapped, so nothing is
+    copied in memory. Hex files ("ABcdeF09..." or "0xABcdeF09...",
+    whitespaces and newlines are ignored) are read by chunks into a
+    reusable buffer and decoded into one bytearray.
+    The result can be given to the disassemblers, WasmModuleAnalyzer
+    and the CFG classes. The caller owns it: release a memory-mapped
+    file with close_bytecode once the objects built from it are
+    no longer used.
+
+    :param file: path or file object opened in binary mode
+    :param chunk_size: size of the chunks read from hex files
+    :type file: str, file
+    :rtype: mmap, bytearray, bytes
+    """
+    if isinstance(file, (str, os.PathLike)):
+        with open(file, 'rb') as f:
+            return load_bytecode(f, chunk_size)
+
+    head = file.read(chunk_size)
+    data = head.translate(None, _WHITESPACES)
+    if data[:2] in (b'0x', b'0X'):
+        data = data[2:]
+
+    # binary file
+    if data.translate(None, _HEX_DIGITS):
+        try:
+            return mmap.mmap(file.fileno(), 0, access=mmap.ACCESS_READ)
+        except (AttributeError, OSError, ValueError):
+            # not a regular file (e.g. pipe)
+            return head + file.read()
+
+    # hex file
+    bytecode = bytearray()
+    buffer = bytearray(chunk_size)
+    buffer_wnd = memoryview(buffer)
+    while True:
+        # an hex digit can be left from the previous chunk
+        if len(data) % 2:
+            pending = data[-1:]
+            data = data[:-1]
+        else:
+            pending = b''
+        bytecode += unhexlify(data)
+
+        size = file.readinto(buffer)
+        if not size:
+            break
+        data = pending + buffer_wnd[:size].tobytes().translate(None, _WHITESPACES)
+
+    if pending:
+        raise ValueError('odd number of hex digits in %s' % getattr(file, 'name', file))
+    return bytecode
+
+
+def close_bytecode(bytecode):
+    """Close bytecode if it is a memory-mapped file (see load_bytecode)
+
+    The mapping can't be closed while objects built from bytecode
+    (instructions, analyzer, CFG, ...) still reference it, it is then
+    released with the last of them.
+
+    :return: True if a memory-mapped file has been closed
+    """
+    if not isinstance(bytecode, mmap.mmap):
+        return False
+    try:
+        bytecode.close()
+    except BufferError:
+        logging.debug('memory-mapped bytecode still referenced, not closed')
+        return False
+    return True
+
+
+def offset_to_index(instructions):
+    """Return a dict: instruction offset -> index in instructions"""
+    return {instr.offset: index for index, instr in enumerate(instructions)}
+
+
 def search_in_list_of_dict(string_to_search, target_list, key_dict):
     return list(filter(lambda elem: str(string_to_search) in str(elem[key_dict]), target_list))
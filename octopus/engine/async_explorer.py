@@ -0,0 +1,232 @@
+import asyncio
+import json
+import ssl
+
+from octopus.engine.explorer import RPCError
+
+# default number of requests in flight (one pooled connection each)
+MAX_CONNECTIONS = 10
+# default timeout of a request in seconds, None to wait forever
+TIMEOUT = 60
+
+
+class AsyncExplorer(object):
+    '''
+    Generic asyncio JSON-RPC client class
+
+    Requests are sent on a pool of HTTP/1.1 keep-alive connections,
+    at most max_connections requests are in flight at the same time.
+    A request not answered within timeout seconds raises
+    asyncio.TimeoutError and its connection is closed.
+    The pool is bound to the event loop of the first request,
+    close() it before the loop is closed.
+
+    :Example:
+
+    >>> async def crawl(explorer, numbers):
+    ...     async with explorer:
+    ...         return await asyncio.gather(*(explorer.get_block_by_number(n)
+    ...                                      for n in numbers))
+    '''
+
+    def __init__(self, host='localhost', port=8332, tls=False, max_retries=3,
+                 max_connections=MAX_CONNECTIONS, timeout=TIMEOUT):
+        # host can contain a path, e.g. INFURA_MAINNET + key
+        self.host, _, path = host.partition('/')
+        self.path = '/' + path
+        self.port = port
+        self.tls = tls
+        self.max_retries = max_retries
+        self.max_connections = max_connections
+        self.timeout = timeout
+        self.headers = {'Content-Type': 'application/json'}
+
+        self.scheme = 'https' if self.tls else 'http'
+
+        self.url = '{}://{}:{}{}'.format(self.scheme, self.host, self.port, self.path)
+        self._ssl = ssl.create_default_context() if self.tls else None
+        # created by the first request, in the running loop
+        self._semaphore = None
+        self._connections = list()
+
+    async def __aenter__(self):
+        return self
+
+    async def __aexit__(self, *args):
+        await self.close()
+
+    async def close(self):
+        '''Close the idle connections of the pool'''
+        connections, self._connections = self._connections, list()
+        for _, writer in connections:
+            writer.close()
+        for _, writer in connections:
+            try:
+                await writer.wait_closed()
+            except OSError:
+                pass
+
+    async def _connect(self):
+        '''Return (reader, writer, reused), an idle connection if any'''
+        while self._connections:
+            reader, writer = self._connections.pop()
+            if not reader.at_eof() and not writer.is_closing():
+                return reader, writer, True
+            writer.close()
+        for retry in range(self.max_retries + 1):
+            try:
+                reader, writer = await asyncio.open_connection(
+                    self.host, self.port, ssl=self._ssl,
+                    server_hostname=self.host if self.tls else None)
+                return reader, writer, False
+            except OSError:
+                if retry == self.max_retries:
+                    raise Exception('RPC connection Error')
+
+    @staticmethod
+    async def _read_response(reader):
+        '''Return (status, reason, keep alive, body) of an HTTP response'''
+        status_line = await reader.readline()
+        if not status_line:
+            raise ConnectionResetError('connection closed by the server')
+        version, status, reason = (status_line.decode('latin-1').rstrip('\r\n').split(' ', 2) + [''])[:3]
+
+        headers = dict()
+        while True:
+            line = await reader.readline()
+            if line in (b'\r\n', b'\n', b''):
+                break
+            name, _, value = line.decode('latin-1').partition(':')
+            headers[name.strip().lower()] = value.strip()
+
+        connection = headers.get('connection', '').lower()
+        keep_alive = connection != 'close' if version == 'HTTP/1.1' else connection == 'keep-alive'
+        if headers.get('transfer-encoding', '').lower() == 'chunked':
+            chunks = list()
+            while True:
+                size = int((await reader.readline()).split(b';')[0], 16)
+                if not size:
+                    break
+                chunks.append(await reader.readexactly(size))
+                await reader.readexactly(2)
+            # trailer
+            while (await reader.readline()) not in (b'\r\n', b'\n', b''):
+                pass
+            body = b''.join(chunks)
+        elif 'content-length' in headers:
+            body = await reader.readexactly(int(headers['content-length']))
+        else:
+            body = await reader.read()
+            keep_alive = False
+        return int(status), reason, keep_alive, body
+
+    async def _exchange(self, request):
+        '''Send request, return (status, reason, body) of the response'''
+        while True:
+            reader, writer, reused = await self._connect()
+            keep_alive = False
+            try:
+                writer.write(request)
+                await writer.drain()
+                status, reason, keep_alive, response = await self._read_response(reader)
+                return status, reason, response
+            except (OSError, asyncio.IncompleteReadError, ValueError):
+                # idle connection closed by the server, send it again
+                if not reused:
+                    raise Exception('RPC connection Error')
+            finally:
+                # pool the connection only after a complete response,
+                # otherwise (error, timeout, cancellation) close it
+                if keep_alive:
+                    self._connections.append((reader, writer))
+                else:
+                    writer.close()
+
+    async def _post(self, data, path=None, timeout=None):
+        if self._semaphore is None:
+            self._semaphore = asyncio.Semaphore(self.max_connections)
+        body = json.dumps(data).encode('utf-8')
+        head = ['POST {} HTTP/1.1'.format(path or self.path),
+                'Host: {}:{}'.format(self.host, self.port),
+                'Content-Length: {}'.format(len(body))]
+        head += ['{}: {}'.format(name, value) for name, value in self.headers.items()]
+        request = ('\r\n'.join(head) + '\r\n\r\n').encode('latin-1') + body
+
+        async with self._semaphore:
+            status, reason, response = await asyncio.wait_for(
+                self._exchange(request), self.timeout if timeout is None else timeout)
+
+        if not 200 <= status < 300:
+            raise Exception('RPC connection failure: ' + str(status) + ' ' + reason)
+        try:
+            return json.loads(response.decode('utf-8'))
+        except ValueError:
+            raise Exception('JSON response parsing error: ' + str(response))
+
+    async def call(self, method, params=None, jsonrpc=None, _id=None, timeout=None):
+        '''
+        Call method with params
+
+        :param timeout: timeout of the request in seconds (default self.timeout)
+        '''
+
+        params = params or []
+        jsonrpc = jsonrpc or '2.0'
+        data = {
+            'jsonrpc': jsonrpc,
+            'method': method,
+            'params': params,
+        }
+        if _id is not None:
+            data['id'] = _id
+
+        response = await self._post(data, timeout=timeout)
+        error = response.get('error')
+        if isinstance(error, dict):
+            raise RPCError(error.get('code'), error.get('message'),
+                           error.get('data'), method, params)
+        try:
+            return response['result']
+        except KeyError:
+            raise Exception('\"result\" field in JSON response error: ' + str(response))
+
+    async def call_many(self, method, params_list, raise_errors=True, timeout=None):
+        '''
+        Call method concurrently once per params of params_list
+
+        :param raise_errors: if False, the exception of a failed call
+                             is returned in place of its result
+        :param timeout: timeout of each request in seconds (default self.timeout)
+        :return: list of the results, in the order of params_list
+        '''
+        return await asyncio.gather(*(self.call(method, params, timeout=timeout)
+                                      for params in params_list),
+                                    return_exceptions=not raise_errors)
+
+    #######################
+    # HIGHT-LEVEL METHODS #
+    #######################
+
+    async def get_transaction(self, transaction_id, verbosity):
+        '''
+        return transaction informations
+
+        see Explorer.get_transaction()
+        '''
+        raise NotImplementedError
+
+    async def get_block_by_number(self, block_number):
+        '''
+        return block information using given block number
+
+        see Explorer.get_block_by_number()
+        '''
+        raise NotImplementedError
+
+    async def get_block_by_hash(self, block_hash):
+        '''
+        return block information using given block hash
+
+        see Explorer.get_block_by_hash()
+        '''
+        raise NotImplementedError
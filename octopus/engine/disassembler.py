@@ -1,4 +1,5 @@
-from octopus.core.utils import bytecode_to_bytes
+from octopus.core.instructionstream import InstructionStream
+from octopus.core.utils import bytecode_to_bytes, offset_to_index
 
 
 class BytecodeEmptyException(Exception):
@@ -13,28 +14,44 @@ class Disassembler(object):
         self.bytecode = bytecode
         self.instructions = list()
         self.reverse_instructions = dict()
+        self.offset_index = dict()
         self.asm = asm
 
     def attributes_reset(self):
         """Reset instructions class attributes """
         self.instructions = list()
         self.reverse_instructions = dict()
+        self.offset_index = dict()
 
     def disassemble_opcode(self, bytecode, offset=0):
-        """ Generic method to disassemble one instruction """
+        """ Generic method to disassemble one instruction
+
+        :param bytecode: bytecode starting with the instruction to decode
+        :param offset: offset of the instruction
+        :type bytecode: bytes, memoryview
+        :type offset: int
+        """
         raise NotImplementedError
 
+    def disassemble_opcode_size(self, bytecode, offset=0):
+        """ Generic method to get the size of one instruction
+
+        Overwrite it when the size can be computed without
+        creating the instruction (used by InstructionStream)
+        """
+        return self.disassemble_opcode(bytecode, offset).size
+
     def disassemble(self, bytecode=None, offset=0, r_format='list'):
         """Generic method to disassemble bytecode
 
         :param bytecode: bytecode sequence
         :param offset: start offset
-        :param r_format: output format ('list'/'text'/'reverse')
+        :param r_format: output format ('list'/'text'/'reverse'/'stream')
         :type bytecode: bytes, str
         :type offset: int
-        :type r_format: list, str, dict
+        :type r_format: list, str, dict, InstructionStream
         :return: dissassembly result depending of r_format
-        :rtype: list, str, dict
+        :rtype: list, str, dict, InstructionStream
         """
         # reinitialize class variable
         self.attributes_reset()
@@ -45,14 +62,30 @@ class Disassembler(object):
 
         self.bytecode = bytecode_to_bytes(self.bytecode)
 
-        while offset < len(self.bytecode):
-            instr = self.disassemble_opcode(self.bytecode[offset:], offset)
+        # compact representation, instructions are created on access
+        if r_format == 'stream':
+            self.instructions = InstructionStream(self, self.bytecode, offset)
+            # the stream is indexed like reverse_instructions
+            self.reverse_instructions = self.instructions
+            self.offset_index = self.instructions.offset_index()
+            return self.instructions
+
+        # slicing a memoryview doesn't copy the underlying buffer,
+        # so every instruction is decoded in place (linear time)
+        bytecode_wnd = memoryview(self.bytecode)
+        bytecode_len = len(bytecode_wnd)
+        instructions = self.instructions
+
+        while offset < bytecode_len:
+            instr = self.disassemble_opcode(bytecode_wnd[offset:], offset)
             offset += instr.size
-            self.instructions.append(instr)
+            instructions.append(instr)
 
         # fill reverse instructions
         self.reverse_instructions = {k: v for k, v in
                                      enumerate(self.instructions)}
+        # offset -> index, used to resolve jump targets
+        self.offset_index = offset_to_index(self.instructions)
 
         # return instructions
         if r_format == 'list':
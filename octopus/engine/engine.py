@@ -7,3 +7,100 @@ class VMstate(object):
     def details(self):
         """ TODO """
         raise NotImplementedError
+
+
+class SharedStack(object):
+    """Persistent stack with list-like interface
+
+    Items are stored in a linked list of immutable (value, next) cells
+    so copy() is O(1): both stacks share the same tail and push/pop
+    only move the head of the stack modified.
+    Indexing is O(depth) from the top of the stack.
+    """
+
+    __slots__ = ('_head', '_len')
+
+    def __init__(self, iterable=()):
+        self._head = None
+        self._len = 0
+        for value in iterable:
+            self.append(value)
+
+    def copy(self):
+        new = SharedStack.__new__(SharedStack)
+        new._head = self._head
+        new._len = self._len
+        return new
+
+    __copy__ = copy
+
+    def __reduce__(self):
+        # avoid recursion over the cells when pickling
+        return (SharedStack, (list(self),))
+
+    def __deepcopy__(self, memo):
+        from copy import deepcopy
+        return SharedStack(deepcopy(list(self), memo))
+
+    def append(self, value):
+        self._head = (value, self._head)
+        self._len += 1
+
+    def pop(self):
+        if self._head is None:
+            raise IndexError('pop from empty stack')
+        value, self._head = self._head
+        self._len -= 1
+        return value
+
+    def _depth(self, index):
+        depth = -index - 1 if index < 0 else self._len - index - 1
+        if not 0 <= depth < self._len:
+            raise IndexError('stack index out of range')
+        return depth
+
+    def __getitem__(self, index):
+        cell = self._head
+        for _ in range(self._depth(index)):
+            cell = cell[1]
+        return cell[0]
+
+    def __setitem__(self, index, value):
+        # cells are shared, rebuild the cells above index
+        above = []
+        cell = self._head
+        for _ in range(self._depth(index)):
+            above.append(cell[0])
+            cell = cell[1]
+        cell = (value, cell[1])
+        for v in reversed(above):
+            cell = (v, cell)
+        self._head = cell
+
+    def __len__(self):
+        return self._len
+
+    def __iter__(self):
+        """Iterate from the bottom to the top of the stack"""
+        values = []
+        cell = self._head
+        while cell is not None:
+            values.append(cell[0])
+            cell = cell[1]
+        return reversed(values)
+
+    def __contains__(self, value):
+        cell = self._head
+        while cell is not None:
+            if cell[0] == value:
+                return True
+            cell = cell[1]
+        return False
+
+    def __eq__(self, other):
+        if not isinstance(other, (SharedStack, list)):
+            return NotImplemented
+        return list(self) == list(other)
+
+    def __repr__(self):
+        return repr(list(self))
@@ -4,6 +4,23 @@ from requests.exceptions import ConnectionError as RequestsConnectionError
 
 import json
 
+# default number of requests sent in one JSON-RPC batch
+BATCH_SIZE = 100
+
+
+class RPCError(Exception):
+    '''
+    JSON-RPC error object returned for a request
+    '''
+
+    def __init__(self, code, message, data=None, method=None, params=None):
+        Exception.__init__(self, 'RPC error %s: %s (%s %s)' % (code, message, method, params))
+        self.code = code
+        self.message = message
+        self.data = data
+        self.method = method
+        self.params = params
+
 
 class Explorer(object):
     '''
@@ -21,6 +38,20 @@ class Explorer(object):
         self.scheme = 'https' if self.tls else 'http'
 
         self.url = '{}://{}:{}'.format(self.scheme, self.host, self.port)
+        # number of requests sent per HTTP POST by batch()
+        self.batch_size = BATCH_SIZE
+
+    def _post(self, data):
+        try:
+            r = self.session.post(self.url, headers=self.headers, data=json.dumps(data))
+        except RequestsConnectionError:
+            raise Exception('RPC connection Error')
+        if not 200 <= r.status_code < 300:
+            raise Exception('RPC connection failure: ' + str(r.status_code) + ' ' + r.reason)
+        try:
+            return r.json()
+        except ValueError:
+            raise Exception('JSON response parsing error: ' + str(r.text))
 
     def call(self, method, params=None, jsonrpc=None, _id=None):
 
@@ -34,21 +65,71 @@ class Explorer(object):
         if _id is not None:
             data['id'] = _id
 
-        try:
-            r = self.session.post(self.url, headers=self.headers, data=json.dumps(data))
-        except RequestsConnectionError:
-            raise Exception('RPC connection Error')
-        if not 200 <= r.status_code < 300:
-            raise Exception('RPC connection failure: ' + str(r.status_code) + ' ' + r.reason)
-        try:
-            response = r.json()
-        except ValueError:
-            raise Exception('JSON response parsing error: ' + str(r.text))
+        response = self._post(data)
         try:
             return response['result']
         except KeyError:
             raise Exception('\"result\" field in JSON response error: ' + str(response))
 
+    def batch(self, calls, batch_size=None, jsonrpc='2.0', raise_errors=True):
+        '''
+        Send calls as JSON-RPC batches (arrays of requests),
+        batch_size (default self.batch_size) requests per HTTP POST
+
+        :param calls: iterable of (method, params)
+        :param raise_errors: if False, a failed call gives an RPCError
+                             in the results instead of raising it
+        :return: list of the results, in the order of calls
+
+        :Example:
+
+        >>> explorer.batch([('getblockhash', [0]), ('getblockhash', [1])])
+        ['000000000019d6...', '00000000839a8e...']
+        '''
+        batch_size = batch_size or self.batch_size
+        calls = list(calls)
+        results = list()
+
+        for start in range(0, len(calls), batch_size):
+            chunk = calls[start:start + batch_size]
+            # ids are the indexes in the chunk, responses can be in any order
+            data = [{'jsonrpc': jsonrpc, 'method': method, 'params': params or [], 'id': _id}
+                    for _id, (method, params) in enumerate(chunk)]
+            response = self._post(data)
+            if not isinstance(response, list):
+                # the whole batch is rejected (e.g. batches not supported)
+                error = response.get('error') if isinstance(response, dict) else None
+                if isinstance(error, dict):
+                    raise RPCError(error.get('code'), error.get('message'), error.get('data'))
+                raise Exception('JSON-RPC batch response error: ' + str(response))
+
+            responses = {item.get('id'): item for item in response if isinstance(item, dict)}
+            for _id, (method, params) in enumerate(chunk):
+                item = responses.get(_id)
+                if item is None:
+                    result = RPCError(None, 'no response', method=method, params=params)
+                elif item.get('error') is not None:
+                    error = item['error']
+                    if not isinstance(error, dict):
+                        error = {'message': error}
+                    result = RPCError(error.get('code'), error.get('message'),
+                                      error.get('data'), method, params)
+                elif 'result' in item:
+                    result = item['result']
+                else:
+                    result = RPCError(None, '"result" field missing', method=method, params=params)
+                if raise_errors and isinstance(result, RPCError):
+                    raise result
+                results.append(result)
+        return results
+
+    def call_many(self, method, params_list, batch_size=None, raise_errors=True):
+        '''
+        Call method once per params of params_list, see batch()
+        '''
+        return self.batch(((method, params) for params in params_list),
+                          batch_size=batch_size, raise_errors=raise_errors)
+
     #######################
     # HIGHT-LEVEL METHODS #
     #######################
@@ -86,6 +167,31 @@ class Explorer(object):
         '''
         return NotImplementedError
 
+    def get_transaction_many(self, transaction_ids, verbosity):
+        '''
+        return transactions informations, using batches of requests
+
+        ex :
+            binding of eth_getTransactionByHash_many() for Ethereum
+            binding of getrawtransaction_many() for Bitcoin
+            binding of getrawtransaction_many() for Neo
+        '''
+        raise NotImplementedError
+
+    def get_block_by_number_many(self, block_numbers):
+        '''
+        return blocks information using given block numbers,
+        using batches of requests
+        '''
+        raise NotImplementedError
+
+    def get_block_by_hash_many(self, block_hashes):
+        '''
+        return blocks information using given block hashes,
+        using batches of requests
+        '''
+        raise NotImplementedError
+
     def decode_tx(txid):
         '''
         return dict with important transaction information
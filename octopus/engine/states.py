@@ -0,0 +1,133 @@
+import os
+import pickle
+import tempfile
+from collections import OrderedDict
+from collections.abc import Mapping
+
+# states retention policies
+STATES_NONE = 'none'
+STATES_ALL = 'all'
+STATES_LAST = 'last'
+STATES_BLOCK = 'block'
+STATES_DISK = 'disk'
+
+
+class StatesHistory(Mapping):
+    """Keep every state saved by the emulator (index -> state)
+
+    Subclasses implement the others retention policies,
+    all of them can be read like the dict previously used.
+    """
+
+    def __init__(self):
+        self._states = dict()
+
+    def save(self, index, state, block_entry=False):
+        """Save state of instruction number index
+
+        :param block_entry: state is the entry state of a basicblock
+        :return: True if a reference to state is kept, in that case
+                 the emulator need to continue with a copy of the state
+        """
+        self._states[index] = state
+        return True
+
+    def clear(self):
+        self._states.clear()
+
+    def __getitem__(self, index):
+        return self._states[index]
+
+    def __iter__(self):
+        return iter(self._states)
+
+    def __len__(self):
+        return len(self._states)
+
+
+class NoStatesHistory(StatesHistory):
+    """Don't keep any state"""
+
+    def save(self, index, state, block_entry=False):
+        return False
+
+
+class LastStatesHistory(StatesHistory):
+    """Keep only the last `size` states (ring buffer)"""
+
+    def __init__(self, size=1000):
+        self._states = OrderedDict()
+        self.size = size
+
+    def save(self, index, state, block_entry=False):
+        self._states[index] = state
+        if len(self._states) > self.size:
+            self._states.popitem(last=False)
+        return True
+
+
+class BlockStatesHistory(StatesHistory):
+    """Keep only the states at the entry of a basicblock"""
+
+    def save(self, index, state, block_entry=False):
+        if block_entry:
+            self._states[index] = state
+        return block_entry
+
+
+class DiskStatesHistory(StatesHistory):
+    """Pickle every state into a file, states are loaded on access
+
+    If path is not given, a temporary file is used and deleted
+    when this object is garbage collected.
+    """
+
+    def __init__(self, path=None):
+        # index -> (position, size) in the file
+        self._states = dict()
+        if path:
+            self.file = open(path, 'w+b')
+        else:
+            self.file = tempfile.TemporaryFile()
+
+    def save(self, index, state, block_entry=False):
+        data = pickle.dumps(state, pickle.HIGHEST_PROTOCOL)
+        self.file.seek(0, os.SEEK_END)
+        self._states[index] = (self.file.tell(), len(data))
+        self.file.write(data)
+        return False
+
+    def clear(self):
+        self._states.clear()
+        self.file.truncate(0)
+
+    def __getitem__(self, index):
+        position, size = self._states[index]
+        self.file.seek(position)
+        return pickle.loads(self.file.read(size))
+
+    def __del__(self):
+        self.file.close()
+
+
+_policies = {STATES_NONE: NoStatesHistory,
+             STATES_ALL: StatesHistory,
+             STATES_LAST: LastStatesHistory,
+             STATES_BLOCK: BlockStatesHistory,
+             STATES_DISK: DiskStatesHistory}
+
+
+def states_history(policy=STATES_NONE):
+    """Return the StatesHistory matching policy
+
+    :param policy: 'none', 'all', 'last', 'block', 'disk'
+                   or a StatesHistory instance (e.g. LastStatesHistory(50))
+    :type policy: str, StatesHistory
+    """
+    if isinstance(policy, StatesHistory):
+        return policy
+    try:
+        return _policies[policy]()
+    except KeyError:
+        raise Exception('Unknown states policy %r - available: %s'
+                        % (policy, list(_policies)))
@@ -1,5 +1,3 @@
-import io
-
 from octopus.engine.disassembler import Disassembler
 
 from octopus.platforms.BTC.instruction import BitcoinInstruction
@@ -17,8 +15,9 @@ class BitcoinDisassembler(Disassembler):
         '''
         TODO
         '''
-        wallet = io.BytesIO(bytecode)
-        opcode = int.from_bytes(wallet.read(1), byteorder='big')
+        bytecode_wnd = memoryview(bytecode)
+        opcode = bytecode_wnd[0]
+        cursor = 1
 
         invalid = ('OP_INVALIDOPCODE', 0, 0, 0, 0, 'Matches any opcode that is not yet assigned.')
         name, operand_size, pops, pushes, gas, description = \
@@ -26,10 +25,14 @@ class BitcoinDisassembler(Disassembler):
         instruction = BitcoinInstruction(opcode, name, operand_size, pops, pushes,
                                          gas, description, offset=offset)
         if instruction.has_length_operand:
-            instruction.operand_size = wallet.read(instruction.operand_size)
+            length_size = instruction.operand_size
+            instruction.operand_size = \
+                bytecode_wnd[cursor:cursor + length_size].tobytes()
             instruction.format_operand_size()
+            cursor += length_size
         if instruction.has_operand:
-            instruction.operand = wallet.read(instruction.operand_size)
+            instruction.operand = \
+                bytecode_wnd[cursor:cursor + instruction.operand_size].tobytes()
         return instruction
 
     def disassemble(self, bytecode=None, offset=0, r_format='list'):
@@ -1,4 +1,5 @@
 from octopus.engine.explorer import Explorer
+from octopus.engine.async_explorer import AsyncExplorer, MAX_CONNECTIONS, TIMEOUT
 from octopus.platforms.BTC.bech32 import encode as bech32_encode
 
 import binascii
@@ -48,6 +49,32 @@ class BitcoinExplorerRPC(Explorer):
         """
         return self.getblock(block_hash)
 
+    def get_transaction_many(self, transaction_ids, verbosity=1):
+        """ Return transactions informations, using batches of requests
+
+        .. seealso::
+            getrawtransaction_many()
+        """
+        return self.getrawtransaction_many(transaction_ids, verbosity)
+
+    def get_block_by_number_many(self, block_numbers):
+        """ Return blocks information using given block numbers,
+            using batches of requests
+
+        .. seealso::
+            getblockhash_many() + getblock_many()
+        """
+        return self.getblock_many(self.getblockhash_many(block_numbers))
+
+    def get_block_by_hash_many(self, block_hashes):
+        """ Return blocks information using given block hashes,
+            using batches of requests
+
+        .. seealso::
+            getblock_many()
+        """
+        return self.getblock_many(block_hashes)
+
     def decode_tx(self, tx):
 
         result = {"txid": tx['txid'],
@@ -2054,6 +2081,84 @@ class BitcoinExplorerRPC(Explorer):
         '''
         return self.call('walletpassphrasechange', [oldpassphrase, newpassphrase])
 
+    ##########################
+    # BATCH JSON-RPC METHODS #
+    ##########################
+
+    # one HTTP request per batch_size calls, see Explorer.batch()
+
+    def getblock_many(self, blockhashes, verbosity=1, batch_size=None):
+        '''
+        Returns the blocks with the given hashes, in the same order
+
+        see getblock()
+        '''
+        return self.call_many('getblock',
+                              ([blockhash, verbosity] for blockhash in blockhashes),
+                              batch_size=batch_size)
+
+    def getblockhash_many(self, heights, batch_size=None):
+        '''
+        Returns the hashes of the blocks at the given heights, in the same order
+
+        see getblockhash()
+        '''
+        return self.call_many('getblockhash',
+                              ([height] for height in heights),
+                              batch_size=batch_size)
+
+    def getrawtransaction_many(self, txids, verbose=False, batch_size=None):
+        '''
+        Returns the transactions with the given ids, in the same order
+
+        see getrawtransaction()
+        '''
+        return self.call_many('getrawtransaction',
+                              ([txid, verbose] for txid in txids),
+                              batch_size=batch_size)
+
+
+class AsyncBitcoinExplorerRPC(AsyncExplorer):
+    '''
+    Bitcoin asyncio JSON-RPC client class
+
+    see BitcoinExplorerRPC for the documentation of the methods
+    '''
+
+    def __init__(self, host='localhost', port=BITCOIND_DEFAULT_RPC_PORT, tls=False, max_retries=3,
+                 max_connections=MAX_CONNECTIONS, timeout=TIMEOUT):
+        AsyncExplorer.__init__(self, host=host, port=port, tls=tls, max_retries=max_retries,
+                               max_connections=max_connections, timeout=timeout)
+
+    #######################
+    # HIGHT-LEVEL METHODS #
+    #######################
+
+    async def get_transaction(self, transaction_id, verbosity=1):
+        return await self.getrawtransaction(transaction_id, verbosity)
+
+    async def get_block_by_number(self, block_number):
+        return await self.getblock(await self.getblockhash(block_number))
+
+    async def get_block_by_hash(self, block_hash):
+        return await self.getblock(block_hash)
+
+    ####################
+    # JSON-RPC METHODS #
+    ####################
+
+    async def getblock(self, blockhash, verbosity=1):
+        return await self.call('getblock', [blockhash, verbosity])
+
+    async def getblockcount(self):
+        return await self.call('getblockcount')
+
+    async def getblockhash(self, height):
+        return await self.call('getblockhash', [height])
+
+    async def getrawtransaction(self, txid, verbose=False):
+        return await self.call('getrawtransaction', [txid, verbose])
+
 
 class BitcoinBitcoreExplorerRPC(BitcoinExplorerRPC):
     '''
@@ -9,6 +9,9 @@ class BitcoinInstruction(Instruction):
     TODO
 
     """
+
+    __slots__ = ()
+
     def __init__(self, opcode, name,
                  operand_size, pops, pushes, fee,
                  description, operand=None,
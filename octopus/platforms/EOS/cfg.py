@@ -3,9 +3,11 @@ from octopus.arch.wasm.cfg import WasmCFG
 
 # Eos smart contract == wasm module
 class EosCFG(WasmCFG):
-    def __init__(self, module_bytecode):
+    def __init__(self, module_bytecode, analyzer=None, workers=None):
         WasmCFG.__init__(self,
-                         module_bytecode=module_bytecode)
+                         module_bytecode=module_bytecode,
+                         analyzer=analyzer,
+                         workers=workers)
 
     def visualize_instrs_per_funcs(self, show=True, save=True,
                                    out_filename="eos_func_analytic.png",
@@ -1,8 +1,11 @@
 from octopus.arch.wasm.emulator import WasmSSAEmulatorEngine
+from octopus.engine.states import STATES_NONE
 
 
 # Eos smart contract == wasm module
 class EosSSAEmulatorEngine(WasmSSAEmulatorEngine):
-    def __init__(self, bytecode=None):
+    def __init__(self, bytecode=None, states_policy=STATES_NONE, analyzer=None):
         WasmSSAEmulatorEngine.__init__(self,
-                                       bytecode=bytecode)
+                                       bytecode=bytecode,
+                                       states_policy=states_policy,
+                                       analyzer=analyzer)
@@ -1,4 +1,5 @@
-from octopus.engine.explorer import Explorer
+from octopus.engine.explorer import Explorer, RPCError
+from octopus.engine.async_explorer import AsyncExplorer, MAX_CONNECTIONS, TIMEOUT
 from requests.exceptions import ConnectionError as RequestsConnectionError
 import json
 
@@ -36,6 +37,20 @@ class EosExplorer(Explorer):
         except KeyError:
             raise Exception('\"result\" field in JSON response error: ' + str(response))
 
+    def batch(self, calls, batch_size=None, jsonrpc=None, raise_errors=True):
+        '''The REST API has no batch requests: calls are sent one by one,
+        reusing the connection of the session (see Explorer.batch())
+        '''
+        results = list()
+        for method, params in calls:
+            try:
+                results.append(self.call(method, params))
+            except Exception as e:
+                if raise_errors:
+                    raise
+                results.append(RPCError(None, str(e), method=method, params=params))
+        return results
+
     ##########################
     #        Chain API       #
     ##########################
@@ -79,6 +94,26 @@ class EosExplorer(Explorer):
         data = {'account_name': account_name}
         return self.call('get_code', data)
 
+    def get_block_many(self, block_num_or_ids, raise_errors=True):
+        '''Get information related to blocks, in the same order.
+
+        NOT TESTED
+        '''
+        return self.call_many('get_block',
+                              ({'block_num_or_id': block_num_or_id}
+                               for block_num_or_id in block_num_or_ids),
+                              raise_errors=raise_errors)
+
+    def get_code_many(self, account_names, raise_errors=True):
+        '''Fetch smart contracts code, in the same order.
+
+        NOT TESTED
+        '''
+        return self.call_many('get_code',
+                              ({'account_name': account_name}
+                               for account_name in account_names),
+                              raise_errors=raise_errors)
+
     def get_table_rows(self, scope, code, table, json=False, lower_bound=None, upper_bound=None, limit=None):
         '''Fetch smart contract data from an account.
 
@@ -219,3 +254,44 @@ class EosExplorer(Explorer):
         NOT TESTED
         '''
         return self.call('sign_transaction', tx_json)
+
+
+class AsyncEosExplorer(AsyncExplorer):
+    """
+    EOS asyncio REST RPC client class
+
+    see EosExplorer for the documentation of the methods
+    """
+    def __init__(self, host='localhost', port=EOS_DEFAULT_RPC_PORT, tls=False, max_retries=3,
+                 max_connections=MAX_CONNECTIONS, timeout=TIMEOUT):
+        AsyncExplorer.__init__(self, host=host, port=port, tls=tls, max_retries=max_retries,
+                               max_connections=max_connections, timeout=timeout)
+
+    async def call(self, method, params={}, version='v1', api_type='chain', timeout=None):
+        current_path = '{}/{}/{}/{}'.format(self.path.rstrip('/'), version, api_type, method)
+        return await self._post(params, current_path, timeout=timeout)
+
+    ##########################
+    #        Chain API       #
+    ##########################
+
+    async def get_info(self):
+        return await self.call('get_info')
+
+    async def get_block(self, block_num_or_id):
+        data = {'block_num_or_id': block_num_or_id}
+        return await self.call('get_block', data)
+
+    async def get_block_by_number(self, block_number):
+        return await self.get_block(block_number)
+
+    async def get_block_by_hash(self, block_hash):
+        return await self.get_block(block_hash)
+
+    async def get_account(self, account_name):
+        data = {'account_name': account_name}
+        return await self.call('get_account', data)
+
+    async def get_code(self, account_name):
+        data = {'account_name': account_name}
+        return await self.call('get_code', data)
@@ -0,0 +1,68 @@
+import hashlib
+from collections import OrderedDict
+
+from octopus.arch.evm.cfg import EvmCFG
+from octopus.arch.evm.disassembler import EvmDisassembler
+from octopus.core.utils import bytecode_to_bytes
+
+
+def normalize_bytecode(bytecode):
+    """Return bytecode without the metadata (swarm hash) and
+    the constructor arguments
+
+    Contracts compiled from the same source (token clones, proxies, ...)
+    have the same normalized bytecode.
+    The code before the detected runtime code is kept: it is the
+    creation code, or the contract itself when its runtime code embeds
+    the creation code of another contract (factory).
+    """
+    disasm = EvmDisassembler()
+    disasm.bytecode = bytecode_to_bytes(bytecode)
+    disasm.analysis()
+    return bytes(disasm.loader_code or b'') + bytes(disasm.bytecode)
+
+
+def code_hash(bytecode):
+    """Return the sha256 (hex) of the normalized bytecode"""
+    return hashlib.sha256(normalize_bytecode(bytecode)).hexdigest()
+
+
+def group_contracts(contracts):
+    """Group contracts having the same normalized bytecode
+
+    :param contracts: iterable of (name, bytecode), e.g. (address, code)
+    :return: OrderedDict {code hash: (bytecode, [names])}, bytecode is
+             the one of the first contract of the group
+    """
+    groups = OrderedDict()
+    for name, bytecode in contracts:
+        key = code_hash(bytecode)
+        group = groups.get(key)
+        if group is None:
+            groups[key] = (bytecode, [name])
+        else:
+            group[1].append(name)
+    return groups
+
+
+def analyze_corpus(contracts, cfg_class=EvmCFG, cache=None, **parameters):
+    """Run cfg_class(bytecode, **parameters) once per group of contracts
+    having the same normalized bytecode (see group_contracts)
+
+    :param contracts: iterable of (name, bytecode)
+    :param cfg_class: CFG class or any callable(bytecode, **parameters)
+    :param cache: CFGCache to reuse the results between runs
+    :return: generator of (names, result), result is computed
+             with the bytecode of the first contract of the group
+
+    :Example:
+
+    >>> for names, cfg in analyze_corpus(contracts, analysis='static'):
+    ...     print(names, len(cfg.functions))
+    """
+    for bytecode, names in group_contracts(contracts).values():
+        if cache is not None:
+            result = cache.cfg(cfg_class, bytecode, **parameters)
+        else:
+            result = cfg_class(bytecode, **parameters)
+        yield names, result
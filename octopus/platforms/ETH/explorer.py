@@ -7,6 +7,7 @@ from octopus.platforms.ETH.constants import DEFAULT_GAS_PER_TX, DEFAULT_GAS_PRIC
 from octopus.platforms.ETH.util import hex_to_dec, clean_hex, validate_block
 
 from octopus.engine.explorer import Explorer
+from octopus.engine.async_explorer import AsyncExplorer, MAX_CONNECTIONS, TIMEOUT
 """
 This code is adapted from: ethjsonrpc
 https://github.com/ConsenSys/ethjsonrpc
@@ -81,6 +82,32 @@ class EthereumExplorerRPC(Explorer):
         """
         return self.eth_getBlockByHash(block_hash)
 
+    def get_transaction_many(self, transaction_ids, verbosity=None):
+        """ Return transactions informations, using batches of requests
+
+        .. seealso::
+            :method:`eth_getTransactionByHash_many`
+        """
+        return self.eth_getTransactionByHash_many(transaction_ids)
+
+    def get_block_by_number_many(self, block_numbers):
+        """ Return blocks information using given block numbers,
+            using batches of requests
+
+        .. seealso::
+            :method:`eth_getBlockByNumber_many`
+        """
+        return self.eth_getBlockByNumber_many(block_numbers)
+
+    def get_block_by_hash_many(self, block_hashes):
+        """ Return blocks information using given block hashes,
+            using batches of requests
+
+        .. seealso::
+            :method:`eth_getBlockByHash_many`
+        """
+        return self.eth_getBlockByHash_many(block_hashes)
+
     def decode_tx(self, transaction_id):
         """ Return dict with important information about
             the given transaction
@@ -1214,6 +1241,78 @@ class EthereumExplorerRPC(Explorer):
         """
         return self.call('shh_getMessages', [filter_id])
 
+    ##########################
+    # BATCH JSON-RPC METHODS #
+    ##########################
+
+    # one HTTP request per batch_size calls, see Explorer.batch()
+
+    def eth_getBlockByNumber_many(self, blocks, tx_objects=True, batch_size=None):
+        """ Returns information about blocks by number.
+
+        :param blocks: integer block numbers, or the strings "latest", "earliest" or "pending"
+        :type blocks: iterable
+        :return: list of block objects (or null), in the order of blocks
+        :rtype: list
+
+        :Example:
+
+        >>> explorer = EthereumExplorerRPC()
+        >>> blocks = explorer.eth_getBlockByNumber_many(range(5100000, 5100100), False)
+
+        .. seealso::
+            :method:`eth_getBlockByNumber`
+        """
+        return self.call_many('eth_getBlockByNumber',
+                              ([validate_block(block), tx_objects] for block in blocks),
+                              batch_size=batch_size)
+
+    def eth_getBlockByHash_many(self, block_hashes, tx_objects=True, batch_size=None):
+        """ Returns information about blocks by hash.
+
+        .. seealso::
+            :method:`eth_getBlockByHash`
+        """
+        return self.call_many('eth_getBlockByHash',
+                              ([block_hash, tx_objects] for block_hash in block_hashes),
+                              batch_size=batch_size)
+
+    def eth_getTransactionByHash_many(self, tx_hashes, batch_size=None):
+        """ Returns the information about transactions requested by transaction hash.
+
+        .. seealso::
+            :method:`eth_getTransactionByHash`
+        """
+        return self.call_many('eth_getTransactionByHash',
+                              ([tx_hash] for tx_hash in tx_hashes),
+                              batch_size=batch_size)
+
+    def eth_getTransactionReceipt_many(self, tx_hashes, batch_size=None):
+        """ Returns the receipts of transactions by transaction hash.
+
+        .. seealso::
+            :method:`eth_getTransactionReceipt`
+        """
+        return self.call_many('eth_getTransactionReceipt',
+                              ([tx_hash] for tx_hash in tx_hashes),
+                              batch_size=batch_size)
+
+    def eth_getCode_many(self, addresses, default_block=BLOCK_TAG_LATEST, batch_size=None):
+        """ Returns code at given addresses.
+
+        :param addresses: 20 Bytes - addresses.
+        :type addresses: iterable
+        :return: list of the codes, in the order of addresses
+        :rtype: list
+
+        .. seealso::
+            :method:`eth_getCode`
+        """
+        default_block = validate_block(default_block)
+        return self.call_many('eth_getCode',
+                              ([address, default_block] for address in addresses),
+                              batch_size=batch_size)
+
 
 class EthereumInfuraExplorer(EthereumExplorerRPC):
     """
@@ -1285,3 +1384,61 @@ class EthereumParityExplorer(EthereumExplorerRPC):
         """
         block = validate_block(block)
         return self.call('trace_block', [block])
+
+
+class AsyncEthereumExplorerRPC(AsyncExplorer):
+    """
+    Ethereum asyncio JSON-RPC client class
+
+    see EthereumExplorerRPC for the documentation of the methods
+
+    :Example:
+
+    >>> async def get_codes(addresses):
+    ...     async with AsyncEthereumExplorerRPC(max_connections=32) as explorer:
+    ...         return await asyncio.gather(*map(explorer.eth_getCode, addresses))
+    """
+    def __init__(self, host='localhost', port=GETH_DEFAULT_RPC_PORT, tls=False, max_retries=3,
+                 max_connections=MAX_CONNECTIONS, timeout=TIMEOUT):
+        AsyncExplorer.__init__(self, host=host, port=port, tls=tls, max_retries=max_retries,
+                               max_connections=max_connections, timeout=timeout)
+
+    async def call(self, method, params=None, jsonrpc='2.0', _id=1, timeout=None):
+        return await super().call(method, params, jsonrpc, _id, timeout=timeout)
+
+    #######################
+    # HIGHT-LEVEL METHODS #
+    #######################
+
+    async def get_transaction(self, transaction_id, verbosity=None):
+        return await self.eth_getTransactionByHash(transaction_id)
+
+    async def get_block_by_number(self, block_number):
+        return await self.eth_getBlockByNumber(block_number)
+
+    async def get_block_by_hash(self, block_hash):
+        return await self.eth_getBlockByHash(block_hash)
+
+    ####################
+    # JSON-RPC METHODS #
+    ####################
+
+    async def eth_blockNumber(self):
+        return hex_to_dec(await self.call('eth_blockNumber'))
+
+    async def eth_getCode(self, address, default_block=BLOCK_TAG_LATEST):
+        default_block = validate_block(default_block)
+        return await self.call('eth_getCode', [address, default_block])
+
+    async def eth_getBlockByHash(self, block_hash, tx_objects=True):
+        return await self.call('eth_getBlockByHash', [block_hash, tx_objects])
+
+    async def eth_getBlockByNumber(self, block=BLOCK_TAG_LATEST, tx_objects=True):
+        block = validate_block(block)
+        return await self.call('eth_getBlockByNumber', [block, tx_objects])
+
+    async def eth_getTransactionByHash(self, tx_hash):
+        return await self.call('eth_getTransactionByHash', [tx_hash])
+
+    async def eth_getTransactionReceipt(self, tx_hash):
+        return await self.call('eth_getTransactionReceipt', [tx_hash])
@@ -1,6 +1,6 @@
 from octopus.core.function import Function
 from octopus.core.basicblock import BasicBlock
-from octopus.core.edge import Edge
+from octopus.core.edge import Edge, EdgeSet
 from octopus.core.edge import (EDGE_UNCONDITIONAL,
                                EDGE_CONDITIONAL_TRUE,
                                EDGE_CONDITIONAL_FALSE,
@@ -86,7 +86,7 @@ def enum_blocks_edges(instructions):
     """
 
     basicblocks = list()
-    edges = list()
+    edges = EdgeSet()
     xrefs = enumerate_xref(instructions)
     # create the first block
     new_block = True
@@ -105,20 +105,20 @@ def enum_blocks_edges(instructions):
         if (inst.offset_end + 1) in xrefs:
             # absolute JUMP
             if inst.is_branch_unconditional:
-                edges.append(Edge(block.name, 'block_%x' % xref_of_instr(inst),
+                edges.add(Edge(block.name, 'block_%x' % xref_of_instr(inst),
                                   EDGE_UNCONDITIONAL))
             # conditionnal JUMPI / JUMPIF / ...
             elif inst.is_branch_conditional:
-                edges.append(Edge(block.name, 'block_%x' % xref_of_instr(inst),
+                edges.add(Edge(block.name, 'block_%x' % xref_of_instr(inst),
                                   EDGE_CONDITIONAL_TRUE))
-                edges.append(Edge(block.name, 'block_%x' % (inst.offset_end + 1),
+                edges.add(Edge(block.name, 'block_%x' % (inst.offset_end + 1),
                                   EDGE_CONDITIONAL_FALSE))
             # Halt instruction : RETURN, STOP, RET, ...
             elif inst.is_halt:
                 pass
             # just falls to the next instruction
             else:
-                edges.append(Edge(block.name, 'block_%x' % (inst.offset_end + 1),
+                edges.add(Edge(block.name, 'block_%x' % (inst.offset_end + 1),
                                   EDGE_FALLTHROUGH))
 
             block.end_offset = inst.offset_end
@@ -128,7 +128,6 @@ def enum_blocks_edges(instructions):
 
     # add the last block
     basicblocks.append(block)
-    edges = list(set(edges))
 
     return (basicblocks, edges)
 
@@ -150,7 +149,7 @@ class NeoCFG(CFG):
 
         self.basicblocks = list()
         self.functions = list()
-        self.edges = list()
+        self.edges = EdgeSet()
 
         if self.static_analysis:
             self.run_static_analysis()
@@ -1,5 +1,3 @@
-import io
-
 from octopus.engine.disassembler import Disassembler
 
 from octopus.platforms.NEO.instruction import NeoInstruction
@@ -16,8 +14,9 @@ class NeoDisassembler(Disassembler):
         TODO
         '''
 
-        wallet = io.BytesIO(bytecode)
-        opcode = int.from_bytes(wallet.read(1), byteorder='big')
+        bytecode_wnd = memoryview(bytecode)
+        opcode = bytecode_wnd[0]
+        cursor = 1
 
         invalid = ('INVALID', 0, 0, 0, 0, 'Unknown opcode')
         name, operand_size, pops, pushes, gas, description = \
@@ -25,16 +24,19 @@ class NeoDisassembler(Disassembler):
         instruction = NeoInstruction(opcode, name, operand_size, pops, pushes,
                                      gas, description, offset=offset)
         if instruction.has_length_operand:
-            instruction.operand_size = int.from_bytes(wallet.read(1), byteorder='big')
+            # truncated bytecode: no length byte
+            instruction.operand_size = bytecode_wnd[cursor] if cursor < len(bytecode_wnd) else 0
+            cursor += 1
         if instruction.has_operand:
-            instruction.operand = wallet.read(instruction.operand_size)
+            instruction.operand = \
+                bytecode_wnd[cursor:cursor + instruction.operand_size].tobytes()
         return instruction
 
     def disassemble(self, bytecode=None, offset=0, r_format='list'):
         '''
         TODO
         '''
-        self.bytecode = str(bytecode) if bytecode else str(self.bytecode)
+        self.bytecode = bytecode if bytecode else self.bytecode
 
         self.instructions = list()
         self.reverse_instructions = dict()
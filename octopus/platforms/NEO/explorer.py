@@ -1,4 +1,5 @@
 from octopus.engine.explorer import Explorer
+from octopus.engine.async_explorer import AsyncExplorer, MAX_CONNECTIONS, TIMEOUT
 
 # Inspired by https://github.com/ellmetha/neojsonrpc
 
@@ -62,6 +63,32 @@ class NeoExplorerRPC(Explorer):
         """
         return self.getblock(block_hash)
 
+    def get_transaction_many(self, transaction_ids, verbosity=True):
+        """ Return transactions informations, using batches of requests
+
+        .. seealso::
+            :method:`getrawtransaction_many`
+        """
+        return self.getrawtransaction_many(transaction_ids, verbosity)
+
+    def get_block_by_number_many(self, block_numbers):
+        """ Return blocks information using given block numbers,
+            using batches of requests
+
+        .. seealso::
+            :method:`getblock_many`
+        """
+        return self.getblock_many(block_numbers)
+
+    def get_block_by_hash_many(self, block_hashes):
+        """ Return blocks information using given block hashes,
+            using batches of requests
+
+        .. seealso::
+            :method:`getblock_many`
+        """
+        return self.getblock_many(block_hashes)
+
     ####################
     # JSON-RPC METHODS #
     ####################
@@ -703,3 +730,119 @@ class NeoExplorerRPC(Explorer):
 
         """
         return self.call('validateaddress', [address])
+
+    ##########################
+    # BATCH JSON-RPC METHODS #
+    ##########################
+
+    # one HTTP request per batch_size calls, see Explorer.batch()
+
+    def getblock_many(self, block_ids, verbose=True, batch_size=None):
+        """ Returns the blocks information associated with hash values or block indexes.
+
+        :param block_ids: block hash values or block indexes
+        :type block_ids: iterable
+        :return: list of the blocks information, in the order of block_ids
+        :rtype: list
+
+        :Example:
+
+        >>> explorer = NeoExplorerRPC()
+        >>> blocks = explorer.getblock_many(range(1917115, 1917215))
+
+        .. seealso::
+            :method:`getblock`
+        """
+        return self.call_many('getblock',
+                              ([block_id, int(verbose)] for block_id in block_ids),
+                              batch_size=batch_size)
+
+    def getblockhash_many(self, block_indexes, batch_size=None):
+        """ Returns the hash values of blocks by index.
+
+        .. seealso::
+            :method:`getblockhash`
+        """
+        return self.call_many('getblockhash',
+                              ([block_index] for block_index in block_indexes),
+                              batch_size=batch_size)
+
+    def getrawtransaction_many(self, tx_hashes, verbose=True, batch_size=None):
+        """ Returns the transactions information associated with transaction hashes.
+
+        .. seealso::
+            :method:`getrawtransaction`
+        """
+        return self.call_many('getrawtransaction',
+                              ([tx_hash, int(verbose)] for tx_hash in tx_hashes),
+                              batch_size=batch_size)
+
+    def getapplicationlog_many(self, txids, batch_size=None):
+        """ Returns the contract logs (execution receipts) of transactions.
+
+        .. seealso::
+            :method:`getapplicationlog`
+        """
+        return self.call_many('getapplicationlog',
+                              ([txid] for txid in txids),
+                              batch_size=batch_size)
+
+    def getcontractstate_many(self, script_hashes, batch_size=None):
+        """ Returns the contracts information (including the code) of script hashes.
+
+        .. seealso::
+            :method:`getcontractstate`
+        """
+        return self.call_many('getcontractstate',
+                              ([script_hash] for script_hash in script_hashes),
+                              batch_size=batch_size)
+
+
+class AsyncNeoExplorerRPC(AsyncExplorer):
+    '''
+    Neo asyncio JSON-RPC client class
+
+    see NeoExplorerRPC for the documentation of the methods
+    '''
+
+    def __init__(self, host=NEO_HOST, port=MAINNET_HTTP_RPC_PORT, tls=False, max_retries=3,
+                 max_connections=MAX_CONNECTIONS, timeout=TIMEOUT):
+        AsyncExplorer.__init__(self, host=host, port=port, tls=tls, max_retries=max_retries,
+                               max_connections=max_connections, timeout=timeout)
+        self._id_counter = 0
+
+    async def call(self, method, params=None, jsonrpc='2.0', _id=None, timeout=None):
+        rid = _id or self._id_counter
+        if _id is None:
+            self._id_counter += 1
+
+        return await super().call(method, params, jsonrpc, rid, timeout=timeout)
+
+    #######################
+    # HIGHT-LEVEL METHODS #
+    #######################
+
+    async def get_transaction(self, transaction_id, verbosity=True):
+        return await self.getrawtransaction(transaction_id, verbosity)
+
+    async def get_block_by_number(self, block_number):
+        return await self.getblock(block_number)
+
+    async def get_block_by_hash(self, block_hash):
+        return await self.getblock(block_hash)
+
+    ####################
+    # JSON-RPC METHODS #
+    ####################
+
+    async def getblock(self, block_id, verbose=True):
+        return await self.call('getblock', [block_id, int(verbose)])
+
+    async def getblockcount(self):
+        return await self.call('getblockcount')
+
+    async def getcontractstate(self, script_hash):
+        return await self.call('getcontractstate', [script_hash])
+
+    async def getrawtransaction(self, tx_hash, verbose=True):
+        return await self.call('getrawtransaction', [tx_hash, int(verbose)])
@@ -7,6 +7,9 @@ class NeoInstruction(Instruction):
     TODO
 
     """
+
+    __slots__ = ()
+
     def __init__(self, opcode, name,
                  operand_size, pops, pushes, fee,
                  description, operand=None,
@@ -1,6 +1,8 @@
-from octopus.platforms.BTC.explorer import BitcoinExplorerRPC
+from octopus.platforms.BTC.explorer import AsyncBitcoinExplorerRPC, BitcoinExplorerRPC
 from octopus.platforms.BTC.explorer import RPC_USER, RPC_PASSWORD, RPC_HOST
+from octopus.tests.rpc_server import StubRPCServer
 
+import asyncio
 import unittest
 
 
@@ -100,6 +102,39 @@ class BitcoinExplorerTestCase(unittest.TestCase):
         self.explorer.walletpassphrasechange()
         '''
 
+
+class BitcoinExplorerBatchTestCase(unittest.TestCase):
+
+    def testBatch(self):
+        methods = {'getblockhash': lambda height: '%064x' % height,
+                   'getblock': lambda blockhash, verbosity: {'height': int(blockhash, 16)}}
+        with StubRPCServer(methods) as server:
+            explorer = BitcoinExplorerRPC(host=server.host, port=server.port)
+            blocks = explorer.get_block_by_number_many(range(10))
+            self.assertEqual([b['height'] for b in blocks], list(range(10)))
+            # block hashes then blocks
+            self.assertEqual((server.posts, server.calls), (2, 20))
+
+    def testAsync(self):
+        methods = {'getblockhash': lambda height: '%064x' % height,
+                   'getblock': lambda blockhash, verbosity: {'height': int(blockhash, 16)},
+                   'getrawtransaction': lambda txid, verbose: {'txid': txid}}
+
+        async def crawl(explorer):
+            async with explorer:
+                blocks = await asyncio.gather(*map(explorer.get_block_by_number, range(10)))
+                tx = await explorer.get_transaction('01')
+            return blocks, tx
+
+        with StubRPCServer(methods) as server:
+            explorer = AsyncBitcoinExplorerRPC(host=server.host, port=server.port,
+                                               max_connections=2)
+            blocks, tx = asyncio.run(crawl(explorer))
+            self.assertEqual([b['height'] for b in blocks], list(range(10)))
+            self.assertEqual(tx['txid'], '01')
+            self.assertLessEqual(server.connections, 2)
+
+
 if __name__ == '__main__':
     suite = unittest.TestLoader().loadTestsFromTestCase(BitcoinExplorerTestCase)
     unittest.TextTestRunner(verbosity=2).run(suite)
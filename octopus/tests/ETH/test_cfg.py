@@ -1,6 +1,11 @@
+import os
+import tempfile
 import unittest
 
+from octopus.analysis.cache import CFGCache
 from octopus.analysis.graph import CFGGraph
+from octopus.arch.evm.cfg import EvmCFG, enum_func_static
+from octopus.arch.evm.disassembler import EvmDisassembler
 from octopus.platforms.ETH.cfg import EthereumCFG
 
 
@@ -60,7 +65,8 @@ class EthereumSymbolicExecutionTestCaseMedium(EthereumCfgTestCase):
 
     # result
     number_instr = 1353
-    number_func = 15
+    # 0x09dfdc71 is dispatched with PUSH4/DUP2/EQ
+    number_func = 16
     number_basicblock = 99
     edges = 122
 
@@ -69,6 +75,25 @@ class EthereumSymbolicExecutionTestCaseMedium(EthereumCfgTestCase):
     # graph.view()
     # graph.view_functions(simplify=True)
 
+class EthereumDispatcherTestCase(unittest.TestCase):
+
+    # PUSH1 0 CALLDATALOAD
+    # DUP1 PUSH4 0x80000000 GT PUSH1 0x18 JUMPI  (binary search split)
+    # PUSH4 0x12345678 DUP2 EQ PUSH1 0x23 JUMPI  (solc >= 0.4.2x)
+    # STOP JUMPDEST
+    # DUP1 PUSH4 0x9abcdef0 EQ PUSH1 0x25 JUMPI
+    # JUMPDEST STOP JUMPDEST STOP
+    bytecode_hex = "60003580638000000011601857631234567881146023570" \
+                   "05b80639abcdef0146025575b005b00"
+
+    def testEnumerateFunctions(self):
+        instructions = EvmDisassembler().disassemble(self.bytecode_hex)
+        functions = enum_func_static(instructions)
+        self.assertEqual([f.name for f in functions],
+                         ['Dispatcher', 'func_12345678', 'func_9abcdef0'])
+        self.assertEqual([f.start_offset for f in functions], [0, 0x23, 0x25])
+
+
 '''
 class EthereumSymbolicExecutionTestCaseBig(EthereumCfgTestCase):
 
@@ -87,6 +112,74 @@ class EthereumSymbolicExecutionTestCaseBig(EthereumCfgTestCase):
     # graph.view_ssa()
     # graph.view_functions(simplify=True)
 '''
+
+class EthereumCFGCacheTestCase(unittest.TestCase):
+
+    bytecode_hex = EthereumCfgTestCase.bytecode_hex
+
+    def setUp(self):
+        self.tmp = tempfile.TemporaryDirectory()
+        self.cache = CFGCache(self.tmp.name)
+
+    def tearDown(self):
+        self.tmp.cleanup()
+
+    def testKey(self):
+        key = self.cache.key(EvmCFG, self.bytecode_hex, analysis='static')
+        self.assertEqual(key, self.cache.key(EvmCFG, '0x' + self.bytecode_hex,
+                                             analysis='static'))
+        self.assertEqual(key, self.cache.key(EvmCFG, bytes.fromhex(self.bytecode_hex),
+                                             analysis='static'))
+        self.assertNotEqual(key, self.cache.key(EvmCFG, self.bytecode_hex,
+                                                analysis='dynamic'))
+        self.assertNotEqual(key, self.cache.key(EthereumCFG, self.bytecode_hex,
+                                                evm_analysis='static'))
+
+        # default values are part of the key
+        self.assertEqual(self.cache.key(EvmCFG, self.bytecode_hex),
+                         self.cache.key(EvmCFG, self.bytecode_hex, analysis='dynamic'))
+        self.assertEqual(self.cache.key(EthereumCFG, self.bytecode_hex),
+                         self.cache.key(EthereumCFG, self.bytecode_hex,
+                                        evm_analysis='dynamic'))
+        self.assertEqual(self.cache.key(EvmCFG, self.bytecode_hex, max_steps=None),
+                         self.cache.key(EvmCFG, self.bytecode_hex))
+        self.assertNotEqual(self.cache.key(EvmCFG, self.bytecode_hex, max_steps=100),
+                            self.cache.key(EvmCFG, self.bytecode_hex))
+
+    def testCache(self):
+        cfg = self.cache.cfg(EvmCFG, self.bytecode_hex, analysis='static')
+        self.assertEqual(len(self.cache), 1)
+        cached = self.cache.cfg(EvmCFG, self.bytecode_hex, analysis='static')
+        self.assertIsNot(cached, cfg)
+        self.assertEqual(cached.instructions, cfg.instructions)
+        self.assertEqual([str(e) for e in cached.edges], [str(e) for e in cfg.edges])
+        self.assertEqual([f.name for f in cached.functions], [f.name for f in cfg.functions])
+
+        # corrupted entry is removed
+        key = self.cache.key(EvmCFG, self.bytecode_hex, analysis='static')
+        with open(os.path.join(self.tmp.name, key + '.cfg'), 'wb') as f:
+            f.write(b'corrupted')
+        self.assertIsNone(self.cache.get(key))
+        self.assertEqual(len(self.cache), 0)
+
+    def testEviction(self):
+        def size(key):
+            return os.path.getsize(os.path.join(self.tmp.name, key + '.cfg'))
+
+        for value in range(4):
+            self.cache.put('key%d' % value, list(range(value * 1000)))
+        self.assertEqual(len(self.cache), 4)
+        # key0 is the least recently used, then key2
+        for value in range(4):
+            os.utime(os.path.join(self.tmp.name, 'key%d.cfg' % value), (value, value))
+        self.cache.get('key0')
+        self.cache.evict(size('key0') + size('key3'))
+        self.assertIsNone(self.cache.get('key1'))
+        self.assertIsNone(self.cache.get('key2'))
+        self.assertEqual(self.cache.get('key0'), list())
+        self.assertEqual(self.cache.get('key3'), list(range(3000)))
+
+
 if __name__ == '__main__':
     suite = unittest.TestLoader().loadTestsFromTestCase(EthereumCfgTestCase)
     unittest.TextTestRunner(verbosity=2).run(suite)
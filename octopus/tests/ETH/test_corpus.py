@@ -0,0 +1,69 @@
+import os
+import unittest
+
+from octopus.arch.evm.cfg import EvmCFG
+from octopus.core.utils import load_bytecode
+from octopus.platforms.ETH.corpus import (analyze_corpus, code_hash,
+                                          group_contracts, normalize_bytecode)
+
+EXAMPLE_PATH = "/../../../examples/ETH/evm_bytecode/"
+# bzzr0 metadata: a1 65 'bzzr0' 58 20 <32 bytes hash> 00 29
+SWARM_HASH = bytes.fromhex('a165627a7a72305820')
+
+
+class EthereumCorpusTestCase(unittest.TestCase):
+
+    def setUp(self):
+        path = os.path.dirname(os.path.realpath(__file__)) + EXAMPLE_PATH
+        self.greeter = bytes(load_bytecode(path + 'greeter.bytecode'))
+        self.reentrancy = bytes(load_bytecode(path + 'reentrancy.bytecode'))
+
+        # same contract, other metadata hash and constructor arguments
+        position = self.greeter.rfind(SWARM_HASH) + len(SWARM_HASH)
+        self.clone = self.greeter[:position] + b'\x42' * 32 + \
+            self.greeter[position + 32:] + (1).to_bytes(32, 'big')
+
+    def testNormalize(self):
+        code = normalize_bytecode(self.greeter)
+        self.assertEqual(normalize_bytecode(self.greeter.hex()), code)
+        self.assertEqual(normalize_bytecode(self.clone), code)
+        self.assertNotIn(SWARM_HASH, code)
+        self.assertEqual(code_hash(self.clone), code_hash(self.greeter))
+        self.assertNotEqual(code_hash(self.reentrancy), code_hash(self.greeter))
+
+    def testFactory(self):
+        # runtime code embedding the creation code of the same child contract
+        child = bytes.fromhex('6080604052' '600080fd' '6080604052' '00')
+        first = bytes.fromhex('6080604052' '6001600201' '00') + child
+        second = bytes.fromhex('6080604052' '33ff') + child
+        self.assertEqual(normalize_bytecode(first), first)
+        self.assertNotEqual(code_hash(first), code_hash(second))
+        groups = group_contracts([('first', first), ('second', second)])
+        self.assertEqual([names for _, names in groups.values()], [['first'], ['second']])
+
+    def testGroup(self):
+        contracts = [('greeter', self.greeter), ('reentrancy', self.reentrancy),
+                     ('clone', '0x' + self.clone.hex())]
+        groups = group_contracts(contracts)
+        self.assertEqual([names for _, names in groups.values()],
+                         [['greeter', 'clone'], ['reentrancy']])
+        self.assertEqual(list(groups), [code_hash(self.greeter), code_hash(self.reentrancy)])
+
+        calls = list()
+
+        def analysis(bytecode, **parameters):
+            calls.append(bytecode)
+            return len(calls)
+
+        results = list(analyze_corpus(contracts, analysis))
+        self.assertEqual(results, [(['greeter', 'clone'], 1), (['reentrancy'], 2)])
+        self.assertEqual(calls, [self.greeter, self.reentrancy])
+
+        cfgs = list(analyze_corpus(contracts, EvmCFG, analysis='static'))
+        self.assertEqual([names for names, _ in cfgs], [['greeter', 'clone'], ['reentrancy']])
+        self.assertEqual(cfgs[0][1].instructions, EvmCFG(self.greeter, analysis='static').instructions)
+
+
+if __name__ == '__main__':
+    suite = unittest.TestLoader().loadTestsFromTestCase(EthereumCorpusTestCase)
+    unittest.TextTestRunner(verbosity=2).run(suite)
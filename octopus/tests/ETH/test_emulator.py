@@ -0,0 +1,73 @@
+import unittest
+
+from octopus.arch.evm.emulator import EvmSSAEngine
+
+
+class EthereumEmulatorTestCase(unittest.TestCase):
+
+    bytecode_hex = "60606040526000357c0100000000000000000000000000000000000000000000000000000000900480635fd8c7101461004f578063c0e317fb1461005e578063f8b2cb4f1461006d5761004d565b005b61005c6004805050610099565b005b61006b600480505061013e565b005b610083600480803590602001909190505061017d565b6040518082815260200191505060405180910390f35b3373ffffffffffffffffffffffffffffffffffffffff16611111600060005060003373ffffffffffffffffffffffffffffffffffffffff16815260200190815260200160002060005054604051809050600060405180830381858888f19350505050151561010657610002565b6000600060005060003373ffffffffffffffffffffffffffffffffffffffff168152602001908152602001600020600050819055505b565b34600060005060003373ffffffffffffffffffffffffffffffffffffffff1681526020019081526020016000206000828282505401925050819055505b565b6000600060005060008373ffffffffffffffffffffffffffffffffffffffff1681526020019081526020016000206000505490506101b6565b91905056"
+
+    def testSuspendResume(self):
+        emul = EvmSSAEngine(self.bytecode_hex)
+        self.assertTrue(emul.emulate())
+        self.assertFalse(emul.suspended)
+
+        # same exploration, suspended every 50 instructions
+        emul_steps = EvmSSAEngine(self.bytecode_hex, max_steps=50)
+        complete = emul_steps.emulate()
+        resume = 0
+        while not complete:
+            self.assertTrue(emul_steps.suspended)
+            complete = emul_steps.resume()
+            resume += 1
+
+        self.assertGreater(resume, 0)
+        self.assertEqual(emul_steps.states_total, emul.states_total)
+        # an explicit 0 doesn't fall back to the engine limits
+        emul_zero = EvmSSAEngine(self.bytecode_hex, max_steps=50)
+        self.assertFalse(emul_zero.emulate())
+        states_total = emul_zero.states_total
+        self.assertFalse(emul_zero.resume(max_steps=0))
+        self.assertFalse(emul_zero.resume(max_paths=0))
+        self.assertEqual(emul_zero.states_total, states_total)
+        self.assertEqual(list(emul_steps.edges), list(emul.edges))
+
+    def testBlockStep(self):
+        emul = EvmSSAEngine(self.bytecode_hex)
+        self.assertTrue(emul.block_step)
+        emul.emulate()
+
+        # same exploration, instruction by instruction
+        emul_instr = EvmSSAEngine(self.bytecode_hex)
+        emul_instr.block_step = False
+        emul_instr.emulate()
+
+        self.assertEqual(emul.states_total, emul_instr.states_total)
+        self.assertEqual(list(emul.edges), list(emul_instr.edges))
+        self.assertEqual([bb.instructions_ssa() for bb in emul.basicblocks],
+                         [bb.instructions_ssa() for bb in emul_instr.basicblocks])
+
+        # dispatcher first block: PUSH1 0x60 PUSH1 0x40 MSTORE ... JUMPI
+        summary = emul.basicblocks[0].summary
+        self.assertIsNotNone(summary.ops)
+        self.assertEqual(summary.pops, 0)
+        self.assertEqual(summary.constants[:2], (0x60, 0x40))
+
+    def testNestedJumpTarget(self):
+        # PUSH1 0x10 PUSH1 0x02 ADD PUSH4 0xffffffff AND PUSH1 0x01 ADD JUMP
+        # STOP STOP STOP STOP JUMPDEST STOP
+        emul = EvmSSAEngine('601060020163ffffffff1660010156000000005b00')
+        emul.emulate()
+        self.assertEqual([(e.node_from, e.node_to) for e in emul.edges],
+                         [('block_0', 'block_13')])
+
+    def testMaxPaths(self):
+        emul = EvmSSAEngine(self.bytecode_hex, max_paths=1)
+        self.assertFalse(emul.emulate())
+        # only the dispatcher first block has been explored
+        self.assertEqual(len(emul.edges), 2)
+
+
+if __name__ == '__main__':
+    suite = unittest.TestLoader().loadTestsFromTestCase(EthereumEmulatorTestCase)
+    unittest.TextTestRunner(verbosity=2).run(suite)
@@ -1,5 +1,10 @@
-from octopus.platforms.ETH.explorer import EthereumInfuraExplorer
+from octopus.engine.explorer import Explorer, RPCError
+from octopus.platforms.ETH.explorer import (AsyncEthereumExplorerRPC, EthereumExplorerRPC,
+                                            EthereumInfuraExplorer)
+from octopus.tests.rpc_server import StubRPCServer
 
+import asyncio
+import time
 import unittest
 
 
@@ -61,6 +66,119 @@ class EthereumExplorerTestCase(unittest.TestCase):
         # self.assertEqual(type(self.explorer.eth_newBlockFilter()), str)
 
 
+class EthereumExplorerBatchTestCase(unittest.TestCase):
+
+    @staticmethod
+    def get_block(number, tx_objects):
+        if int(number, 16) >= 1000:
+            raise ValueError('unknown block')
+        return {'number': number, 'transactions': []}
+
+    def setUp(self):
+        self.server = StubRPCServer({
+            'eth_getBlockByNumber': self.get_block,
+            'eth_getCode': lambda address, block: '0x60' + address[-2:],
+            'eth_getTransactionReceipt': lambda tx_hash: {'transactionHash': tx_hash}})
+        self.server.__enter__()
+        self.explorer = EthereumExplorerRPC(host=self.server.host, port=self.server.port)
+
+    def tearDown(self):
+        self.server.__exit__()
+
+    def testBatch(self):
+        self.explorer.batch_size = 40
+        blocks = self.explorer.get_block_by_number_many(range(100))
+        self.assertEqual([int(b['number'], 16) for b in blocks], list(range(100)))
+        self.assertEqual((self.server.posts, self.server.calls), (3, 100))
+
+        codes = self.explorer.eth_getCode_many(['0x%040x' % i for i in range(3)], batch_size=2)
+        self.assertEqual(codes, ['0x6000', '0x6001', '0x6002'])
+        receipts = self.explorer.eth_getTransactionReceipt_many(['0x01', '0x02'])
+        self.assertEqual([r['transactionHash'] for r in receipts], ['0x01', '0x02'])
+        self.assertEqual(self.explorer.batch([]), [])
+
+    def testBatchErrors(self):
+        with self.assertRaises(RPCError) as context:
+            self.explorer.eth_getBlockByNumber_many([998, 999, 1000, 1001])
+        self.assertEqual(context.exception.method, 'eth_getBlockByNumber')
+        self.assertEqual(context.exception.params, ['0x3e8', True])
+
+        results = self.explorer.batch([('eth_getBlockByNumber', ['0x1', False]),
+                                       ('eth_getBlockByNumber', ['0x3e8', False]),
+                                       ('eth_unknown', [])], raise_errors=False)
+        self.assertEqual(results[0]['number'], '0x1')
+        self.assertEqual(results[1].message, 'unknown block')
+        self.assertEqual(results[2].code, -32601)
+
+    def testNotImplemented(self):
+        explorer = Explorer(host=self.server.host, port=self.server.port)
+        for method, params in ((explorer.get_transaction_many, (['0x01'], True)),
+                               (explorer.get_block_by_number_many, ([1],)),
+                               (explorer.get_block_by_hash_many, (['0x01'],))):
+            with self.assertRaises(NotImplementedError):
+                method(*params)
+
+
+class AsyncEthereumExplorerTestCase(unittest.TestCase):
+
+    @staticmethod
+    def get_block(number, tx_objects):
+        # a slow node
+        time.sleep(0.01)
+        return {'number': number}
+
+    def setUp(self):
+        self.server = StubRPCServer({
+            'eth_getBlockByNumber': self.get_block,
+            'eth_getCode': lambda address, block: '0x60' + address[-2:],
+            'eth_getTransactionByHash': lambda tx_hash: None,
+            # a stalled node
+            'eth_syncing': lambda: time.sleep(0.5)})
+        self.server.__enter__()
+
+    def tearDown(self):
+        self.server.__exit__()
+
+    async def crawl(self, numbers, max_connections):
+        async with AsyncEthereumExplorerRPC(host=self.server.host, port=self.server.port,
+                                            max_connections=max_connections) as explorer:
+            blocks = await asyncio.gather(*(explorer.get_block_by_number(number)
+                                            for number in numbers))
+            codes = await explorer.call_many('eth_getCode', [['0x%040x' % i, 'latest']
+                                                             for i in range(3)])
+            tx = await explorer.get_transaction('0x01')
+            with self.assertRaises(RPCError):
+                await explorer.call('eth_unknown')
+            return blocks, codes, tx
+
+    def testCrawl(self):
+        blocks, codes, tx = asyncio.run(self.crawl(range(50), 8))
+        self.assertEqual([int(b['number'], 16) for b in blocks], list(range(50)))
+        self.assertEqual(codes, ['0x6000', '0x6001', '0x6002'])
+        self.assertIsNone(tx)
+        # requests are sent concurrently on at most 8 pooled connections
+        self.assertEqual(self.server.posts, 50 + 3 + 2)
+        self.assertLessEqual(self.server.connections, 8)
+        self.assertLessEqual(self.server.max_in_flight, 8)
+        self.assertGreater(self.server.max_in_flight, 1)
+
+    async def stall(self):
+        async with AsyncEthereumExplorerRPC(host=self.server.host, port=self.server.port,
+                                            timeout=0.1) as explorer:
+            with self.assertRaises(asyncio.TimeoutError):
+                await explorer.call('eth_syncing')
+            # the connection of the timed out request is not reused
+            self.assertEqual(explorer._connections, [])
+            with self.assertRaises(asyncio.TimeoutError):
+                await explorer.call_many('eth_syncing', [[]], timeout=0.05)
+            self.assertIsNone(await explorer.call('eth_syncing', timeout=1))
+            return len(explorer._connections)
+
+    def testTimeout(self):
+        self.assertEqual(asyncio.run(self.stall()), 1)
+        self.assertEqual(self.server.connections, 3)
+
+
 if __name__ == '__main__':
     suite = unittest.TestLoader().loadTestsFromTestCase(EthereumExplorerTestCase)
     unittest.TextTestRunner(verbosity=2).run(suite)
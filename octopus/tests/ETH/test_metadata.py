@@ -0,0 +1,90 @@
+import os
+import unittest
+
+from octopus.arch.evm.disassembler import EvmDisassembler
+from octopus.arch.evm.metadata import (decode_cbor, find_metadata,
+                                       find_runtime_code)
+from octopus.core.utils import load_bytecode
+from octopus.platforms.ETH.corpus import code_hash
+
+EXAMPLE_PATH = "/../../../examples/ETH/evm_bytecode/"
+
+HASH = bytes(range(32))
+# solc 0.5.9: {'bzzr1': <hash>, 'solc': b'\x00\x05\x09'}
+BZZR1 = bytes.fromhex('a265627a7a72315820') + HASH + \
+    bytes.fromhex('64736f6c6343000509') + bytes.fromhex('0032')
+# solc 0.6.12: {'ipfs': <sha2-256 multihash>, 'solc': b'\x00\x06\x0c'}
+IPFS = bytes.fromhex('a2646970667358221220') + HASH + \
+    bytes.fromhex('64736f6c634300060c') + bytes.fromhex('0033')
+
+
+class EthereumMetadataTestCase(unittest.TestCase):
+
+    def setUp(self):
+        path = os.path.dirname(os.path.realpath(__file__)) + EXAMPLE_PATH
+        self.greeter = bytes(load_bytecode(path + 'greeter.bytecode'))
+        self.runtime = self.greeter[find_runtime_code(self.greeter):]
+        start, _, _ = find_metadata(self.runtime)
+        self.code = self.runtime[:start]
+
+    def testDecodeCbor(self):
+        self.assertEqual(decode_cbor(bytes.fromhex('1903e8')), (1000, 3))
+        self.assertEqual(decode_cbor(bytes.fromhex('820120')), ([1, -1], 3))
+        self.assertEqual(decode_cbor(bytes.fromhex('a16161f5')), ({'a': True}, 4))
+        metadata, end = decode_cbor(BZZR1)
+        self.assertEqual(metadata, {'bzzr1': HASH, 'solc': b'\x00\x05\x09'})
+        self.assertEqual(end, len(BZZR1) - 2)
+        for data in (b'', bytes.fromhex('5820'), bytes.fromhex('1f')):
+            with self.assertRaises(ValueError):
+                decode_cbor(data)
+        # nesting is limited
+        self.assertEqual(decode_cbor(bytes.fromhex('8181818100')), ([[[[0]]]], 5))
+        with self.assertRaises(ValueError):
+            decode_cbor(bytes.fromhex('818181818100'))
+        with self.assertRaises(ValueError):
+            decode_cbor(b'\x81' * 3000 + b'\x00')
+
+    def testFindMetadata(self):
+        # bzzr0 of the example
+        start, end, metadata = find_metadata(self.runtime)
+        self.assertEqual(end, len(self.runtime))
+        self.assertEqual(list(metadata), ['bzzr0'])
+        # no metadata
+        self.assertIsNone(find_metadata(self.code))
+        self.assertIsNone(find_metadata(self.code + bytes.fromhex('a00001')))
+
+        for trailer in (BZZR1, IPFS):
+            code = self.code + trailer
+            self.assertEqual(find_metadata(code)[:2], (len(self.code), len(code)))
+            # followed by constructor arguments
+            start, end, metadata = find_metadata(code + bytes(64))
+            self.assertEqual((start, end), (len(self.code), len(code)))
+            self.assertEqual(metadata['solc'], trailer[-5:-2])
+
+        # the length points to deeply nested arrays, not to a map
+        nested = b'\x81' * 3000 + b'\x00'
+        code = self.code + nested + len(nested).to_bytes(2, 'big')
+        self.assertIsNone(find_metadata(code))
+        self.assertTrue(EvmDisassembler().disassemble(code))
+
+    def testDisassembler(self):
+        args = (42).to_bytes(32, 'big')
+        loader = self.greeter[:find_runtime_code(self.greeter)]
+        self.assertEqual(find_runtime_code(self.code), -1)
+
+        disasm = EvmDisassembler(loader + self.code + IPFS + args)
+        disasm.analysis()
+        self.assertEqual(disasm.loader_code, loader)
+        self.assertEqual(disasm.bytecode, self.code)
+        self.assertEqual(disasm.swarm_hash, IPFS)
+        self.assertEqual(disasm.metadata['ipfs'], b'\x12\x20' + HASH)
+        self.assertEqual(disasm.constructor_args, args)
+
+        # the same code compiled with other metadata is grouped
+        self.assertEqual(code_hash(self.greeter),
+                         code_hash((loader + self.code + BZZR1 + args).hex()))
+
+
+if __name__ == '__main__':
+    suite = unittest.TestLoader().loadTestsFromTestCase(EthereumMetadataTestCase)
+    unittest.TextTestRunner(verbosity=2).run(suite)
@@ -0,0 +1,54 @@
+import json
+import os
+import tempfile
+import unittest
+
+from octopus.arch.evm.signatures import (SignatureDatabase,
+                                         BinarySignatureDatabase,
+                                         write_binary_signatures)
+
+
+class EthereumSignaturesTestCase(unittest.TestCase):
+
+    signatures = {'set(uint256)': '0x60fe47b1',
+                  'get()': '0x6d4ce63c',
+                  'collate_propagate_storage(bytes16)': '0x42966c68',
+                  'burn(uint256)': '0x42966c68'}
+
+    def setUp(self):
+        self.directory = tempfile.TemporaryDirectory()
+        self.json_path = os.path.join(self.directory.name, 'signatures.json')
+        with open(self.json_path, 'w') as f:
+            json.dump(self.signatures, f)
+
+    def tearDown(self):
+        self.directory.cleanup()
+
+    def check(self, db):
+        self.assertEqual(len(db), 3)
+        self.assertEqual(db.lookup(0x60fe47b1), ['set(uint256)'])
+        self.assertEqual(sorted(db.lookup(0x42966c68)),
+                         ['burn(uint256)', 'collate_propagate_storage(bytes16)'])
+        self.assertEqual(db.lookup(0xdeadbeef), [])
+        self.assertIn(0x6d4ce63c, db)
+        self.assertNotIn(0, db)
+
+    def testJson(self):
+        self.check(SignatureDatabase(self.json_path))
+
+    def testBinary(self):
+        bin_path = os.path.join(self.directory.name, 'signatures.bin')
+        write_binary_signatures(SignatureDatabase(self.json_path).index, bin_path)
+        self.check(BinarySignatureDatabase(bin_path))
+
+    def testMissing(self):
+        path = os.path.join(self.directory.name, 'missing.json')
+        db = SignatureDatabase(path)
+        self.assertEqual(len(db), 0)
+        self.assertEqual(db.lookup(0x60fe47b1), [])
+        self.assertEqual(BinarySignatureDatabase(path).lookup(0x60fe47b1), [])
+
+
+if __name__ == '__main__':
+    suite = unittest.TestLoader().loadTestsFromTestCase(EthereumSignaturesTestCase)
+    unittest.TextTestRunner(verbosity=2).run(suite)
@@ -0,0 +1,46 @@
+import unittest
+
+from octopus.arch.evm.ssa import EvmSSASimplifier
+
+TT256M1 = 2 ** 256 - 1
+
+
+class EthereumSSASimplifierTestCase(unittest.TestCase):
+
+    values = [0, 1, 0x20, 0x40, 2 ** 255, TT256M1, TT256M1 - 0x1f]
+
+    def testConcreteMatchZ3(self):
+        simplifier = EvmSSASimplifier()
+        for name in ['ADD', 'SUB', 'MUL', 'AND', 'OR', 'XOR']:
+            z3_operation = simplifier._dispatch_function[name]
+            for s0 in self.values:
+                for s1 in self.values:
+                    self.assertEqual(simplifier.symbolic_dispatcher(name, [s0, s1]),
+                                     z3_operation(s0, s1), (name, s0, s1))
+
+    def testConcrete(self):
+        simplifier = EvmSSASimplifier()
+        tests = [('ADD', [TT256M1, 2], 1),
+                 ('SUB', [0, 1], TT256M1),
+                 ('DIV', [0x40, 0x20], 2),
+                 ('DIV', [1, 0], 0),
+                 ('SDIV', [TT256M1 - 9, 2], TT256M1 - 4),  # -10 / 2
+                 ('SMOD', [TT256M1 - 9, 3], TT256M1),  # -10 % 3
+                 ('ADDMOD', [TT256M1, 2, 10], (TT256M1 + 2) % 10),
+                 ('EXP', [2, 256], 0),
+                 ('EXP', [2, 0xa0], 2 ** 0xa0),
+                 ('NOT', [0], TT256M1),
+                 ('BYTE', [31, 0x1234], 0x34),
+                 ('SIGNEXTEND', [0, 0xff], TT256M1),
+                 ('ISZERO', [0], 1),
+                 ('LT', [1, TT256M1], 1),
+                 ('SLT', [1, TT256M1], 0),
+                 ('SGT', [1, TT256M1], 1)]
+        for name, values, result in tests:
+            self.assertEqual(simplifier.symbolic_dispatcher(name, values), result,
+                             (name, values))
+
+
+if __name__ == '__main__':
+    suite = unittest.TestLoader().loadTestsFromTestCase(EthereumSSASimplifierTestCase)
+    unittest.TextTestRunner(verbosity=2).run(suite)
@@ -0,0 +1,72 @@
+from octopus.arch.evm.vmstate import EvmVMstate
+from octopus.engine.states import (states_history, LastStatesHistory,
+                                   STATES_NONE, STATES_BLOCK, STATES_DISK)
+
+import unittest
+
+
+class EthereumVMstateTestCase(unittest.TestCase):
+
+    def testFork(self):
+        state = EvmVMstate()
+        for value in range(4):
+            state.ssa_stack.append(value)
+        state.storage[0] = 1
+
+        new_state = state.fork()
+        new_state.ssa_stack.pop()
+        new_state.ssa_stack.append(42)
+        # SWAP1
+        new_state.ssa_stack[-1], new_state.ssa_stack[-2] = \
+            new_state.ssa_stack[-2], new_state.ssa_stack[-1]
+        new_state.storage[0] = 2
+        new_state.pc = 10
+
+        self.assertEqual(list(state.ssa_stack), [0, 1, 2, 3])
+        self.assertEqual(list(new_state.ssa_stack), [0, 1, 42, 2])
+        self.assertEqual(state.ssa_stack[0], 0)
+        self.assertEqual(state.storage, {0: 1})
+        self.assertEqual(new_state.storage, {0: 2})
+        self.assertEqual(state.pc, 0)
+
+    def testStackUnderflow(self):
+        state = EvmVMstate()
+        with self.assertRaises(IndexError):
+            state.ssa_stack.pop()
+        state.ssa_stack.append(1)
+        with self.assertRaises(IndexError):
+            state.ssa_stack[-2]
+
+    def testStackEquality(self):
+        state = EvmVMstate()
+        state.ssa_stack.append(1)
+        self.assertEqual(state.ssa_stack, [1])
+        self.assertEqual(state.ssa_stack, state.fork().ssa_stack)
+        self.assertNotEqual(state.ssa_stack, None)
+        self.assertNotEqual(state.ssa_stack, 1)
+        self.assertNotEqual(state.ssa_stack, (1,))
+
+
+    def testStatesHistory(self):
+
+        def save_states(history):
+            state = EvmVMstate()
+            for index in range(10):
+                state.pc = index
+                if history.save(index, state, block_entry=(index % 5 == 0)):
+                    state = state.fork()
+            return history
+
+        self.assertEqual(len(save_states(states_history(STATES_NONE))), 0)
+        history = save_states(states_history(LastStatesHistory(3)))
+        self.assertEqual(list(history), [7, 8, 9])
+        history = save_states(states_history(STATES_BLOCK))
+        self.assertEqual([s.pc for s in history.values()], [0, 5])
+        history = save_states(states_history(STATES_DISK))
+        self.assertEqual(len(history), 10)
+        self.assertEqual(history[4].pc, 4)
+
+
+if __name__ == '__main__':
+    suite = unittest.TestLoader().loadTestsFromTestCase(EthereumVMstateTestCase)
+    unittest.TextTestRunner(verbosity=2).run(suite)
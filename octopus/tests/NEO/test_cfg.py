@@ -1,5 +1,7 @@
 
 from octopus.analysis.graph import Graph, CFGGraph
+from octopus.core.edge import (Edge, EdgeSet,
+                               EDGE_CONDITIONAL_TRUE, EDGE_FALLTHROUGH)
 from octopus.platforms.NEO.disassembler import NeoDisassembler
 from octopus.platforms.NEO.cfg import NeoCFG
 from octopus.platforms.NEO.cfg import (enum_blocks_edges,
@@ -45,6 +47,35 @@ class NeoCfgTestCase(unittest.TestCase):
         self.assertEqual(len(all_bb), self.number_basicblock)
         self.assertEqual(len(all_bb), len(self.cfg.basicblocks))
 
+    def testEdgesUnique(self):
+        edges = list(self.cfg.edges)
+        self.assertEqual(len(edges), len(set(edges)))
+
+    def testEdgeSet(self):
+        edges = EdgeSet()
+        edges.add(Edge('block_0', 'block_10', EDGE_CONDITIONAL_TRUE))
+        edges.add(Edge('block_0', 'block_10', EDGE_CONDITIONAL_TRUE))
+        edges.add(Edge('block_0', 'block_10', EDGE_FALLTHROUGH))
+        self.assertEqual(len(edges), 2)
+        self.assertIn(Edge('block_0', 'block_10', EDGE_CONDITIONAL_TRUE), edges)
+        self.assertEqual(edges.count(Edge('block_0', 'block_10',
+                                          EDGE_CONDITIONAL_TRUE)), 2)
+        self.assertEqual([e.type for e in edges],
+                         [EDGE_CONDITIONAL_TRUE, EDGE_FALLTHROUGH])
+        # list compatibility
+        self.assertEqual(edges[-1].type, EDGE_FALLTHROUGH)
+        self.assertEqual(len(edges + [edges[0]]), 3)
+        edges.sort(key=lambda e: e.type)
+        self.assertEqual(edges[0].type, EDGE_CONDITIONAL_TRUE)
+        edges.sort(key=lambda e: e.type, reverse=True)
+        self.assertEqual(edges[0].type, EDGE_FALLTHROUGH)
+        edges.sort()
+        self.assertEqual(edges[0].type, EDGE_CONDITIONAL_TRUE)
+        edges.add(Edge('block_10', 'block_20', EDGE_FALLTHROUGH))
+        self.assertEqual(edges[2].node_from, 'block_10')
+        self.assertEqual([edges[i] for i in range(len(edges))], list(edges))
+        self.assertFalse(hasattr(edges, 'append'))
+
 
 class NeoCfgTestCaseMedium(NeoCfgTestCase):
 
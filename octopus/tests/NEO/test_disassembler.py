@@ -30,6 +30,10 @@ class NeoDisassemblerTestCase(unittest.TestCase):
         disasm(bytecode, result)
         disassemble(bytecode_hex, 36)
 
+        # truncated bytecode
+        self.assertEqual(NeoDisassembler().disassemble('68', r_format='text'), 'SYSCALL')
+        self.assertEqual(NeoDisassembler().disassemble('6803aa', r_format='text'), 'SYSCALL 0xaa')
+
 if __name__ == '__main__':
     suite = unittest.TestLoader().loadTestsFromTestCase(NeoDisassembler)
     unittest.TextTestRunner(verbosity=2).run(suite)
@@ -1,4 +1,5 @@
 from octopus.platforms.NEO.explorer import NeoExplorerRPC
+from octopus.tests.rpc_server import StubRPCServer
 
 import unittest
 
@@ -62,6 +63,20 @@ class NeoExplorerTestCase(unittest.TestCase):
         sendmany
         '''
 
+class NeoExplorerBatchTestCase(unittest.TestCase):
+
+    def testBatch(self):
+        methods = {'getblock': lambda index, verbose: {'index': index},
+                   'getrawtransaction': lambda txid, verbose: {'txid': txid}}
+        with StubRPCServer(methods) as server:
+            explorer = NeoExplorerRPC(host=server.host, port=server.port)
+            blocks = explorer.get_block_by_number_many(range(150))
+            self.assertEqual([b['index'] for b in blocks], list(range(150)))
+            self.assertEqual(server.posts, 2)
+            txs = explorer.get_transaction_many(['0x01', '0x02'])
+            self.assertEqual([tx['txid'] for tx in txs], ['0x01', '0x02'])
+
+
 if __name__ == '__main__':
     suite = unittest.TestLoader().loadTestsFromTestCase(NeoExplorerTestCase)
     unittest.TextTestRunner(verbosity=2).run(suite)
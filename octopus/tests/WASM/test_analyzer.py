@@ -0,0 +1,56 @@
+import mmap
+import unittest
+import os
+
+from octopus.arch.wasm.analyzer import WasmModuleAnalyzer
+from octopus.arch.wasm.cfg import WasmCFG
+from octopus.core.utils import load_bytecode
+
+from wasm.modtypes import SEC_CODE, SEC_TYPE
+
+EXAMPLE_PATH = "/../../../examples/wasm/samples/"
+
+
+class WasmAnalyzerTestCase(unittest.TestCase):
+
+    def setUp(self):
+        path = os.path.dirname(os.path.realpath(__file__)) + EXAMPLE_PATH
+        with open(path + 'fib.wasm', 'rb') as f:
+            self.bytecode = f.read()
+
+    def testLazySections(self):
+        analyzer = WasmModuleAnalyzer(self.bytecode)
+        self.assertEqual(analyzer.magic, b'\x00asm')
+        self.assertEqual(analyzer.version, b'\x01\x00\x00\x00')
+        self.assertEqual([s[0] for s in analyzer.sections], [1, 3, 4, 5, 6, 7, 10])
+        # nothing decoded yet
+        self.assertEqual(analyzer._sections_data, {})
+
+        self.assertEqual(len(analyzer.codes), 1)
+        self.assertEqual(list(analyzer._sections_data), [SEC_CODE])
+        self.assertEqual(analyzer.types, [('i32', 'i32')])
+        self.assertEqual(list(analyzer._sections_data), [SEC_CODE, SEC_TYPE])
+
+        self.assertEqual(analyzer.func_prototypes, [('fib', 'i32', 'i32', 'export')])
+        self.assertEqual(analyzer.imports_func, [])
+        self.assertIsNone(analyzer.start)
+
+    def testSharedAnalyzer(self):
+        analyzer = WasmModuleAnalyzer(self.bytecode)
+        cfg = WasmCFG(self.bytecode, analyzer=analyzer)
+        self.assertIs(cfg.analyzer, analyzer)
+        self.assertEqual([f.name for f in cfg.functions], ['fib'])
+
+    def testMappedModule(self):
+        path = os.path.dirname(os.path.realpath(__file__)) + EXAMPLE_PATH
+        module = load_bytecode(path + 'fib.wasm')
+        self.assertIsInstance(module, mmap.mmap)
+        analyzer = WasmModuleAnalyzer(module)
+        self.assertEqual(str(analyzer), str(WasmModuleAnalyzer(self.bytecode)))
+        cfg = WasmCFG(module, analyzer=analyzer)
+        self.assertEqual(len(cfg.basicblocks), len(WasmCFG(self.bytecode).basicblocks))
+
+
+if __name__ == '__main__':
+    suite = unittest.TestLoader().loadTestsFromTestCase(WasmAnalyzerTestCase)
+    unittest.TextTestRunner(verbosity=2).run(suite)
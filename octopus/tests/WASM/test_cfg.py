@@ -1,7 +1,11 @@
 import unittest
 import os
+import tempfile
 
-from octopus.arch.wasm.cfg import WasmCFG
+from octopus.analysis.cache import CFGCache
+from octopus.arch.wasm.cfg import WasmCFG, enum_blocks_edges, enum_control_blocks
+from octopus.arch.wasm.disassembler import WasmDisassembler
+from octopus.core.utils import load_bytecode
 
 EXAMPLE_PATH = "/../../../examples/wasm/samples/"
 
@@ -60,6 +64,57 @@ class WasmCFGraphTestCase(unittest.TestCase):
         callgraph(module_bytecode, r_nodes2, len_call_edges, fname=False)
         controlflowgraph(module_bytecode, 3, 10, 9)
 
+    def testParallelCFG(self):
+        path = os.path.dirname(os.path.realpath(__file__)) + EXAMPLE_PATH
+        with open(path + "hello_wasm_studio.wasm", 'rb') as f:
+            module_bytecode = f.read()
+
+        cfg = WasmCFG(module_bytecode)
+        cfg_pool = WasmCFG(module_bytecode, workers=2)
+        self.assertEqual([f.name for f in cfg_pool.functions],
+                         [f.name for f in cfg.functions])
+        self.assertEqual([b.name for b in cfg_pool.basicblocks],
+                         [b.name for b in cfg.basicblocks])
+        self.assertEqual([str(e) for e in cfg_pool.edges],
+                         [str(e) for e in cfg.edges])
+        # instructions are rebuilt from the opcodes table when unpickled
+        self.assertEqual(cfg_pool.functions[1].instructions,
+                         cfg.functions[1].instructions)
+
+    def testControlBlocks(self):
+        # block loop i32.const 0 br_if 1 br 0 end end end
+        instructions = WasmDisassembler().disassemble(bytes.fromhex('0240034041000d010c000b0b0b'))
+        func, blocks, branches = enum_control_blocks(instructions)
+        self.assertEqual((func.start, func.end), (0, 12))
+        self.assertEqual([(b.depth, b.start, b.end, b.name) for b in blocks.values()],
+                         [(1, 0, 11, 'block'), (2, 2, 10, 'loop')])
+        # br_if 1 target the block, br 0 the loop
+        self.assertEqual([(inst.offset, targets) for inst, targets in branches],
+                         [(6, [blocks[0]]), (8, [blocks[2]])])
+
+        basicblocks, edges = enum_blocks_edges(0, instructions)
+        self.assertEqual(instructions[3].xref, [11])
+        self.assertEqual(instructions[4].xref, [2])
+        self.assertEqual(sorted((e.node_from, e.node_to) for e in edges),
+                         [('block_0_0', 'block_0_2'), ('block_0_2', 'block_0_8'),
+                          ('block_0_2', 'block_0_b'), ('block_0_8', 'block_0_2'),
+                          ('block_0_a', 'block_0_b')])
+
+    def testCache(self):
+        path = os.path.dirname(os.path.realpath(__file__)) + EXAMPLE_PATH
+        module_bytecode = load_bytecode(path + "hello_wasm_studio.wasm")
+
+        with tempfile.TemporaryDirectory() as cache_path:
+            cache = CFGCache(cache_path)
+            cfg = cache.cfg(WasmCFG, module_bytecode)
+            # the number of workers doesn't change the CFG
+            cached = cache.cfg(WasmCFG, module_bytecode, workers=2)
+            self.assertEqual(len(cache), 1)
+        self.assertEqual([str(e) for e in cached.edges], [str(e) for e in cfg.edges])
+        self.assertEqual(cached.module_bytecode, module_bytecode[:])
+        # sections are decoded again by the analyzer
+        self.assertEqual(cached.analyzer.func_prototypes, cfg.analyzer.func_prototypes)
+
 if __name__ == '__main__':
     suite = unittest.TestLoader().loadTestsFromTestCase(WasmCFGraphTestCase)
     unittest.TextTestRunner(verbosity=2).run(suite)
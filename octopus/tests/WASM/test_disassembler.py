@@ -1,7 +1,10 @@
+import mmap
 import unittest
 import os
 
+from octopus.arch.wasm.analyzer import WasmModuleAnalyzer
 from octopus.arch.wasm.disassembler import WasmDisassembler
+from octopus.arch.wasm.wasm import _decode_table
 
 EXAMPLE_PATH = "/../../../examples/wasm/samples/"
 
@@ -53,6 +56,40 @@ class WasmDisassemblerTestCase(unittest.TestCase):
         module_bytecode = read_file(path + "fib.wasm")
         disasmModule(module_bytecode, 1, 20)
 
+    def testClassification(self):
+        # block get_local 0 i32.const 2 i32.lt_s br_if 0 return end
+        instructions = WasmDisassembler().disassemble('024020004102480d000f0b')
+        self.assertEqual([i.group for i in instructions],
+                         ['Control', 'Variable', 'Constant', 'Logical_i32',
+                          'Control', 'Control', 'Control'])
+        block, _, const, lt_s, br_if, ret, end = instructions
+        self.assertTrue(block.is_block_starter and block.is_control)
+        self.assertTrue(const.is_constant and lt_s.is_logical_i32)
+        self.assertTrue(br_if.is_branch_conditional and br_if.is_terminator)
+        self.assertFalse(br_if.is_branch_unconditional)
+        self.assertTrue(ret.is_halt and ret.is_terminator)
+        self.assertTrue(end.is_block_terminator)
+        self.assertIs(end.descriptor, _decode_table[0x0b])
+
+    def testIterFunctions(self):
+        path = os.path.dirname(os.path.realpath(__file__)) + EXAMPLE_PATH
+        with open(path + "hello_wasm_studio.wasm", 'rb') as f:
+            # code bodies decoded by the wasm package
+            codes = WasmModuleAnalyzer(f.read()).codes
+            module = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+        expected = [WasmDisassembler().disassemble(code) for code in codes]
+        self.assertEqual(len(expected), 20)
+
+        with module:
+            funcs = WasmDisassembler().iter_functions(module)
+            # function index, after the 6 imported functions
+            index, func = next(funcs)
+            self.assertEqual(index, 6)
+            self.assertEqual(func.instructions, expected[0])
+            result = list((index, func.instructions) for index, func in funcs)
+        self.assertEqual(result, list(enumerate(expected, 6))[1:])
+
+
 if __name__ == '__main__':
     suite = unittest.TestLoader().loadTestsFromTestCase(WasmDisassemblerTestCase)
     unittest.TextTestRunner(verbosity=2).run(suite)
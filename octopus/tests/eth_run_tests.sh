@@ -3,4 +3,16 @@
 echo '[*] ETH Disassembler [*]'
 python3 -m unittest ETH/test_disassembler.py
 echo '[*] ETH ControlFlowGraph analysis [*]'
-python3 -m unittest ETH/test_cfg.py
\ No newline at end of file
+python3 -m unittest ETH/test_cfg.py
+echo '[*] ETH VM state [*]'
+python3 -m unittest ETH/test_vmstate.py
+echo '[*] ETH Emulator [*]'
+python3 -m unittest ETH/test_emulator.py
+echo '[*] ETH Signatures database [*]'
+python3 -m unittest ETH/test_signatures.py
+echo '[*] ETH SSA [*]'
+python3 -m unittest ETH/test_ssa.py
+echo '[*] ETH Corpus [*]'
+python3 -m unittest ETH/test_corpus.py
+echo '[*] ETH Metadata [*]'
+python3 -m unittest ETH/test_metadata.py
\ No newline at end of file
@@ -0,0 +1,92 @@
+import json
+import threading
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+
+class StubRPCServer(object):
+    """Local JSON-RPC server for the explorer tests
+
+    methods is a dict {name: callable(*params)}, an exception raised
+    by a method is returned as a JSON-RPC error object.
+    Batch responses are sent in reverse order, clients have to match
+    them by id.
+
+    :Example:
+
+    >>> with StubRPCServer({'getblockcount': lambda: 42}) as server:
+    ...     explorer = NeoExplorerRPC(host=server.host, port=server.port)
+    """
+
+    def __init__(self, methods):
+        self.methods = methods
+        # number of HTTP connections, HTTP requests and JSON-RPC calls received
+        self.connections = 0
+        self.posts = 0
+        self.calls = 0
+        # maximum number of HTTP requests handled at the same time
+        self.max_in_flight = 0
+        self._in_flight = 0
+        self._lock = threading.Lock()
+        self.server = ThreadingHTTPServer(('127.0.0.1', 0), self._handler())
+        self.server.daemon_threads = True
+        self.host, self.port = self.server.server_address
+        self._thread = threading.Thread(target=self.server.serve_forever, daemon=True)
+
+    def _handler(self):
+        stub = self
+
+        class Handler(BaseHTTPRequestHandler):
+            protocol_version = 'HTTP/1.1'
+
+            def setup(self):
+                BaseHTTPRequestHandler.setup(self)
+                with stub._lock:
+                    stub.connections += 1
+
+            def do_POST(self):
+                request = json.loads(self.rfile.read(int(self.headers['Content-Length'])))
+                with stub._lock:
+                    stub.posts += 1
+                    stub._in_flight += 1
+                    stub.max_in_flight = max(stub.max_in_flight, stub._in_flight)
+                try:
+                    if isinstance(request, list):
+                        response = [stub.dispatch(item) for item in reversed(request)]
+                    else:
+                        response = stub.dispatch(request)
+                finally:
+                    with stub._lock:
+                        stub._in_flight -= 1
+                data = json.dumps(response).encode()
+                self.send_response(200)
+                self.send_header('Content-Type', 'application/json')
+                self.send_header('Content-Length', str(len(data)))
+                self.end_headers()
+                self.wfile.write(data)
+
+            def log_message(self, format, *args):
+                pass
+
+        return Handler
+
+    def dispatch(self, request):
+        with self._lock:
+            self.calls += 1
+        response = {'jsonrpc': '2.0', 'id': request.get('id')}
+        method = self.methods.get(request['method'])
+        if method is None:
+            response['error'] = {'code': -32601, 'message': 'Method not found'}
+            return response
+        try:
+            response['result'] = method(*request.get('params', []))
+        except Exception as e:
+            response['error'] = {'code': -32000, 'message': str(e)}
+        return response
+
+    def __enter__(self):
+        self._thread.start()
+        return self
+
+    def __exit__(self, *args):
+        self.server.shutdown()
+        self.server.server_close()
@@ -1,4 +1,6 @@
 echo '[*] WebAssembly Disassembler [*]'
 python3 -m unittest WASM/test_disassembler.py
 echo '[*] WebAssembly ControlFlowGraph & CallGraph analysis [*]'
-python3 -m unittest WASM/test_cfg.py
\ No newline at end of file
+python3 -m unittest WASM/test_cfg.py
+echo '[*] WebAssembly Module analyzer [*]'
+python3 -m unittest WASM/test_analyzer.py
\ No newline at end of file
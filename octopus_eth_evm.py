@@ -16,6 +16,48 @@ def error_print(msg):
     sys.exit()
 
 
+def analyze(args, octo_bytecode):
+    """Run the analysis requested by args on octo_bytecode"""
+    octo_disasm = None
+    octo_cfg = None
+
+    # Disassembly
+    if args.disassemble:
+        from octopus.platforms.ETH.disassembler import EthereumDisassembler
+
+        # TODO add other r_format support
+        octo_disasm = EthereumDisassembler()
+        print(octo_disasm.disassemble(octo_bytecode, r_format='text'))
+
+    # Control Flow Analysis
+    if args.cfg or args.ssa:
+        from octopus.platforms.ETH.cfg import EthereumCFG
+        from octopus.analysis.graph import CFGGraph
+
+        evm_analysis = 'static' if args.onlystatic and not args.ssa else 'dynamic'
+        if args.cache:
+            from octopus.analysis.cache import CFGCache
+
+            octo_cache = CFGCache() if args.cache is True else CFGCache(args.cache)
+            octo_cfg = octo_cache.cfg(EthereumCFG, octo_bytecode,
+                                      evm_analysis=evm_analysis)
+        else:
+            octo_cfg = EthereumCFG(octo_bytecode, evm_analysis=evm_analysis)
+
+        octo_graph = CFGGraph(octo_cfg)
+
+        if args.functions or args.onlyfunction:
+            octo_graph.view_functions(only_func_name=args.onlyfunction,
+                                      simplify=args.simplify,
+                                      ssa=args.ssa)
+        else:
+            octo_graph.view(simplify=args.simplify, ssa=args.ssa)
+
+    # Call Flow Analysis
+    if args.call:
+        error_print('Call Flow Analysis not yet supported')
+
+
 def main() -> None:
     parser = argparse.ArgumentParser(
         description='Security Analysis tool for WebAssembly module and Blockchain Smart Contracts (BTC/ETH/NEO/EOS)')
@@ -25,8 +67,8 @@ def main() -> None:
                         help='hex-encoded bytecode string ("ABcdeF09..." or "0xABcdeF09...")',
                         metavar='BYTECODE')
     inputs.add_argument('-f', '--file',
-                        type=argparse.FileType('r'),
-                        help='file containing hex-encoded bytecode string',
+                        type=argparse.FileType('rb'),
+                        help='file containing hex-encoded or binary bytecode',
                         metavar='BYTECODEFILE')
     inputs.add_argument('-a', '--address',
                         help='pull contract from the blockchain',
@@ -60,6 +102,9 @@ def main() -> None:
                        nargs="*",
                        default=[],
                        help='only generate the CFG for this list of function name')
+    graph.add_argument('--cache', nargs='?', const=True,
+                       default=None, metavar='DIR',
+                       help='cache the CFG on disk, in DIR (default ~/.cache/octopus)')
     #graph.add_argument('--visualize',
     #                   help='direcly open the CFG file')
     #graph.add_argument('--format',
@@ -94,8 +139,6 @@ def main() -> None:
 
     octo_bytecode = None
     octo_explorer = None
-    octo_disasm = None
-    octo_cfg = None
 
     # Explorer
     if args.explore or args.address:
@@ -141,40 +184,21 @@ def main() -> None:
     if args.raw:
         octo_bytecode = args.raw
     elif args.file:
-        octo_bytecode = ''.join([l.strip() for l in args.file if len(l.strip()) > 0])
+        from octopus.core.utils import load_bytecode
+
+        octo_bytecode = load_bytecode(args.file)
     elif args.address:
         octo_bytecode = octo_explorer.eth_getCode(args.address)
 
-    # Disassembly
-    if args.disassemble:
-        from octopus.platforms.ETH.disassembler import EthereumDisassembler
-
-        # TODO add other r_format support
-        octo_disasm = EthereumDisassembler()
-        print(octo_disasm.disassemble(octo_bytecode, r_format='text'))
+    try:
+        analyze(args, octo_bytecode)
+    finally:
+        # the memory-mapped file is released once the analysis is done
+        if args.file:
+            from octopus.core.utils import close_bytecode
 
-    # Control Flow Analysis
-    if args.cfg or args.ssa:
-        from octopus.platforms.ETH.cfg import EthereumCFG
-        from octopus.analysis.graph import CFGGraph
-
-        if args.onlystatic and not args.ssa:
-            octo_cfg = EthereumCFG(octo_bytecode, evm_analysis='static')
-        else:
-            octo_cfg = EthereumCFG(octo_bytecode)
-
-        octo_graph = CFGGraph(octo_cfg)
-
-        if args.functions or args.onlyfunction:
-            octo_graph.view_functions(only_func_name=args.onlyfunction,
-                                      simplify=args.simplify,
-                                      ssa=args.ssa)
-        else:
-            octo_graph.view(simplify=args.simplify, ssa=args.ssa)
-
-    # Call Flow Analysis
-    if args.call:
-        error_print('Call Flow Analysis not yet supported')
+            close_bytecode(octo_bytecode)
+            args.file.close()
 
     if not args.disassemble and not args.ssa \
             and not args.cfg and not args.call\
@@ -16,6 +16,75 @@ def error_print(msg):
     sys.exit()
 
 
+def analyze(args, octo_bytecode):
+    """Run the analysis requested by args on octo_bytecode"""
+    octo_analyzer = None
+    octo_disasm = None
+    octo_cfg = None
+
+    # Disassembly
+    if args.disassemble:
+        from octopus.arch.wasm.disassembler import WasmDisassembler
+
+        # TODO add other r_format support
+        octo_disasm = WasmDisassembler()
+        # functions are printed one at a time, like disassemble_module text format
+        for index, (_, func) in enumerate(octo_disasm.iter_functions(octo_bytecode)):
+            print('func %d' % index)
+            print('\n'.join(map(str, func.instructions)) + '\n')
+
+    if args.analyzer:
+        from octopus.arch.wasm.analyzer import WasmModuleAnalyzer
+
+        octo_analyzer = WasmModuleAnalyzer(octo_bytecode)
+        print(octo_analyzer)
+
+    # Control Flow Analysis & Call flow Analysis
+    if args.cfg or args.call or args.analytic:
+        from octopus.arch.wasm.cfg import WasmCFG
+        from octopus.analysis.graph import CFGGraph
+
+        if args.cache:
+            from octopus.analysis.cache import CFGCache
+
+            octo_cache = CFGCache() if args.cache is True else CFGCache(args.cache)
+            octo_cfg = octo_cache.cfg(WasmCFG, octo_bytecode, analyzer=octo_analyzer,
+                                      workers=args.jobs)
+        else:
+            octo_cfg = WasmCFG(octo_bytecode, analyzer=octo_analyzer,
+                               workers=args.jobs)
+        # share the decoded module
+        octo_analyzer = octo_cfg.analyzer
+
+        if args.call:
+            octo_cfg.visualize_call_flow()
+        if args.analytic:
+            octo_cfg.visualize_instrs_per_funcs()
+
+        if args.cfg:
+            octo_graph = CFGGraph(octo_cfg)
+            if args.functions or args.onlyfunc:
+                octo_graph.view_functions(only_func_name=args.onlyfunc,
+                                          simplify=args.simplify,
+                                          ssa=args.ssa)
+            else:
+                octo_graph.view(simplify=args.simplify, ssa=args.ssa)
+
+    if args.ssa:
+        from octopus.arch.wasm.emulator import WasmSSAEmulatorEngine
+
+        emul = WasmSSAEmulatorEngine(octo_bytecode, analyzer=octo_analyzer)
+        # run the emulator for SSA
+        if args.onlyfunc:
+            emul.emulate_functions(args.onlyfunc)
+        # try to emulate main by default
+        else:
+            emul.emulate_functions()
+
+        # visualization of the cfg with SSA
+        emul.cfg.visualize(ssa=True)
+
+
 def main() -> None:
     parser = argparse.ArgumentParser(
         description='Security Analysis tool for WebAssembly module and Blockchain Smart Contracts (BTC/ETH/NEO/EOS)')
@@ -26,7 +95,7 @@ def main() -> None:
                         metavar='BYTECODE')
     inputs.add_argument('-f', '--file',
                         type=argparse.FileType('rb'),
-                        help='binary file (.wasm)',
+                        help='binary file (.wasm) or file containing hex-encoded module',
                         metavar='WASMMODULE')
 
     features = parser.add_argument_group('Features')
@@ -58,6 +127,12 @@ def main() -> None:
                        nargs="*",
                        default=[],
                        help='only generate the CFG for this list of function name')
+    graph.add_argument('-j', '--jobs', type=int,
+                       default=None, metavar='N',
+                       help='build the functions CFG with N processes (0 = number of cpus)')
+    graph.add_argument('--cache', nargs='?', const=True,
+                       default=None, metavar='DIR',
+                       help='cache the CFG on disk, in DIR (default ~/.cache/octopus)')
     #graph.add_argument('--visualize',
     #                   help='direcly open the CFG file')
     #graph.add_argument('--format',
@@ -68,64 +143,24 @@ def main() -> None:
     args = parser.parse_args()
 
     octo_bytecode = None
-    octo_analyzer = None
-    octo_disasm = None
-    octo_cfg = None
 
     # process input code
     if args.raw:
         octo_bytecode = args.raw
     elif args.file:
-        octo_bytecode = args.file.read()
+        from octopus.core.utils import load_bytecode
 
-    # Disassembly
-    if args.disassemble:
-        from octopus.arch.wasm.disassembler import WasmDisassembler
+        octo_bytecode = load_bytecode(args.file)
 
-        # TODO add other r_format support
-        octo_disasm = WasmDisassembler()
-        print(octo_disasm.disassemble_module(octo_bytecode, r_format='text'))
+    try:
+        analyze(args, octo_bytecode)
+    finally:
+        # the memory-mapped file is released once the analysis is done
+        if args.file:
+            from octopus.core.utils import close_bytecode
 
-    if args.analyzer:
-        from octopus.arch.wasm.analyzer import WasmModuleAnalyzer
-
-        octo_analyzer = WasmModuleAnalyzer(octo_bytecode)
-        print(octo_analyzer)
-
-    # Control Flow Analysis & Call flow Analysis
-    if args.cfg or args.call or args.analytic:
-        from octopus.arch.wasm.cfg import WasmCFG
-        from octopus.analysis.graph import CFGGraph
-
-        octo_cfg = WasmCFG(octo_bytecode)
-
-        if args.call:
-            octo_cfg.visualize_call_flow()
-        if args.analytic:
-            octo_cfg.visualize_instrs_per_funcs()
-
-        if args.cfg:
-            octo_graph = CFGGraph(octo_cfg)
-            if args.functions or args.onlyfunc:
-                octo_graph.view_functions(only_func_name=args.onlyfunc,
-                                          simplify=args.simplify,
-                                          ssa=args.ssa)
-            else:
-                octo_graph.view(simplify=args.simplify, ssa=args.ssa)
-
-    if args.ssa:
-        from octopus.arch.wasm.emulator import WasmSSAEmulatorEngine
-
-        emul = WasmSSAEmulatorEngine(octo_bytecode)
-        # run the emulator for SSA
-        if args.onlyfunc:
-            emul.emulate_functions(args.onlyfunc)
-        # try to emulate main by default
-        else:
-            emul.emulate_functions()
-
-        # visualization of the cfg with SSA
-        emul.cfg.visualize(ssa=True)
+            close_bytecode(octo_bytecode)
+            args.file.close()
 
     if not args.disassemble and not args.ssa \
             and not args.cfg and not args.call\
@@ -12,6 +12,18 @@ echo '[*] ETH Disassembler [*]'
 python3 -m unittest octopus/tests/ETH/test_disassembler.py
 echo '[*] ETH ControlFlowGraph analysis [*]'
 python3 -m unittest octopus/tests/ETH/test_cfg.py
+echo '[*] ETH VM state [*]'
+python3 -m unittest octopus/tests/ETH/test_vmstate.py
+echo '[*] ETH Emulator [*]'
+python3 -m unittest octopus/tests/ETH/test_emulator.py
+echo '[*] ETH Signatures database [*]'
+python3 -m unittest octopus/tests/ETH/test_signatures.py
+echo '[*] ETH SSA [*]'
+python3 -m unittest octopus/tests/ETH/test_ssa.py
+echo '[*] ETH Corpus [*]'
+python3 -m unittest octopus/tests/ETH/test_corpus.py
+echo '[*] ETH Metadata [*]'
+python3 -m unittest octopus/tests/ETH/test_metadata.py
 
 echo '[*] EOS Disassembler [*]'
 python3 -m unittest octopus/tests/EOS/test_disassembler.py
@@ -21,4 +33,6 @@ python3 -m unittest octopus/tests/EOS/test_callgraph.py
 echo '[*] WebAssembly Disassembler [*]'
 python3 -m unittest octopus/tests/WASM/test_disassembler.py
 echo '[*] WebAssembly ControlFlowGraph & CallGraph analysis [*]'
-python3 -m unittest octopus/tests/WASM/test_cfg.py
\ No newline at end of file
+python3 -m unittest octopus/tests/WASM/test_cfg.py
+echo '[*] WebAssembly Module analyzer [*]'
+python3 -m unittest octopus/tests/WASM/test_analyzer.py
\ No newline at end of file
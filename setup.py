@@ -22,8 +22,6 @@ setup(
 
         'License :: OSI Approved :: MIT License',
 
-        'Programming Language :: Python :: 3.5',
-        'Programming Language :: Python :: 3.6',
         'Programming Language :: Python :: 3.7',
     ),
 
@@ -34,7 +32,7 @@ setup(
         'wasm>=1.1'
     ],
 
-    python_requires='>=3.5',
+    python_requires='>=3.7',
 
     package_data={
         'octopus.arch.evm': ['*.json'],